@@ -176,6 +176,14 @@ private[spark] abstract class BasePythonRunner[IN, OUT](
   protected val killOnIdleTimeout: Boolean = conf.get(PYTHON_WORKER_KILL_ON_IDLE_TIMEOUT)
   protected val tracebackDumpIntervalSeconds: Long =
     conf.get(PYTHON_WORKER_TRACEBACK_DUMP_INTERVAL_SECONDS)
+  private val phaseTimesEnabled: Boolean = conf.get(PYTHON_WORKER_PHASE_TIMES_ENABLED)
+  private val broadcastCacheSize: Long = conf.get(PYTHON_WORKER_BROADCAST_CACHE_SIZE)
+  private val commandCacheSize: Long = conf.get(PYTHON_WORKER_COMMAND_CACHE_SIZE)
+  private val modelCacheMaxEntries: Int = conf.get(PYTHON_WORKER_MODEL_CACHE_MAX_ENTRIES)
+  private val modelCacheMaxSize: Long = conf.get(PYTHON_WORKER_MODEL_CACHE_MAX_SIZE)
+  private val modelCacheTtlSeconds: Long = conf.get(PYTHON_WORKER_MODEL_CACHE_TTL)
+  private val daemonPreload: Seq[String] = conf.get(PYTHON_DAEMON_PRELOAD)
+  private val daemonPoolSize: Int = conf.get(PYTHON_DAEMON_POOL_SIZE)
   protected val hideTraceback: Boolean = false
   protected val simplifiedTraceback: Boolean = false
 
@@ -276,6 +284,26 @@ private[spark] abstract class BasePythonRunner[IN, OUT](
     if (tracebackDumpIntervalSeconds > 0L) {
       envVars.put("PYTHON_TRACEBACK_DUMP_INTERVAL_SECONDS", tracebackDumpIntervalSeconds.toString)
     }
+    if (phaseTimesEnabled) {
+      envVars.put("PYSPARK_WORKER_PHASE_TIMES_ENABLED", "true")
+    }
+    if (reuseWorker && broadcastCacheSize > 0L) {
+      envVars.put("PYSPARK_BROADCAST_CACHE_MAX_BYTES", broadcastCacheSize.toString)
+    }
+    if (reuseWorker && commandCacheSize > 0L) {
+      envVars.put("PYSPARK_COMMAND_CACHE_MAX_BYTES", commandCacheSize.toString)
+    }
+    if (reuseWorker) {
+      envVars.put("PYSPARK_MODEL_CACHE_MAX_ENTRIES", modelCacheMaxEntries.toString)
+      envVars.put("PYSPARK_MODEL_CACHE_MAX_BYTES", modelCacheMaxSize.toString)
+      envVars.put("PYSPARK_MODEL_CACHE_TTL_SECONDS", modelCacheTtlSeconds.toString)
+    }
+    if (daemonPreload.nonEmpty) {
+      envVars.put("PYSPARK_DAEMON_PRELOAD", daemonPreload.mkString(","))
+    }
+    if (daemonPoolSize > 0) {
+      envVars.put("PYSPARK_DAEMON_POOL_SIZE", daemonPoolSize.toString)
+    }
     // allow the user to set the batch size for the BatchedSerializer on UDFs
     envVars.put("PYTHON_UDF_BATCH_SIZE", batchSizeForPythonUDF.toString)
 
@@ -608,6 +636,11 @@ private[spark] abstract class BasePythonRunner[IN, OUT](
       metrics.get("pythonBootTime").foreach(_.add(boot))
       metrics.get("pythonInitTime").foreach(_.add(init))
       metrics.get("pythonTotalTime").foreach(_.add(total))
+      // See `PhaseTimes` in worker.py
+      PythonRunner.pythonPhaseTimeMetrics.foreach { name =>
+        val time = stream.readLong()
+        metrics.get(name).foreach(_.add(time))
+      }
       val memoryBytesSpilled = stream.readLong()
       val diskBytesSpilled = stream.readLong()
       context.taskMetrics().incMemoryBytesSpilled(memoryBytesSpilled)
@@ -932,6 +965,16 @@ private[spark] object PythonRunner {
 
   private val printPythonInfo: AtomicBoolean = new AtomicBoolean(true)
 
+  // Metrics for the nanoseconds a worker spends in each phase of a task, in the order the
+  // worker reports them after its boot, init and finish times
+  val pythonPhaseTimeMetrics: Seq[String] = Seq(
+    "pythonSetupTime",
+    "pythonFunctionDeserializationTime",
+    "pythonInputDeserializationTime",
+    "pythonUserCodeTime",
+    "pythonOutputSerializationTime",
+    "pythonOutputWriteTime")
+
   def apply(func: PythonFunction, jobArtifactUUID: Option[String]): PythonRunner = {
     if (printPythonInfo.compareAndSet(true, false)) {
       PythonUtils.logPythonInfo(func.pythonExec)
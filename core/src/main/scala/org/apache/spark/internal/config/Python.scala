@@ -127,4 +127,104 @@ private[spark] object Python {
       .timeConf(TimeUnit.SECONDS)
       .checkValue(_ >= 0, "The interval should be 0 or positive.")
       .createWithDefault(0)
+
+  val PYTHON_WORKER_PHASE_TIMES_ENABLED =
+    ConfigBuilder("spark.python.worker.phaseTimes.enabled")
+      .doc("When true, Python workers measure the time spent deserializing the input, running " +
+        "the user code, serializing the output and writing it, and report them as SQL metrics " +
+        "of the operators. Only the functions that run on batches of rows, such as Pandas and " +
+        "Arrow UDFs, Pandas Functions API and Python Data Source, are measured, by timing each " +
+        "batch. The time to set up files and broadcasts and to deserialize the functions is " +
+        "measured for all Python functions. None of these metrics are shown when this is false.")
+      .version("4.1.0")
+      .booleanConf
+      .createWithDefault(false)
+
+  val PYTHON_BROADCAST_ZERO_COPY =
+    ConfigBuilder("spark.python.broadcast.zeroCopy")
+      .doc("When true, the NumPy arrays, Arrow data and other out-of-band buffers of Python " +
+        "broadcast variables are written as raw buffers that Python workers map read-only from " +
+        "the broadcast file of the executor, instead of each worker deserializing its own copy. " +
+        "The arrays are then read-only in the workers.")
+      .version("4.1.0")
+      .booleanConf
+      .createWithDefault(false)
+
+  val PYTHON_WORKER_BROADCAST_CACHE_SIZE =
+    ConfigBuilder("spark.python.worker.broadcastCacheSize")
+      .doc("The maximum total size of the broadcast variables that a reused Python worker " +
+        "keeps loaded after the tasks using them are done, so that later tasks using them " +
+        "again do not load them again. The least recently used ones are dropped first, and " +
+        "the size of a broadcast is the size of its serialized value. The default is `0` " +
+        "that means the values are dropped once no task uses them.")
+      .version("4.1.0")
+      .bytesConf(ByteUnit.BYTE)
+      .checkValue(_ >= 0, "The size should be 0 or positive.")
+      .createWithDefault(0)
+
+  val PYTHON_WORKER_COMMAND_CACHE_SIZE =
+    ConfigBuilder("spark.python.worker.commandCacheSize")
+      .doc("The maximum total size of the functions that a reused Python worker keeps " +
+        "unpickled, so that later tasks sending the same function do not unpickle it again. " +
+        "The least recently used ones are dropped first, and the size of a function is the " +
+        "size of its pickled bytes. Objects captured by a cached function, and the changes " +
+        "that tasks make to them, are shared by the later tasks of the worker. Functions that " +
+        "use accumulators, and the functions that a task reads after them, are never cached. " +
+        "The default is `0` that means the functions are unpickled for every task.")
+      .version("4.1.0")
+      .bytesConf(ByteUnit.BYTE)
+      .checkValue(_ >= 0, "The size should be 0 or positive.")
+      .createWithDefault(0)
+
+  val PYTHON_WORKER_MODEL_CACHE_MAX_ENTRIES =
+    ConfigBuilder("spark.python.worker.modelCache.maxEntries")
+      .doc("The maximum number of models that a reused Python worker keeps loaded for " +
+        "`pyspark.ml.functions.predict_batch_udf`. The least recently used ones are dropped first.")
+      .version("4.1.0")
+      .intConf
+      .checkValue(_ > 0, "The number of models should be positive.")
+      .createWithDefault(3)
+
+  val PYTHON_WORKER_MODEL_CACHE_MAX_SIZE =
+    ConfigBuilder("spark.python.worker.modelCache.maxSize")
+      .doc("The maximum total estimated memory of the models that a reused Python worker keeps " +
+        "loaded for `pyspark.ml.functions.predict_batch_udf`. The least recently used ones are " +
+        "dropped first, and larger models are not kept. The estimate counts the NumPy arrays, " +
+        "tensors and Python objects that the prediction function refers to. The default is `0` " +
+        "that means the models are only bounded by their number.")
+      .version("4.1.0")
+      .bytesConf(ByteUnit.BYTE)
+      .checkValue(_ >= 0, "The size should be 0 or positive.")
+      .createWithDefault(0)
+
+  val PYTHON_WORKER_MODEL_CACHE_TTL =
+    ConfigBuilder("spark.python.worker.modelCache.ttl")
+      .doc("The time after which a reused Python worker drops a model loaded for " +
+        "`pyspark.ml.functions.predict_batch_udf` that it has not used. The default is `0` " +
+        "that means the models are kept until they are evicted for newer ones.")
+      .version("4.1.0")
+      .timeConf(TimeUnit.SECONDS)
+      .checkValue(_ >= 0, "The time should be 0 or positive.")
+      .createWithDefault(0)
+
+  val PYTHON_DAEMON_PRELOAD = ConfigBuilder("spark.python.daemon.preload")
+    .doc("Comma-separated list of Python modules that the Python daemon imports before " +
+      "forking the workers, so that the workers share them instead of importing them in " +
+      "their first tasks. An entry `module:function` also calls the function of the module " +
+      "without arguments, to warm up the libraries. It only applies when " +
+      s"${PYTHON_USE_DAEMON.key} is enabled, and the modules should be safe to use after fork.")
+    .version("4.1.0")
+    .stringConf
+    .toSequence
+    .createWithDefault(Nil)
+
+  val PYTHON_DAEMON_POOL_SIZE = ConfigBuilder("spark.python.daemon.poolSize")
+    .doc("The number of idle Python workers that the Python daemon forks ahead of time, so " +
+      "that new workers do not wait for the daemon to fork them. It only applies when " +
+      s"${PYTHON_USE_DAEMON.key} is enabled. The default is `0` that means the workers are " +
+      "forked on demand.")
+    .version("4.1.0")
+    .intConf
+    .checkValue(_ >= 0, "The pool size should be 0 or positive.")
+    .createWithDefault(0)
 }
@@ -452,6 +452,7 @@ pyspark_core = Module(
         "pyspark.core.broadcast",
         "pyspark.accumulators",
         "pyspark.core.files",
+        "pyspark.join",
         "pyspark.serializers",
         "pyspark.profiler",
         "pyspark.shuffle",
@@ -0,0 +1,114 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import multiprocessing
+import tempfile
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+from pyspark.core.broadcast import Broadcast
+
+
+def memory_usage() -> Dict[str, int]:
+    """
+    RSS, PSS and private memory of the current process in KiB, from /proc (Linux only).
+    PSS splits the pages shared by several processes evenly among them.
+    """
+    usage = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            fields = line.split()
+            if fields[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                usage[fields[0][:-1]] = int(fields[1])
+    return {
+        "rss": usage["Rss"],
+        "pss": usage["Pss"],
+        "private": usage["Private_Clean"] + usage["Private_Dirty"],
+    }
+
+
+def worker(path: str, barrier: Any, queue: Any) -> None:
+    start_time_ns = time.perf_counter_ns()
+    value = Broadcast(path=path).value
+    # Touch all the pages of the value.
+    total = float(value.sum())
+    elapsed = (time.perf_counter_ns() - start_time_ns) / 1000 / 1000
+    # Measure once all the workers hold the value, so that shared pages are accounted for.
+    barrier.wait()
+    queue.put((elapsed, total, memory_usage()))
+    barrier.wait()
+
+
+def measure(size_mb: int, num_workers: int, zero_copy: bool) -> None:
+    ctx = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory(prefix="benchmark_broadcast") as d:
+        path = os.path.join(d, "broadcast")
+        value = np.random.rand(size_mb * 1024 * 1024 // 8)
+        with open(path, "wb") as f:
+            Broadcast(path=path).dump(value, f, zero_copy=zero_copy)
+        # Do not let the workers inherit the value.
+        del value
+
+        barrier = ctx.Barrier(num_workers)
+        queue = ctx.Queue()
+        workers = [
+            ctx.Process(target=worker, args=(path, barrier, queue)) for _ in range(num_workers)
+        ]
+        for p in workers:
+            p.start()
+        results = [queue.get() for _ in range(num_workers)]
+        for p in workers:
+            p.join()
+
+    load_ms = sum(r[0] for r in results) / num_workers
+    rss = sum(r[2]["rss"] for r in results) / num_workers / 1024
+    pss = sum(r[2]["pss"] for r in results) / num_workers / 1024
+    private = sum(r[2]["private"] for r in results) / num_workers / 1024
+    print(
+        "zero copy {}:\tload {:.1f} ms\tRSS {:.1f} MiB\tPSS {:.1f} MiB\tprivate {:.1f} MiB".format(
+            zero_copy, load_ms, rss, pss, private
+        )
+    )
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/core/benchmark/benchmark_broadcast.py <size in MiB> <number of workers>`
+
+    The benchmark writes a NumPy array broadcast once, loads it in several worker processes
+    as executors do, and reports the average load time and memory per worker. The memory
+    is read from /proc, so this only runs on Linux.
+    """
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    num_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    print(" ==================== Broadcast per worker ======================")
+    print("value size: %d MiB, workers: %d" % (size_mb, num_workers))
+    for zero_copy in [False, True]:
+        measure(size_mb, num_workers, zero_copy)
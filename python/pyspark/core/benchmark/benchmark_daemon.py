@@ -0,0 +1,110 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import importlib
+import socket
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import IO, Dict, List
+
+from pyspark.serializers import UTF8Deserializer, read_int, write_int, write_with_length
+
+
+def main(infile: IO[bytes], outfile: IO[bytes]) -> None:
+    """
+    The worker run by the daemon for each connection, in place of pyspark.worker. Like a first
+    task, it imports the modules and reports when it is done.
+    """
+    for name in UTF8Deserializer().loads(infile).split(","):
+        importlib.import_module(name)
+    write_int(0, outfile)
+    outfile.flush()
+
+
+def measure(modules: str, env: Dict[str, str], num_tasks: int) -> None:
+    # Unix domain sockets do not delay the small writes of the workers like TCP.
+    sock_dir = tempfile.mkdtemp(prefix="benchmark_daemon")
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "pyspark.daemon", "pyspark.core.benchmark.benchmark_daemon"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=dict(
+            os.environ,
+            PYTHON_UNIX_DOMAIN_ENABLED="true",
+            PYTHON_WORKER_FACTORY_SOCK_DIR=sock_dir,
+            **env,
+        ),
+    )
+    assert daemon.stdin is not None and daemon.stdout is not None
+    sock_path = daemon.stdout.read(read_int(daemon.stdout)).decode("utf-8")
+    latencies: List[float] = []
+    try:
+        for _ in range(num_tasks):
+            # Let the daemon replace the pre-forked worker taken by the last task.
+            time.sleep(0.5)
+            start_time_ns = time.perf_counter_ns()
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(sock_path)
+                infile = sock.makefile("rb")
+                outfile = sock.makefile("wb")
+                write_with_length(modules.encode("utf-8"), outfile)
+                outfile.flush()
+                read_int(infile)  # pid
+                read_int(infile)
+                latencies.append((time.perf_counter_ns() - start_time_ns) / 1000 / 1000)
+    finally:
+        daemon.stdin.close()
+        daemon.wait()
+        os.rmdir(sock_dir)
+    print(
+        "{}:\tfirst task {:.1f} ms\tmedian {:.1f} ms".format(
+            env or "default", latencies[0], statistics.median(latencies)
+        )
+    )
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/core/benchmark/benchmark_daemon.py <modules> <number of tasks>`
+
+    The benchmark starts the Python daemon as executors do, and reports the time from
+    connecting to the daemon until a new worker has imported the comma-separated modules, as
+    the first task using them would, with and without preloading them and pre-forking
+    workers.
+    """
+    modules = sys.argv[1] if len(sys.argv) > 1 else "pandas,pyarrow"
+    num_tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    print(" ==================== Python worker latency ======================")
+    print("modules: %s, tasks: %d" % (modules, num_tasks))
+    for env in [
+        {},
+        {"PYSPARK_DAEMON_PRELOAD": modules},
+        {"PYSPARK_DAEMON_PRELOAD": modules, "PYSPARK_DAEMON_POOL_SIZE": "2"},
+    ]:
+        measure(modules, env, num_tasks)
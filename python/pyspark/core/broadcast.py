@@ -16,11 +16,13 @@
 #
 
 import gc
+import mmap
 import os
 import sys
 from tempfile import NamedTemporaryFile
 import threading
 import pickle
+from collections import OrderedDict
 from typing import (
     overload,
     Any,
@@ -30,6 +32,7 @@ from typing import (
     Generic,
     IO,
     Iterator,
+    List,
     Optional,
     Tuple,
     TypeVar,
@@ -54,6 +57,92 @@ T = TypeVar("T")
 _broadcastRegistry: Dict[int, "Broadcast[Any]"] = {}
 
 
+class _BroadcastValueCache:
+    """
+    Size-bounded LRU cache of the loaded values of the broadcasts removed from the registry
+    of a reused worker, so that a later task using them again does not load them again.
+    Values are keyed by broadcast id and path, and sized by the size of their file.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[Any, int]]" = OrderedDict()
+
+    def put(self, bid: int, bcast: "Broadcast[Any]") -> None:
+        path = getattr(bcast, "_path", None)
+        if self._max_bytes <= 0 or path is None or not hasattr(bcast, "_value"):
+            return
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        if size > self._max_bytes:
+            return
+        key = (bid, path)
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[1]
+        self._entries[key] = (bcast._value, size)
+        self._size += size
+        while self._size > self._max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+    def restore(self, bid: int, bcast: "Broadcast[Any]") -> None:
+        entry = self._entries.pop((bid, bcast._path), None)
+        if entry is not None:
+            bcast._value = entry[0]
+            self._size -= entry[1]
+
+
+_broadcastValueCache = _BroadcastValueCache(
+    int(os.environ.get("PYSPARK_BROADCAST_CACHE_MAX_BYTES", "0"))
+)
+
+
+# Alignment of the out-of-band buffers in zero-copy broadcast files, so that the arrays
+# mapped on them are aligned.
+_ZERO_COPY_ALIGNMENT = 64
+
+
+class _ZeroCopyHeader:
+    """
+    First record of a broadcast written in zero-copy mode, padded to a multiple of
+    `_ZERO_COPY_ALIGNMENT` bytes. It is followed by the pickled value and its out-of-band
+    buffers, each of them aligned to `_ZERO_COPY_ALIGNMENT` bytes.
+    """
+
+    __slots__ = ("pickle_size", "buffer_sizes", "padding")
+
+    def __init__(self, pickle_size: int, buffer_sizes: List[int], padding: bytes = b""):
+        self.pickle_size = pickle_size
+        self.buffer_sizes = buffer_sizes
+        self.padding = padding
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, List[int], bytes]]:
+        return _ZeroCopyHeader, (self.pickle_size, self.buffer_sizes, self.padding)
+
+    def dumps(self) -> bytes:
+        data = pickle.dumps(self, pickle_protocol)
+        while len(data) % _ZERO_COPY_ALIGNMENT != 0:
+            self.padding += b"\0" * (-len(data) % _ZERO_COPY_ALIGNMENT)
+            data = pickle.dumps(self, pickle_protocol)
+        return data
+
+    def layout(self) -> List[Tuple[int, int]]:
+        """
+        Return the (start, end) positions of the pickled value and of the buffers, relative
+        to the end of the header.
+        """
+        ranges = [(0, self.pickle_size)]
+        offset = self.pickle_size
+        for size in self.buffer_sizes:
+            offset += -offset % _ZERO_COPY_ALIGNMENT
+            ranges.append((offset, offset + size))
+            offset += size
+        return ranges
+
+
 def _from_id(bid: int) -> "Broadcast[Any]":
     from pyspark.core.broadcast import _broadcastRegistry
 
@@ -83,6 +172,15 @@ class Broadcast(Generic[T]):
     >>> b.unpersist()
 
     >>> large_broadcast = spark.sparkContext.broadcast(range(10000))
+
+    Notes
+    -----
+    When `spark.python.broadcast.zeroCopy` is enabled, the NumPy arrays, Arrow data and other
+    values that support out-of-band buffers of pickle protocol 5 are written as raw buffers.
+    Python workers map them read-only from the file that the executor keeps for the broadcast,
+    so the workers of an executor share them instead of each holding its own copy. The
+    arrays in the value are then read-only on the executors. Bytes are pickled in-band as
+    usual, so they are not shared.
     """
 
     @overload  # On driver
@@ -131,7 +229,8 @@ class Broadcast(Generic[T]):
             else:
                 # no encryption, we can just write pickled data directly to the file from python
                 broadcast_out = f
-            self.dump(value, broadcast_out)  # type: ignore[arg-type]
+            zero_copy = sc._conf.get("spark.python.broadcast.zeroCopy", "false").lower() == "true"
+            self.dump(value, broadcast_out, zero_copy=zero_copy)  # type: ignore[arg-type]
             if sc._encryption_enabled:
                 self._python_broadcast.waitTillDataReceived()
             self._jbroadcast = sc._jsc.broadcast(self._python_broadcast)
@@ -151,7 +250,7 @@ class Broadcast(Generic[T]):
                 assert path is not None
                 self._path = path
 
-    def dump(self, value: T, f: BinaryIO) -> None:
+    def dump(self, value: T, f: BinaryIO, zero_copy: bool = False) -> None:
         """
         Write a pickled representation of value to the open file or socket.
         The protocol pickle is HIGHEST_PROTOCOL.
@@ -164,6 +263,12 @@ class Broadcast(Generic[T]):
         f : :class:`BinaryIO`
             File or socket where the pickled value will be stored.
 
+        zero_copy : bool, optional, default False
+            Whether to write the out-of-band buffers of the value, such as the data of NumPy
+            arrays, as raw buffers that :meth:`load_from_path` maps instead of copying.
+
+            .. versionadded:: 4.1.0
+
         Examples
         --------
         >>> import os
@@ -179,7 +284,10 @@ class Broadcast(Generic[T]):
         ...         b.dump(b.value, f)
         """
         try:
-            pickle.dump(value, f, pickle_protocol)
+            if zero_copy and pickle_protocol >= 5:
+                self._dump_zero_copy(value, f)
+            else:
+                pickle.dump(value, f, pickle_protocol)
         except pickle.PickleError:
             raise
         except Exception as e:
@@ -188,6 +296,23 @@ class Broadcast(Generic[T]):
             raise pickle.PicklingError(msg)
         f.close()
 
+    def _dump_zero_copy(self, value: T, f: BinaryIO) -> None:
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(value, pickle_protocol, buffer_callback=buffers.append)
+        if len(buffers) == 0:
+            # Nothing to share, write the usual format.
+            f.write(data)
+            return
+
+        raws = [buffer.raw() for buffer in buffers]
+        header = _ZeroCopyHeader(len(data), [raw.nbytes for raw in raws])
+        f.write(header.dumps())
+        position = 0
+        for (start, end), chunk in zip(header.layout(), [data] + raws):
+            f.write(b"\0" * (start - position))
+            f.write(chunk)
+            position = end
+
     def load_from_path(self, path: str) -> T:
         """
         Read the pickled representation of an object from the open file and
@@ -222,7 +347,18 @@ class Broadcast(Generic[T]):
         [1, 2, 3, 4, 5]
         """
         with open(path, "rb", 1 << 20) as f:
-            return self.load(f)
+            gc.disable()
+            try:
+                value = pickle.load(f)
+                if not isinstance(value, _ZeroCopyHeader):
+                    return value
+                # The memory map stays alive as long as the buffers mapped on it.
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                view = view[f.tell() :]
+                chunks = [view[start:end] for start, end in value.layout()]
+                return pickle.loads(chunks[0], buffers=chunks[1:])
+            finally:
+                gc.enable()
 
     def load(self, file: BinaryIO) -> T:
         """
@@ -259,7 +395,17 @@ class Broadcast(Generic[T]):
         """
         gc.disable()
         try:
-            return pickle.load(file)
+            value = pickle.load(file)
+            if not isinstance(value, _ZeroCopyHeader):
+                return value
+            # The stream cannot be mapped, read the buffers written in zero-copy mode.
+            chunks = []
+            position = 0
+            for start, end in value.layout():
+                file.read(start - position)
+                chunks.append(file.read(end - start))
+                position = end
+            return pickle.loads(chunks[0], buffers=chunks[1:])
         finally:
             gc.enable()
 
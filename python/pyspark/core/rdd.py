@@ -78,8 +78,10 @@ from pyspark.resultiterable import ResultIterable
 from pyspark.shuffle import (
     Aggregator,
     ExternalMerger,
+    SimpleAggregator,
+    _create_merger,
+    _create_sorter,
     get_used_memory,
-    ExternalSorter,
     ExternalGroupBy,
 )
 from pyspark.traceback_utils import SCCallSiteSync
@@ -1279,7 +1281,7 @@ class RDD(Generic[T_co]):
         serializer = self._jrdd_deserializer
 
         def sortPartition(iterator: Iterable[Tuple[K, V]]) -> Iterable[Tuple[K, V]]:
-            sort = ExternalSorter(memory * 0.9, serializer).sorted
+            sort = _create_sorter(memory * 0.9, serializer).sorted
             return iter(sort(iterator, key=lambda k_v: keyfunc(k_v[0]), reverse=(not ascending)))
 
         return self.partitionBy(numPartitions, partitionFunc).mapPartitions(sortPartition, True)
@@ -1362,7 +1364,7 @@ class RDD(Generic[T_co]):
         serializer = self._jrdd_deserializer
 
         def sortPartition(iterator: Iterable[Tuple[K, V]]) -> Iterable[Tuple[K, V]]:
-            sort = ExternalSorter(memory * 0.9, serializer).sorted
+            sort = _create_sorter(memory * 0.9, serializer).sorted
             return iter(sort(iterator, key=lambda kv: keyfunc(kv[0]), reverse=(not ascending)))
 
         if numPartitions == 1:
@@ -3418,7 +3420,7 @@ class RDD(Generic[T_co]):
         >>> sorted(rdd.reduceByKey(add).collect())
         [('a', 2), ('b', 1)]
         """
-        return self.combineByKey(lambda x: x, func, func, numPartitions, partitionFunc)
+        return self._combineByAggregator(SimpleAggregator(func), numPartitions, partitionFunc)
 
     def reduceByKeyLocally(self: "RDD[Tuple[K, V]]", func: Callable[[V, V], V]) -> Dict[K, V]:
         """
@@ -3841,15 +3843,26 @@ class RDD(Generic[T_co]):
         >>> sorted(rdd.combineByKey(to_list, append, extend).collect())
         [('a', [1, 2]), ('b', [1])]
         """
+        agg = Aggregator(createCombiner, mergeValue, mergeCombiners)
+        return self._combineByAggregator(agg, numPartitions, partitionFunc)
+
+    def _combineByAggregator(
+        self: "RDD[Tuple[K, V]]",
+        agg: Aggregator,
+        numPartitions: Optional[int],
+        partitionFunc: Callable[[K], int],
+    ) -> "RDD[Tuple[K, U]]":
+        """
+        Implementation of :meth:`combineByKey` with the functions of an :class:`Aggregator`.
+        """
         if numPartitions is None:
             numPartitions = self._defaultReducePartitions()
 
         serializer = self.ctx.serializer
         memory = self._memory_limit()
-        agg = Aggregator(createCombiner, mergeValue, mergeCombiners)
 
         def combineLocally(iterator: Iterable[Tuple[K, V]]) -> Iterable[Tuple[K, U]]:
-            merger = ExternalMerger(agg, memory * 0.9, serializer)
+            merger = _create_merger(agg, memory * 0.9, serializer)
             merger.mergeValues(iterator)
             return merger.items()
 
@@ -3857,7 +3870,7 @@ class RDD(Generic[T_co]):
         shuffled = locally_combined.partitionBy(numPartitions, partitionFunc)
 
         def _mergeCombiners(iterator: Iterable[Tuple[K, U]]) -> Iterable[Tuple[K, U]]:
-            merger = ExternalMerger(agg, memory, serializer)
+            merger = _create_merger(agg, memory, serializer)
             merger.mergeCombiners(iterator)
             return merger.items()
 
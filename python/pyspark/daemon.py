@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 import uuid
+import importlib
 import numbers
 import os
 import signal
@@ -31,8 +32,6 @@ from signal import SIGHUP, SIGTERM, SIGCHLD, SIG_DFL, SIG_IGN, SIGINT
 from pyspark.serializers import read_int, write_int, write_with_length, UTF8Deserializer
 
 if len(sys.argv) > 1 and sys.argv[1].startswith("pyspark"):
-    import importlib
-
     worker_module = importlib.import_module(sys.argv[1])
     worker_main = worker_module.main
 else:
@@ -89,10 +88,34 @@ def worker(sock, authenticated):
     return exit_code
 
 
+def preload(names):
+    """
+    Import the modules of the comma-separated list of names, and call the functions given as
+    `module:function`, so that the workers forked afterwards share them.
+    """
+    for name in names.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        module_name, _, function_name = name.partition(":")
+        try:
+            module = importlib.import_module(module_name)
+            if function_name:
+                getattr(module, function_name)()
+        except Exception:
+            print("Failed to preload %s in the Python daemon:" % name, file=sys.stderr)
+            traceback.print_exc()
+
+
 def manager():
     # Create a new process group to corral our children
     os.setpgid(0, 0)
 
+    preload(os.environ.get("PYSPARK_DAEMON_PRELOAD", ""))
+    # Keep the objects loaded so far out of the garbage collections of the workers, so that
+    # they do not write to the memory pages shared with the daemon
+    gc.freeze()
+
     is_unix_domain_sock = os.environ.get("PYTHON_UNIX_DOMAIN_ENABLED", "false").lower() == "true"
     socket_path = None
 
@@ -142,12 +165,94 @@ def manager():
     signal.signal(SIGCHLD, SIG_IGN)
 
     reuse = os.environ.get("SPARK_REUSE_WORKER")
+    pool_size = int(os.environ.get("PYSPARK_DAEMON_POOL_SIZE", "0"))
+
+    def run_worker(sock, pool_write_fd=None):
+        """Run the worker for the connection in the forked child process, never returns"""
+        listen_sock.close()
+
+        # It should close the standard input in the child process so that
+        # Python native function executions stay intact.
+        #
+        # Note that if we just close the standard input (file descriptor 0),
+        # the lowest file descriptor (file descriptor 0) will be allocated,
+        # later when other file descriptors should happen to open.
+        #
+        # Therefore, here we redirects it to '/dev/null' by duplicating
+        # another file descriptor for '/dev/null' to the standard input (0).
+        # See SPARK-26175.
+        devnull = open(os.devnull, "r")
+        os.dup2(devnull.fileno(), 0)
+        devnull.close()
+
+        try:
+            # Acknowledge that the fork was successful
+            outfile = sock.makefile(mode="wb")
+            write_int(os.getpid(), outfile)
+            outfile.flush()
+            outfile.close()
+            if pool_write_fd is not None:
+                # leave the pool once the connection is acknowledged
+                os.write(pool_write_fd, os.getpid().to_bytes(4, "big"))
+                os.close(pool_write_fd)
+            authenticated = (
+                os.environ.get("PYTHON_UNIX_DOMAIN_ENABLED", "false").lower() == "true" or False
+            )
+            while True:
+                code = worker(sock, authenticated)
+                if code == 0:
+                    authenticated = True
+                if not reuse or code:
+                    # wait for closing
+                    try:
+                        while sock.recv(1024):
+                            pass
+                    except Exception:
+                        pass
+                    break
+                gc.collect()
+        except BaseException:
+            traceback.print_exc()
+            os._exit(1)
+        else:
+            os._exit(0)
+
+    # The pids of the pre-forked workers waiting for a connection. They accept the connections
+    # themselves and write their pids into the pipe, and the daemon forks new ones to replace
+    # them, so that the workers do not wait for the daemon to fork them.
+    idle_workers = set()
+    if pool_size > 0:
+        pool_read_fd, pool_write_fd = os.pipe()
+
+    def fill_pool():
+        while len(idle_workers) < pool_size:
+            try:
+                pid = os.fork()
+            except OSError:
+                return  # try again later
+            if pid == 0:
+                # in the pre-forked worker, shut down with the daemon
+                signal.signal(SIGHUP, SIG_DFL)
+                signal.signal(SIGTERM, SIG_DFL)
+                signal.signal(SIGCHLD, SIG_DFL)
+                try:
+                    os.close(pool_read_fd)
+                    sock, _ = listen_sock.accept()
+                except BaseException:
+                    traceback.print_exc()
+                    os._exit(1)
+                run_worker(sock, pool_write_fd)
+            idle_workers.add(pid)
+
+    fill_pool()
 
     # Initialization complete
     try:
         while True:
             try:
-                ready_fds = select.select([0, listen_sock], [], [], 1)[0]
+                ready_fds = select.select(
+                    [0, pool_read_fd if pool_size > 0 else listen_sock], [], [], 1
+                )[0]
             except select.error as ex:
                 if ex[0] == EINTR:
                     continue
@@ -165,7 +270,20 @@ def manager():
                 except OSError:
                     pass  # process already died
 
-            if listen_sock in ready_fds:
+            if pool_size > 0:
+                if pool_read_fd in ready_fds:
+                    # the pids are written at once, so they are never split
+                    pids = os.read(pool_read_fd, 4096)
+                    for i in range(0, len(pids), 4):
+                        idle_workers.discard(int.from_bytes(pids[i : i + 4], "big"))
+                for pid in list(idle_workers):
+                    try:
+                        os.kill(pid, 0)
+                    except OSError:
+                        idle_workers.discard(pid)  # died before accepting a connection
+                fill_pool()
+
+            elif listen_sock in ready_fds:
                 try:
                     sock, _ = listen_sock.accept()
                 except OSError as e:
@@ -190,50 +308,7 @@ def manager():
 
                 if pid == 0:
                     # in child process
-                    listen_sock.close()
-
-                    # It should close the standard input in the child process so that
-                    # Python native function executions stay intact.
-                    #
-                    # Note that if we just close the standard input (file descriptor 0),
-                    # the lowest file descriptor (file descriptor 0) will be allocated,
-                    # later when other file descriptors should happen to open.
-                    #
-                    # Therefore, here we redirects it to '/dev/null' by duplicating
-                    # another file descriptor for '/dev/null' to the standard input (0).
-                    # See SPARK-26175.
-                    devnull = open(os.devnull, "r")
-                    os.dup2(devnull.fileno(), 0)
-                    devnull.close()
-
-                    try:
-                        # Acknowledge that the fork was successful
-                        outfile = sock.makefile(mode="wb")
-                        write_int(os.getpid(), outfile)
-                        outfile.flush()
-                        outfile.close()
-                        authenticated = (
-                            os.environ.get("PYTHON_UNIX_DOMAIN_ENABLED", "false").lower() == "true"
-                            or False
-                        )
-                        while True:
-                            code = worker(sock, authenticated)
-                            if code == 0:
-                                authenticated = True
-                            if not reuse or code:
-                                # wait for closing
-                                try:
-                                    while sock.recv(1024):
-                                        pass
-                                except Exception:
-                                    pass
-                                break
-                            gc.collect()
-                    except BaseException:
-                        traceback.print_exc()
-                        os._exit(1)
-                    else:
-                        os._exit(0)
+                    run_worker(sock)
                 else:
                     sock.close()
 
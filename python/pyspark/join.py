@@ -31,75 +31,224 @@ THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import itertools
+import os
+import shutil
+import sys
 from functools import reduce
 
+import pyspark.shuffle
 from pyspark.resultiterable import ResultIterable
+from pyspark.shuffle import (
+    ExternalList,
+    ExternalMerger,
+    _SizeTracker,
+    _compressed_serializer,
+    _estimate_size,
+    _get_local_dirs,
+)
 
 
-def _do_python_join(rdd, other, numPartitions, dispatch):
+def _do_python_join(rdd, other, numPartitions, keep_v, keep_w):
     vs = rdd.mapValues(lambda v: (1, v))
     ws = other.mapValues(lambda v: (2, v))
-    return vs.union(ws).groupByKey(numPartitions).flatMapValues(lambda x: dispatch(x.__iter__()))
+    memory = rdd._memory_limit()
 
+    def join(iterator):
+        return _hash_join(iterator, keep_v, keep_w, memory * 0.9)
 
-def python_join(rdd, other, numPartitions):
-    def dispatch(seq):
-        vbuf, wbuf = [], []
-        for n, v in seq:
-            if n == 1:
-                vbuf.append(v)
-            elif n == 2:
-                wbuf.append(v)
-        return ((v, w) for v in vbuf for w in wbuf)
+    return vs.union(ws).partitionBy(numPartitions).mapPartitions(join, True)
 
-    return _do_python_join(rdd, other, numPartitions, dispatch)
 
+def _hash_join(iterator, keep_v, keep_w, memory_limit, batch=1000, scale=1):
+    """
+    Join the values tagged with 1 and 2 of the items of one partition.
 
-def python_right_outer_join(rdd, other, numPartitions):
-    def dispatch(seq):
-        vbuf, wbuf = [], []
-        for n, v in seq:
-            if n == 1:
-                vbuf.append(v)
-            elif n == 2:
-                wbuf.append(v)
-        if not vbuf:
-            vbuf.append(None)
-        return ((v, w) for v in vbuf for w in wbuf)
+    The values of each side are grouped by key into a hash table. When the estimated size of
+    the tables goes above memory_limit (in MiB), the side with more values becomes the stream
+    side: its table and the rest of its values are dumped into an ExternalList, which is
+    streamed against the hash table of the other side at the end. The groups with many values
+    are kept in ExternalLists too, which dump them into disks.
 
-    return _do_python_join(rdd, other, numPartitions, dispatch)
+    If the hash table of the build side goes above memory_limit as well, the items of both
+    sides are partitioned by key into buckets on disks, which are joined one by one, and
+    partitioned again recursively if they do not fit in memory, see `_grace_join`.
 
+    The values of the side 1 (resp. 2) without any match are joined with None if keep_v
+    (resp. keep_w) is set.
 
-def python_left_outer_join(rdd, other, numPartitions):
-    def dispatch(seq):
-        vbuf, wbuf = [], []
-        for n, v in seq:
-            if n == 1:
-                vbuf.append(v)
-            elif n == 2:
-                wbuf.append(v)
-        if not wbuf:
-            wbuf.append(None)
-        return ((v, w) for v in vbuf for w in wbuf)
+    Examples
+    --------
+    >>> items = [(1, (1, "a")), (2, (2, "x")), (1, (2, "y")), (1, (2, "z")), (3, (1, "b"))]
+    >>> sorted(_hash_join(iter(items), False, False, 1))
+    [(1, ('a', 'y')), (1, ('a', 'z'))]
+    >>> sorted(_hash_join(iter(items), True, True, 0, batch=1), key=str)
+    [(1, ('a', 'y')), (1, ('a', 'z')), (2, (None, 'x')), (3, ('b', None))]
+    """
+    tables, counts = ({}, {}), [0, 0]
+    stream, stream_side = None, None
+    tracker, limit, c = _SizeTracker(lambda: _estimate_size(tables)), memory_limit * (1 << 20), 0
+    iterator = iter(iterator)
+    for k, (n, v) in iterator:
+        side = n - 1
+        if side == stream_side:
+            stream.append((k, v))
+            continue
 
-    return _do_python_join(rdd, other, numPartitions, dispatch)
+        table = tables[side]
+        group = table.get(k)
+        if group is None:
+            table[k] = [v]
+        else:
+            group.append(v)
+            if type(group) is list and len(group) >= ExternalList.LIMIT:
+                table[k] = ExternalList(group)
+        counts[side] += 1
+        c += 1
+        if c >= batch:
+            tracker.update(c)
+            c = 0
+            if tracker.size() <= limit:
+                continue
+            if stream is None:
+                stream_side = 0 if counts[0] >= counts[1] else 1
+                stream = ExternalList([])
+                for key, group in tables[stream_side].items():
+                    for v in group:
+                        stream.append((key, v))
+                tables[stream_side].clear()
+                tracker.reset()
+            elif scale * _GRACE_PARTITIONS < ExternalMerger.MAX_TOTAL_PARTITIONS:
+                # neither side fits in memory
+                build = tables[1 - stream_side]
+                items = itertools.chain(
+                    ((key, (2 - stream_side, v)) for key, group in build.items() for v in group),
+                    ((key, (stream_side + 1, v)) for key, v in stream),
+                    iterator,
+                )
+                return _grace_join(items, keep_v, keep_w, memory_limit, batch, scale)
 
+    if stream is None:
+        return _join_tables(tables[0], tables[1], keep_v, keep_w)
+    return _join_stream(stream, stream_side, tables[1 - stream_side], keep_v, keep_w)
 
-def python_full_outer_join(rdd, other, numPartitions):
-    def dispatch(seq):
-        vbuf, wbuf = [], []
-        for n, v in seq:
-            if n == 1:
-                vbuf.append(v)
-            elif n == 2:
-                wbuf.append(v)
+
+# the number of buckets the items are partitioned into by _grace_join
+_GRACE_PARTITIONS = 59
+
+
+def _grace_join(items, keep_v, keep_w, memory_limit, batch, scale):
+    """
+    Partition the tagged items of both sides by key into buckets dumped into disks, and
+    return the iterator of the items of the buckets joined one by one by `_hash_join`.
+
+    scale is used to partition the buckets by other hashes of the keys when they are
+    partitioned again recursively, like the recursive merge of ExternalMerger.
+    """
+    serializer = _compressed_serializer(None)
+    buffers = [[] for _ in range(_GRACE_PARTITIONS)]
+    dirs = _get_local_dirs("join")
+    d = os.path.join(dirs[id(buffers) % len(dirs)], str(id(buffers)))
+    os.makedirs(d, exist_ok=True)
+    paths = [os.path.join(d, str(i)) for i in range(_GRACE_PARTITIONS)]
+    try:
+        files = [open(path, "wb", 65536) for path in paths]
+        try:
+            for k, item in items:
+                i = hash((k, scale)) % _GRACE_PARTITIONS
+                buffers[i].append((k, item))
+                if len(buffers[i]) >= batch:
+                    serializer.dump_stream(buffers[i], files[i])
+                    buffers[i].clear()
+            for f, buffer in zip(files, buffers):
+                serializer.dump_stream(buffer, f)
+                pyspark.shuffle.DiskBytesSpilled += f.tell()
+        finally:
+            for f in files:
+                f.close()
+    except BaseException:
+        shutil.rmtree(d, True)
+        raise
+
+    def join_buckets():
+        try:
+            for path in paths:
+                with open(path, "rb") as f:
+                    yield from _hash_join(
+                        serializer.load_stream(f),
+                        keep_v,
+                        keep_w,
+                        memory_limit,
+                        batch,
+                        scale * _GRACE_PARTITIONS,
+                    )
+                os.remove(path)
+        finally:
+            shutil.rmtree(d, True)
+
+    return join_buckets()
+
+
+def _join_tables(vs, ws, keep_v, keep_w):
+    """Join the values of the two hash tables"""
+    for k in itertools.chain(vs, (k for k in ws if k not in vs)):
+        vbuf, wbuf = vs.get(k), ws.get(k)
         if not vbuf:
-            vbuf.append(None)
+            vbuf = [None] if keep_w else []
         if not wbuf:
-            wbuf.append(None)
-        return ((v, w) for v in vbuf for w in wbuf)
+            wbuf = [None] if keep_v else []
+        for v in vbuf:
+            for w in wbuf:
+                yield k, (v, w)
 
-    return _do_python_join(rdd, other, numPartitions, dispatch)
+
+def _join_stream(stream, stream_side, build, keep_v, keep_w):
+    """Join the (key, value) pairs of stream with the values of the hash table of the other side"""
+    if stream_side == 0:
+        keep_stream, keep_build = keep_v, keep_w
+
+        def pair(x, y):
+            return x, y
+
+    else:
+        keep_stream, keep_build = keep_w, keep_v
+
+        def pair(x, y):
+            return y, x
+
+    matched = set()
+    for k, x in stream:
+        group = build.get(k)
+        if group is None:
+            if keep_stream:
+                yield k, pair(x, None)
+            continue
+        if keep_build:
+            matched.add(k)
+        for y in group:
+            yield k, pair(x, y)
+
+    if keep_build:
+        for k, group in build.items():
+            if k not in matched:
+                for y in group:
+                    yield k, pair(None, y)
+
+
+def python_join(rdd, other, numPartitions):
+    return _do_python_join(rdd, other, numPartitions, False, False)
+
+
+def python_right_outer_join(rdd, other, numPartitions):
+    return _do_python_join(rdd, other, numPartitions, False, True)
+
+
+def python_left_outer_join(rdd, other, numPartitions):
+    return _do_python_join(rdd, other, numPartitions, True, False)
+
+
+def python_full_outer_join(rdd, other, numPartitions):
+    return _do_python_join(rdd, other, numPartitions, True, True)
 
 
 def python_cogroup(rdds, numPartitions):
@@ -117,3 +266,11 @@ def python_cogroup(rdds, numPartitions):
         return tuple(ResultIterable(vs) for vs in bufs)
 
     return union_vrdds.groupByKey(numPartitions).mapValues(dispatch)
+
+
+if __name__ == "__main__":
+    import doctest
+
+    (failure_count, test_count) = doctest.testmod()
+    if failure_count:
+        sys.exit(-1)
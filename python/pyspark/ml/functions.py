@@ -446,6 +446,19 @@ def predict_batch_udf(
     :py:class:`UserDefinedFunctionLike`
         A Pandas UDF for model inference on a Spark DataFrame.
 
+    Notes
+    -----
+    The `predict` functions are cached in each reused Python worker, so that the model is loaded
+    once per worker rather than once per task. By default the last 3 models are kept. This can be
+    changed with `spark.python.worker.modelCache.maxEntries`, and the cache can also be bounded by
+    the estimated memory of the models with `spark.python.worker.modelCache.maxSize` and by the
+    time since their last use with `spark.python.worker.modelCache.ttl`.
+
+    To load large model weights once per executor instead, broadcast them with
+    `spark.python.broadcast.zeroCopy` enabled and build the model from the value of the broadcast
+    in `make_predict_fn`. The NumPy arrays of the value are then mapped read-only from the shared
+    file of the executor by all its Python workers.
+
     Examples
     --------
     For a pre-trained TensorFlow MNIST model with two-dimensional input images represented as a
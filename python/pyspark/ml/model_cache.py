@@ -15,11 +15,59 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import os
+import sys
+import time
 from threading import Lock
-from typing import Callable, Optional
+import types
+from typing import Any, Callable, Dict, Optional, Tuple
 from uuid import UUID
 
 
+def _estimate_model_size(predict_fn: Callable) -> int:
+    """Estimate the memory in bytes held by a model prediction function.
+
+    This walks the objects the function refers to through its closure, default arguments, bound
+    instance, instance attributes and containers, counting each object once. Objects exposing an
+    integer `nbytes`, e.g. NumPy arrays and PyTorch tensors, are counted by their data. Modules,
+    classes and the global variables of functions are not counted.
+    """
+    seen = set()
+    size = 0
+    stack = [predict_fn]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, (type, types.ModuleType)):
+            continue
+        seen.add(id(o))
+
+        nbytes = getattr(o, "nbytes", None)
+        if isinstance(nbytes, int):
+            # the size of NumPy arrays owning their data already includes it
+            size += max(nbytes, sys.getsizeof(o))
+            continue
+        size += sys.getsizeof(o)
+        if isinstance(o, types.FunctionType):
+            for cell in o.__closure__ or ():
+                try:
+                    stack.append(cell.cell_contents)
+                except ValueError:  # the cell is empty
+                    pass
+            stack.extend(o.__defaults__ or ())
+            stack.extend((o.__kwdefaults__ or {}).values())
+        elif isinstance(o, types.MethodType):
+            stack.append(o.__func__)
+            stack.append(o.__self__)
+        elif isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif isinstance(getattr(o, "__dict__", None), dict):
+            stack.append(o.__dict__)
+    return size
+
+
 class ModelCache:
     """Cache for model prediction functions on executors.
 
@@ -30,26 +78,82 @@ class ModelCache:
     PythonWorkerFactory.scala), it will be killed, effectively clearing the cache until a new python
     worker is started.
 
+    The cache keeps at most `spark.python.worker.modelCache.maxEntries` models, and at most
+    `spark.python.worker.modelCache.maxSize` bytes of models by their estimated size when it is
+    positive, evicting the least recently used models first. Models not used for
+    `spark.python.worker.modelCache.ttl` seconds, when it is positive, are evicted too.
+
     Caching large models can lead to out-of-memory conditions, which may require adjusting spark
     memory configurations, e.g. `spark.executor.memoryOverhead`.
     """
 
-    _models: OrderedDict = OrderedDict()
-    _capacity: int = 3  # "reasonable" default size for now, make configurable later, if needed
+    # uuid -> (predict_fn, estimated size in bytes, last access time)
+    _models: "OrderedDict[UUID, Tuple[Callable, int, float]]" = OrderedDict()
+    _capacity: int = int(os.environ.get("PYSPARK_MODEL_CACHE_MAX_ENTRIES", "3"))
+    _max_bytes: int = int(os.environ.get("PYSPARK_MODEL_CACHE_MAX_BYTES", "0"))
+    _ttl: float = float(os.environ.get("PYSPARK_MODEL_CACHE_TTL_SECONDS", "0"))
+    _size: int = 0
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
     _lock: Lock = Lock()
 
     @staticmethod
-    def add(uuid: UUID, predict_fn: Callable) -> None:
+    def add(uuid: UUID, predict_fn: Callable, size: Optional[int] = None) -> None:
+        """Cache a prediction function, estimating its size unless given."""
+        if size is None:
+            size = _estimate_model_size(predict_fn) if ModelCache._max_bytes > 0 else 0
         with ModelCache._lock:
-            ModelCache._models[uuid] = predict_fn
-            ModelCache._models.move_to_end(uuid)
-            if len(ModelCache._models) > ModelCache._capacity:
-                ModelCache._models.popitem(last=False)
+            ModelCache._remove(uuid)
+            if ModelCache._max_bytes > 0 and size > ModelCache._max_bytes:
+                return
+            ModelCache._models[uuid] = (predict_fn, size, time.monotonic())
+            ModelCache._size += size
+            ModelCache._evict()
 
     @staticmethod
     def get(uuid: UUID) -> Optional[Callable]:
         with ModelCache._lock:
-            predict_fn = ModelCache._models.get(uuid)
-            if predict_fn:
-                ModelCache._models.move_to_end(uuid)
-            return predict_fn
+            ModelCache._evict()
+            entry = ModelCache._models.get(uuid)
+            if entry is None:
+                ModelCache._misses += 1
+                return None
+            ModelCache._hits += 1
+            ModelCache._models[uuid] = (entry[0], entry[1], time.monotonic())
+            ModelCache._models.move_to_end(uuid)
+            return entry[0]
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """Return the number and estimated size of the cached models, and the number of hits,
+        misses and evictions of this worker."""
+        with ModelCache._lock:
+            return {
+                "count": len(ModelCache._models),
+                "size": ModelCache._size,
+                "hits": ModelCache._hits,
+                "misses": ModelCache._misses,
+                "evictions": ModelCache._evictions,
+            }
+
+    @staticmethod
+    def _remove(uuid: UUID) -> None:
+        entry = ModelCache._models.pop(uuid, None)
+        if entry is not None:
+            ModelCache._size -= entry[1]
+
+    @staticmethod
+    def _evict() -> None:
+        expired = time.monotonic() - ModelCache._ttl
+        while ModelCache._models:
+            uuid, (_, _, last_access) = next(iter(ModelCache._models.items()))
+            if (
+                len(ModelCache._models) > ModelCache._capacity
+                or (ModelCache._max_bytes > 0 and ModelCache._size > ModelCache._max_bytes)
+                or (ModelCache._ttl > 0 and last_access < expired)
+            ):
+                ModelCache._remove(uuid)
+                ModelCache._evictions += 1
+            else:
+                break
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import time
 import unittest
 from uuid import uuid4
 
@@ -24,6 +25,14 @@ from pyspark.testing.mlutils import SparkSessionTestCase
 class ModelCacheTests(SparkSessionTestCase):
     def setUp(self):
         super(ModelCacheTests, self).setUp()
+        ModelCache._models.clear()
+        ModelCache._size = 0
+
+    def tearDown(self):
+        ModelCache._capacity = 3
+        ModelCache._max_bytes = 0
+        ModelCache._ttl = 0
+        super(ModelCacheTests, self).tearDown()
 
     def test_cache(self):
         def predict_fn(inputs):
@@ -42,6 +51,58 @@ class ModelCacheTests(SparkSessionTestCase):
         expected_uuids = uuids[7:8] + uuids[9:10] + [uuids[8]]
         self.assertTrue(list(ModelCache._models.keys()) == expected_uuids)
 
+    def test_cache_by_size(self):
+        import numpy as np
+
+        ModelCache._max_bytes = (3 << 20) + (1 << 16)
+
+        def make_predict_fn(n):
+            weights = np.zeros(n, dtype=np.uint8)
+
+            def predict_fn(inputs):
+                return inputs * weights[0]
+
+            return predict_fn
+
+        evictions = ModelCache.stats()["evictions"]
+        uuids = [uuid4() for i in range(3)]
+        for uuid in uuids:
+            ModelCache.add(uuid, make_predict_fn(1 << 20))
+        self.assertTrue(len(ModelCache._models) == 3)
+        self.assertTrue(ModelCache._size > 3 << 20)
+
+        # a model larger than the cache is not kept
+        uuid = uuid4()
+        ModelCache.add(uuid, make_predict_fn(4 << 20))
+        self.assertIsNone(ModelCache.get(uuid))
+        self.assertTrue(list(ModelCache._models.keys()) == uuids)
+
+        # adding a larger model evicts the least recently used ones
+        ModelCache.get(uuids[0])
+        ModelCache.add(uuid, make_predict_fn(2 << 20))
+        self.assertTrue(list(ModelCache._models.keys()) == [uuids[0], uuid])
+
+        stats = ModelCache.stats()
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["size"], ModelCache._size)
+        self.assertEqual(stats["evictions"], evictions + 2)
+
+    def test_cache_ttl(self):
+        def predict_fn(inputs):
+            return inputs
+
+        ModelCache._ttl = 0.1
+        uuids = [uuid4() for i in range(2)]
+        ModelCache.add(uuids[0], predict_fn)
+        time.sleep(0.2)
+        ModelCache.add(uuids[1], predict_fn)
+
+        hits, misses = ModelCache.stats()["hits"], ModelCache.stats()["misses"]
+        self.assertIsNone(ModelCache.get(uuids[0]))
+        self.assertIs(ModelCache.get(uuids[1]), predict_fn)
+        self.assertEqual(ModelCache.stats()["hits"], hits + 1)
+        self.assertEqual(ModelCache.stats()["misses"], misses + 1)
+
 
 if __name__ == "__main__":
     from pyspark.ml.tests.test_model_cache import *  # noqa: F401
@@ -192,6 +192,7 @@ class PandasOnSparkFrameMethods:
                     )
                 ],
                 column_label_names=internal.column_label_names,
+                default_index_cache_entry=internal._default_index_cache_entry,
             ).resolved_copy
         )
 
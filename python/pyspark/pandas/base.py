@@ -18,18 +18,32 @@
 """
 Base and utility classes for pandas-on-Spark objects.
 """
+import threading
 import warnings
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 from functools import wraps, partial
 from itertools import chain
-from typing import Any, Callable, Optional, Sequence, Tuple, Union, cast, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    TYPE_CHECKING,
+)
 
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_list_like, CategoricalDtype  # type: ignore[attr-defined]
 
 from pyspark.sql import functions as F, Column, Window
-from pyspark.sql.types import LongType, BooleanType, NumericType
+from pyspark.sql.types import BooleanType, DateType, LongType, NumericType, StringType
 from pyspark import pandas as ps  # For running doctests and reference resolution in PyCharm.
 from pyspark.pandas._typing import Axis, Dtype, IndexOpsLike, Label, SeriesOrIndex
 from pyspark.pandas.config import get_option, option_context
@@ -52,6 +66,7 @@ from pyspark.pandas.frame import DataFrame
 
 if TYPE_CHECKING:
     from pyspark.sql._typing import ColumnOrName
+    from pyspark.sql.dataframe import DataFrame as PySparkDataFrame
 
     from pyspark.pandas.data_type_ops.base import DataTypeOps
     from pyspark.pandas.series import Series
@@ -178,6 +193,200 @@ def align_diff_index_ops(
                 ).rename(that_series.name)
 
 
+# The largest number of periods for which `shift` and `diff` take the rows before or after each
+# partition from the neighboring partitions, instead of moving all the rows into a single partition.
+_MAX_HALO_PERIODS = 100
+
+# The Spark types whose values are combined across the partitions as literals in prefix scans.
+_SCANNABLE_TYPES = (NumericType, BooleanType, StringType, DateType)
+
+# The largest number of values embedded as literals for all the partitions of all the columns
+# collected together by prefix scans, shift and diff, instead of moving all the rows into a single
+# partition.
+_MAX_PARTITION_LITERALS = 10000
+
+
+def _natural_order_partition() -> Column:
+    """
+    Return the partition each row was in when its natural order was given by
+    `monotonically_increasing_id`, so that the rows of each partition are consecutive in the
+    natural order.
+    """
+    return F.shiftright(F.col(NATURAL_ORDER_COLUMN_NAME), 33)
+
+
+class _PartitionScans:
+    """
+    The carries of the prefix scans of `IndexOpsMixin._scan` and the halos of
+    `IndexOpsMixin._lag` of the columns of a Spark DataFrame, collected in a single job.
+
+    Ops applied to all the columns of a frame are applied twice, see
+    `Frame._apply_series_op_with_scans`. While `recording`, the scans and lags only record the
+    values they need and return their window over a single partition as placeholders. The
+    values of all of them are then collected together, and the scans and lags applied again
+    take them in the same order. Outside of both, each scan or lag collects its own values.
+
+    The values are collected in a separate job, so they only match the rows of the partitions
+    if the natural order is the same in every job. This is not the case after a shuffle, so
+    they are only collected for a persisted frame, see `has_stable_order`.
+    """
+
+    # The sentinel returned by `get` while recording.
+    PENDING = object()
+
+    _local = threading.local()
+
+    def __init__(self, spark_frame: "PySparkDataFrame"):
+        self._spark_frame = spark_frame
+        self._requests: List[Tuple] = []
+        self._results: Optional[List[Any]] = None
+        self._stable_order: Optional[bool] = None
+
+    def has_stable_order(self) -> bool:
+        """
+        Return whether the rows of the frame are in the same partitions and order in every job,
+        i.e. whether the frame is persisted along with its natural order column.
+        """
+        if self._stable_order is None:
+            storage_level = self._spark_frame.storageLevel
+            self._stable_order = (
+                storage_level.useMemory or storage_level.useDisk or storage_level.useOffHeap
+            )
+        return self._stable_order
+
+    @contextmanager
+    def recording(self) -> Iterator[None]:
+        with self._activate():
+            yield
+
+    @contextmanager
+    def applying(self) -> Iterator[None]:
+        self._results = self._collect() if self._requests else []
+        with self._activate():
+            yield
+
+    @contextmanager
+    def _activate(self) -> Iterator[None]:
+        previous = getattr(_PartitionScans._local, "current", None)
+        _PartitionScans._local.current = self
+        try:
+            yield
+        finally:
+            _PartitionScans._local.current = previous
+
+    @staticmethod
+    def get(spark_frame: "PySparkDataFrame", request: Tuple) -> Any:
+        """
+        Return the values of a request of `spark_frame`, None if they cannot be collected or
+        embedded, or PENDING while recording.
+
+        The requests are ("scan", scol, func, ascending), whose values are the type and the
+        carries of the partitions, and ("lag", scol, periods), whose values are the halos of
+        the partitions.
+        """
+        scans = getattr(_PartitionScans._local, "current", None)
+        if scans is None or scans._spark_frame is not spark_frame:
+            scans = _PartitionScans(spark_frame)
+            if not scans.has_stable_order():
+                return None
+            scans._requests.append(request)
+            return scans._collect()[0]
+        if not scans.has_stable_order():
+            return None
+        if scans._results is None:
+            scans._requests.append(request)
+            return _PartitionScans.PENDING
+        assert len(scans._results) > 0, "the ops requested other values than recorded"
+        return scans._results.pop(0)
+
+    def _collect(self) -> List[Any]:
+        """Collect the values of all the requests in a single job"""
+        partition = _natural_order_partition()
+        columns = [partition.alias("partition")]
+        rows = {}
+        for i, request in enumerate(self._requests):
+            columns.append(request[1].alias("value_%s" % i))
+            if request[0] == "lag":
+                # The rows are taken from the end of the partitions, or the start if negative.
+                name = "row_desc" if request[2] > 0 else "row_asc"
+                order = F.desc if request[2] > 0 else F.asc
+                rows[name] = F.row_number().over(
+                    Window.partitionBy(partition).orderBy(order(NATURAL_ORDER_COLUMN_NAME))
+                )
+        columns.extend(row.alias(name) for name, row in rows.items())
+
+        aggs = []
+        for i, request in enumerate(self._requests):
+            value = F.col("value_%s" % i)
+            if request[0] == "scan":
+                aggs.append(request[2](value).alias("value_%s" % i))
+            else:
+                row = F.col("row_desc" if request[2] > 0 else "row_asc")
+                aggs.append(
+                    F.collect_list(
+                        F.when(
+                            row <= abs(request[2]),
+                            F.struct(row.alias("row"), value.alias("value")),
+                        )
+                    ).alias("value_%s" % i)
+                )
+        sdf = self._spark_frame.select(*columns).groupBy("partition").agg(*aggs)
+
+        # The carry of each partition is the scan of the partitions before it.
+        values = []
+        for i, request in enumerate(self._requests):
+            value = F.col("value_%s" % i)
+            if request[0] == "scan":
+                order = F.asc("partition") if request[3] else F.desc("partition")
+                value = request[2](value).over(
+                    Window.orderBy(order).rowsBetween(Window.unboundedPreceding, -1)
+                )
+            values.append(value.alias("value_%s" % i))
+        sdf = sdf.select("partition", *values)
+        types = [field.dataType for field in sdf.schema.fields[1:]]
+        embeddable = [
+            request[0] == "lag" or isinstance(data_type, _SCANNABLE_TYPES)
+            for request, data_type in zip(self._requests, types)
+        ]
+        if not any(embeddable):
+            return [None] * len(self._requests)
+        names = ["value_%s" % i for i, is_embeddable in enumerate(embeddable) if is_embeddable]
+        collected = sdf.select("partition", *names).collect()
+
+        results: List[Any] = []
+        remaining_literals = _MAX_PARTITION_LITERALS
+        for i, request in enumerate(self._requests):
+            literals = len(collected) * (1 if request[0] == "scan" else abs(request[2]))
+            if not embeddable[i] or literals > remaining_literals:
+                results.append(None)
+                continue
+            remaining_literals -= literals
+            if request[0] == "scan":
+                results.append((types[i], {row[0]: row["value_%s" % i] for row in collected}))
+            else:
+                results.append(
+                    _halos([(row[0], row["value_%s" % i]) for row in collected], request[2])
+                )
+        return results
+
+
+def _halos(partitions: List[Tuple[int, List[Any]]], periods: int) -> Dict[int, List[Any]]:
+    """
+    Return the halo of each partition, i.e. the `periods` values before it in the natural
+    order, or after it if negative, from the rows taken from the end or the start of each
+    partition.
+    """
+    ascending = periods > 0
+    periods = abs(periods)
+    halos: Dict[int, List[Any]] = {}
+    preceding: List[Any] = []
+    for partition_id, rows in sorted(partitions, key=lambda p: p[0], reverse=not ascending):
+        halos[partition_id] = [None] * (periods - len(preceding)) + preceding
+        values = [row["value"] for row in sorted(rows, key=lambda row: -row["row"])]
+        preceding = (preceding + values)[-periods:]
+    return halos
+
+
 def booleanize_null(scol: Column, f: Callable[..., Column]) -> Column:
     """
     Booleanize Null in Spark Column
@@ -1123,9 +1332,13 @@ class IndexOpsMixin(object, metaclass=ABCMeta):
         Shift Series/Index by desired number of periods.
 
         .. note:: the current implementation of shift uses Spark's Window without
-            specifying partition specification. This leads to moving all data into
-            a single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead with the rows it needs from the
+            neighboring partitions, which are collected for all the columns in a separate
+            job, unless `periods` is larger than 100, the values are not numbers, booleans,
+            strings or dates, or more than 10000 rows are collected for all the columns,
+            i.e. `periods` times the number of partitions for each column.
 
         Parameters
         ----------
@@ -1180,15 +1393,121 @@ class IndexOpsMixin(object, metaclass=ABCMeta):
         if periods == 0:
             return self.copy()
 
-        col = self.spark.column
+        lag_col = self._lag(periods, part_cols=part_cols)
+        col = F.when(lag_col.isNull() | F.isnan(lag_col), fill_value).otherwise(lag_col)
+        return self._with_new_scol(col, field=self._internal.data_fields[0].copy(nullable=True))
+
+    def _lag(self, periods: int, *, part_cols: Sequence["ColumnOrName"] = ()) -> Column:
+        """
+        Return the values `periods` rows before in the natural order, or after if negative.
+
+        Without `part_cols` and on a persisted frame, each partition is computed in parallel
+        with the halo of the `periods` rows before or after it, which are collected from the
+        neighboring partitions in a separate job, see `_PartitionScans`.
+        """
+        scol = self.spark.column
         window = (
             Window.partitionBy(*part_cols)
             .orderBy(NATURAL_ORDER_COLUMN_NAME)
             .rowsBetween(-periods, -periods)
         )
-        lag_col = F.lag(col, periods).over(window)
-        col = F.when(lag_col.isNull() | F.isnan(lag_col), fill_value).otherwise(lag_col)
-        return self._with_new_scol(col, field=self._internal.data_fields[0].copy(nullable=True))
+        if (
+            len(part_cols) > 0
+            or abs(periods) > _MAX_HALO_PERIODS
+            or not isinstance(self.spark.data_type, _SCANNABLE_TYPES)
+        ):
+            return F.lag(scol, periods).over(window)
+
+        halos = _PartitionScans.get(self._internal.spark_frame, ("lag", scol, periods))
+        if halos is None or halos is _PartitionScans.PENDING:
+            # Not persisted, too many partitions to embed their halos, or a placeholder while
+            # recording.
+            return F.lag(scol, periods).over(window)
+        if len(halos) == 0:
+            return F.lit(None).cast(self.spark.data_type)
+
+        ascending = periods > 0
+        periods = abs(periods)
+        partition = _natural_order_partition()
+        halo = F.create_map(
+            *chain(
+                *[
+                    (F.lit(partition_id), F.array(*[F.lit(value) for value in values]))
+                    for partition_id, values in halos.items()
+                ]
+            )
+        )
+        # Keep the natural order in both directions so that the rows are not reordered.
+        window = Window.partitionBy(partition).orderBy(NATURAL_ORDER_COLUMN_NAME)
+        if ascending:
+            row = F.row_number().over(window)
+            lag_col = F.lag(scol, periods).over(window)
+        else:
+            row = (
+                F.count(F.lit(1)).over(Window.partitionBy(partition))
+                - F.row_number().over(window)
+                + 1
+            ).cast("int")
+            lag_col = F.lead(scol, periods).over(window)
+        return (
+            F.when(row <= periods, F.element_at(halo[partition], row))
+            .otherwise(lag_col)
+            .cast(self.spark.data_type)
+        )
+
+    def _scan(
+        self,
+        scol: Column,
+        func: Callable[[Column], Column],
+        combine: Optional[Callable[[Column, Column], Column]],
+        *,
+        part_cols: Sequence["ColumnOrName"] = (),
+        ascending: bool = True,
+    ) -> Column:
+        """
+        Return the cumulative aggregation `func` of `scol` in the natural order, or the reverse
+        if not `ascending`.
+
+        Without `part_cols` and on a persisted frame, `func` is computed within each partition
+        in parallel, and combined by `combine` with the carry of the partition, i.e. `func` of
+        the results of all the partitions before it, which are collected in a separate job, see
+        `_PartitionScans`.
+        """
+        order = F.asc(NATURAL_ORDER_COLUMN_NAME) if ascending else F.desc(NATURAL_ORDER_COLUMN_NAME)
+        window = (
+            Window.orderBy(order)
+            .partitionBy(*part_cols)
+            .rowsBetween(Window.unboundedPreceding, Window.currentRow)
+        )
+        if len(part_cols) > 0 or combine is None:
+            return func(scol).over(window)
+
+        carries = _PartitionScans.get(self._internal.spark_frame, ("scan", scol, func, ascending))
+        if carries is None or carries is _PartitionScans.PENDING:
+            # Not persisted, the carries cannot be embedded as literals, there are too many
+            # partitions, or a placeholder while recording.
+            return func(scol).over(window)
+        carry_type, values = carries
+        if len(values) == 0:
+            return F.lit(None).cast(carry_type)
+
+        partition = _natural_order_partition()
+        carry = F.create_map(
+            *chain(*[(F.lit(partition_id), F.lit(value)) for partition_id, value in values.items()])
+        )[partition].cast(carry_type)
+        # Keep the natural order in both directions so that the rows are not reordered.
+        scan = func(scol).over(
+            Window.partitionBy(partition)
+            .orderBy(NATURAL_ORDER_COLUMN_NAME)
+            .rowsBetween(
+                *(
+                    (Window.unboundedPreceding, Window.currentRow)
+                    if ascending
+                    else (Window.currentRow, Window.unboundedFollowing)
+                )
+            )
+        )
+        return F.coalesce(combine(carry, scan), scan, carry)
 
     # TODO: Update Documentation for Bins Parameter when its supported
     def value_counts(
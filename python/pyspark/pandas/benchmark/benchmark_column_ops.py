@@ -0,0 +1,88 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from pyspark import pandas as ps
+from pyspark.sql import SparkSession
+
+
+def wide_frame(num_columns: int) -> ps.DataFrame:
+    pdf = pd.DataFrame(
+        np.arange(10 * num_columns, dtype="float64").reshape(10, num_columns),
+        columns=["c%d" % i for i in range(num_columns)],
+    )
+    return ps.from_pandas(pdf)
+
+
+def chained_ops(psdf: ps.DataFrame, num_columns: int, num_ops: int) -> None:
+    # A typical feature engineering step: derive a new column from a few existing ones.
+    for i in range(num_ops):
+        psdf["f%d" % i] = (
+            psdf["c%d" % (i % num_columns)]
+            + psdf["c%d" % ((i + 1) % num_columns)] * 2
+            - psdf["c%d" % ((i + 2) % num_columns)]
+        )
+
+
+def benchmark(widths: List[int], num_ops: int) -> None:
+    print(" ==================== chained column arithmetic (millis) ======================")
+    print("ops: %d" % num_ops)
+    for num_columns in widths:
+        psdf = wide_frame(num_columns)
+        # Warm up, which also caches the Series of every column in the DataFrame.
+        chained_ops(psdf, num_columns, 5)
+
+        start_time_ns = time.perf_counter_ns()
+        chained_ops(psdf, num_columns, num_ops)
+        elapsed = (time.perf_counter_ns() - start_time_ns) / 1000 / 1000
+
+        start_time_ns = time.perf_counter_ns()
+        psdf.to_spark(index_col="index").schema
+        analysis = (time.perf_counter_ns() - start_time_ns) / 1000 / 1000
+
+        print("columns: %d" % num_columns)
+        print("  building:\t{:.3f} ({:.3f} per op)".format(elapsed, elapsed / num_ops))
+        print("  analysis:\t{:.3f}".format(analysis))
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/pandas/benchmark/benchmark_column_ops.py <number of ops>`
+
+    The benchmark derives new columns from chained arithmetic of existing ones in DataFrames
+    of increasing width, and reports the time spent on the driver to build them and to
+    analyze the resulting plan. The time per op should not grow with the width.
+    """
+    num_ops = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    spark = SparkSession.builder.master("local[1]").getOrCreate()
+    benchmark([10, 100, 500], num_ops)
+    spark.stop()
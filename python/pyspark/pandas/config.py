@@ -162,6 +162,28 @@ _options: List[Option] = [
             "'compute.shortcut_limit' should be greater than or equal to 0.",
         ),
     ),
+    Option(
+        key="compute.apply_schema_inference",
+        doc=(
+            "This sets how `groupby.apply` and `groupby.transform` infer the return schema when "
+            "the function has no return type hint: 'sample', 'cache' and 'trace'. With 'sample', "
+            "the function is executed on the first rows as many as 'compute.shortcut_limit', "
+            "and if the data is not larger than that, the result is returned as is. With "
+            "'cache', the schema inferred by sampling is reused for the same function code, "
+            "arguments and input schema. With 'trace', the function is executed on a synthetic "
+            "pandas DataFrame with two rows built from the input dtypes first, and falls back to "
+            "sampling if it fails, caching the schema in both cases. With 'cache' and 'trace', "
+            "the function is always computed by PySpark unless the schema is inferred by "
+            "sampling. The global variables the function refers to are not part of the cache "
+            "key, so the cached schema is reused even if they change."
+        ),
+        default="sample",
+        types=str,
+        check_func=(
+            lambda v: v in ("sample", "cache", "trace"),
+            "'compute.apply_schema_inference' should be one of 'sample', 'cache' and 'trace'.",
+        ),
+    ),
     Option(
         key="compute.ops_on_diff_frames",
         doc=(
@@ -220,6 +242,19 @@ _options: List[Option] = [
             "'LOCAL_CHECKPOINT'.",
         ),
     ),
+    Option(
+        key="compute.default_index_reuse",
+        doc=(
+            "This sets whether or not to reuse the distributed-sequence default index attached "
+            "to the same Spark DataFrame, compared by the logical plan. If True, the Spark "
+            "DataFrame with the index is persisted at the storage level of "
+            "'compute.default_index_cache' while any pandas-on-Spark DataFrame refers to it, so "
+            "that frames created from the same Spark DataFrame do not compute the index again. "
+            "Note that the reused data is not refreshed when the underlying data source changes."
+        ),
+        default=False,
+        types=bool,
+    ),
     Option(
         key="compute.ordered_head",
         doc=(
@@ -673,18 +673,24 @@ class DataFrame(Frame, Generic[T]):
         if hasattr(self, "_psseries"):
             psseries = {}
 
+            # All the Series in `self._pssers` anchor `self`, so they share the anchor of the
+            # current InternalFrame and the check is done once instead of for each of them.
+            not_same_anchor = check_same_anchor and not same_anchor(internal, self._internal)
+            # Taken once, since detaching its Series makes `self._pssers` rebuild the dict.
+            old_pssers: Optional[Dict[Label, Series]] = None
+
             for old_label, new_label in zip_longest(
                 self._internal.column_labels, internal.column_labels
             ):
                 if old_label is not None:
-                    psser = self._pssers[old_label]
+                    if old_pssers is None:
+                        old_pssers = self._pssers
+                    psser = old_pssers[old_label]
 
                     renamed = old_label != new_label
-                    not_same_anchor = check_same_anchor and not same_anchor(internal, psser)
 
                     if renamed or not_same_anchor or anchor_force_disconnect:
-                        psdf: DataFrame = DataFrame(self._internal.select_column(old_label))
-                        psser._update_anchor(psdf)
+                        psser._detach_anchor(self._internal)
                         psser = None
                 else:
                     psser = None
@@ -838,6 +844,7 @@ class DataFrame(Frame, Generic[T]):
                 ],
                 index_names=self._internal.index_names,
                 index_fields=self._internal.index_fields,
+                default_index_cache_entry=self._internal._default_index_cache_entry,
             )
             return first_series(DataFrame(internal)).rename(pser.name)
 
@@ -4751,9 +4758,13 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         Shift DataFrame by desired number of periods.
 
         .. note:: the current implementation of shift uses Spark's Window without
-            specifying partition specification. This leads to moving all data into
-            a single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead with the rows it needs from the
+            neighboring partitions, which are collected for all the columns in a separate
+            job, unless `periods` is larger than 100, the values are not numbers, booleans,
+            strings or dates, or more than 10000 rows are collected for all the columns,
+            i.e. `periods` times the number of partitions for each column.
 
         Parameters
         ----------
@@ -4791,7 +4802,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         4    20    23    27
 
         """
-        return self._apply_series_op(
+        return self._apply_series_op_with_scans(
             lambda psser: psser._shift(periods, fill_value), should_resolve=True
         )
 
@@ -4804,9 +4815,13 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         DataFrame (default is the element in the same column of the previous row).
 
         .. note:: the current implementation of diff uses Spark's Window without
-            specifying partition specification. This leads to moving all data into
-            a single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead with the rows it needs from the
+            neighboring partitions, which are collected for all the columns in a separate
+            job, unless `periods` is larger than 100, the values are not numbers, booleans,
+            strings or dates, or more than 10000 rows are collected for all the columns,
+            i.e. `periods` times the number of partitions for each column.
 
         Parameters
         ----------
@@ -4868,7 +4883,9 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
         if axis != 0:
             raise NotImplementedError('axis should be either 0 or "index" currently.')
 
-        return self._apply_series_op(lambda psser: psser._diff(periods), should_resolve=True)
+        return self._apply_series_op_with_scans(
+            lambda psser: psser._diff(periods), should_resolve=True
+        )
 
     # TODO(SPARK-46162): axis should support 1 or 'columns' either at this moment
     def nunique(
@@ -5150,6 +5167,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
                     index_fields=self._internal.index_fields,
                     column_labels=[None],
                     data_spark_columns=[scol_for(sdf, SPARK_DEFAULT_SERIES_NAME)],
+                    default_index_cache_entry=self._internal._default_index_cache_entry,
                 )
             )
         )
@@ -10825,6 +10843,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
             column_labels=list(column_labels),
             data_spark_columns=[scol_for(sdf, col) for col in data_columns],
             column_label_names=column_label_names,
+            default_index_cache_entry=self._internal._default_index_cache_entry,
         )
         psdf: DataFrame = DataFrame(internal)
 
@@ -10986,6 +11005,7 @@ defaultdict(<class 'list'>, {'col..., 'col...})]
                     index_names=list(index_names),
                     index_fields=list(index_fields),
                     column_labels=[None],
+                    default_index_cache_entry=self._internal._default_index_cache_entry,
                 )
             )
         )
@@ -106,6 +106,25 @@ class Frame(object, metaclass=ABCMeta):
     ) -> FrameLike:
         pass
 
+    def _apply_series_op_with_scans(
+        self: FrameLike,
+        op: Callable[["Series"], Union["Series", Column]],
+        should_resolve: bool = False,
+    ) -> FrameLike:
+        """
+        Apply `op` like `_apply_series_op`, collecting the carries and halos that the prefix
+        scans and lags of all the columns need in a single job, see `_PartitionScans`.
+        """
+        from pyspark.pandas.base import _PartitionScans
+
+        scans = _PartitionScans(self._internal.spark_frame)
+        if not scans.has_stable_order():
+            return self._apply_series_op(op, should_resolve=should_resolve)
+        with scans.recording():
+            self._apply_series_op(op)
+        with scans.applying():
+            return self._apply_series_op(op, should_resolve=should_resolve)
+
     @abstractmethod
     def _reduce_for_stat_function(
         self,
@@ -156,9 +175,13 @@ class Frame(object, metaclass=ABCMeta):
         Returns a DataFrame or Series of the same size containing the cumulative minimum.
 
         .. note:: the current implementation of cummin uses Spark's Window without
-            specifying partition specification. This leads to moving all data into a
-            single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead and combined with the min of the
+            preceding partitions, which are collected for all the columns in a separate
+            job, unless the values are not numbers, booleans, strings or dates, or more than
+            10000 values are collected for all the columns, i.e. the number of partitions
+            for each column.
 
         Parameters
         ----------
@@ -206,7 +229,9 @@ class Frame(object, metaclass=ABCMeta):
         2    1.0
         Name: A, dtype: float64
         """
-        return self._apply_series_op(lambda psser: psser._cum(F.min, skipna), should_resolve=True)
+        return self._apply_series_op_with_scans(
+            lambda psser: psser._cum(F.min, skipna, combine=F.least), should_resolve=True
+        )
 
     # TODO: add 'axis' parameter
     def cummax(self: FrameLike, skipna: bool = True) -> FrameLike:
@@ -216,9 +241,13 @@ class Frame(object, metaclass=ABCMeta):
         Returns a DataFrame or Series of the same size containing the cumulative maximum.
 
         .. note:: the current implementation of cummax uses Spark's Window without
-            specifying partition specification. This leads to moving all data into a
-            single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead and combined with the max of the
+            preceding partitions, which are collected for all the columns in a separate
+            job, unless the values are not numbers, booleans, strings or dates, or more than
+            10000 values are collected for all the columns, i.e. the number of partitions
+            for each column.
 
         Parameters
         ----------
@@ -267,7 +296,9 @@ class Frame(object, metaclass=ABCMeta):
         2    1.0
         Name: B, dtype: float64
         """
-        return self._apply_series_op(lambda psser: psser._cum(F.max, skipna), should_resolve=True)
+        return self._apply_series_op_with_scans(
+            lambda psser: psser._cum(F.max, skipna, combine=F.greatest), should_resolve=True
+        )
 
     # TODO: add 'axis' parameter
     def cumsum(self: FrameLike, skipna: bool = True) -> FrameLike:
@@ -277,9 +308,13 @@ class Frame(object, metaclass=ABCMeta):
         Returns a DataFrame or Series of the same size containing the cumulative sum.
 
         .. note:: the current implementation of cumsum uses Spark's Window without
-            specifying partition specification. This leads to moving all data into a
-            single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead and combined with the sum of the
+            preceding partitions, which are collected for all the columns in a separate
+            job, unless the values are not numbers, booleans, strings or dates, or more than
+            10000 values are collected for all the columns, i.e. the number of partitions
+            for each column.
 
         Parameters
         ----------
@@ -328,7 +363,9 @@ class Frame(object, metaclass=ABCMeta):
         2    6.0
         Name: A, dtype: float64
         """
-        return self._apply_series_op(lambda psser: psser._cumsum(skipna), should_resolve=True)
+        return self._apply_series_op_with_scans(
+            lambda psser: psser._cumsum(skipna), should_resolve=True
+        )
 
     # TODO: add 'axis' parameter
     def cumprod(self: FrameLike, skipna: bool = True) -> FrameLike:
@@ -338,9 +375,13 @@ class Frame(object, metaclass=ABCMeta):
         Returns a DataFrame or Series of the same size containing the cumulative product.
 
         .. note:: the current implementation of cumprod uses Spark's Window without
-            specifying partition specification. This leads to moving all data into a
-            single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead and combined with the product of the
+            preceding partitions, which are collected for all the columns in a separate
+            job, unless the values are not numbers, booleans, strings or dates, or more than
+            10000 values are collected for all the columns, i.e. the number of partitions
+            for each column.
 
         .. note:: unlike pandas', pandas-on-Spark's emulates cumulative product by
             ``exp(sum(log(...)))`` trick. Therefore, it only works for positive numbers.
@@ -394,7 +435,9 @@ class Frame(object, metaclass=ABCMeta):
         2    24.0
         Name: A, dtype: float64
         """
-        return self._apply_series_op(lambda psser: psser._cumprod(skipna), should_resolve=True)
+        return self._apply_series_op_with_scans(
+            lambda psser: psser._cumprod(skipna), should_resolve=True
+        )
 
     def pipe(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         r"""
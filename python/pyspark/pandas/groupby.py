@@ -20,7 +20,9 @@ A wrapper for GroupedData to behave like pandas GroupBy.
 """
 from abc import ABCMeta, abstractmethod
 import inspect
-from collections import defaultdict, namedtuple
+from collections import defaultdict, namedtuple, OrderedDict
+import datetime
+import decimal
 from functools import partial
 from itertools import product
 from typing import (
@@ -41,9 +43,15 @@ from typing import (
     TYPE_CHECKING,
 )
 import warnings
+import weakref
 
 import pandas as pd
-from pandas.api.types import is_number, is_hashable, is_list_like  # type: ignore[attr-defined]
+from pandas.api.types import (  # type: ignore[attr-defined]
+    CategoricalDtype,
+    is_number,
+    is_hashable,
+    is_list_like,
+)
 from pandas.core.common import _builtin_table  # type: ignore[attr-defined]
 
 from pyspark.sql import Column, DataFrame as SparkDataFrame, Window, functions as F
@@ -51,11 +59,18 @@ from pyspark.sql.internal import InternalFunction as SF
 from pyspark.sql.types import (
     BooleanType,
     DataType,
+    DateType,
+    DayTimeIntervalType,
+    DecimalType,
     DoubleType,
+    FractionalType,
+    IntegralType,
     NumericType,
     StructField,
     StructType,
     StringType,
+    TimestampNTZType,
+    TimestampType,
 )
 from pyspark import pandas as ps  # For running doctests and reference resolution in PyCharm.
 from pyspark.pandas._typing import Axis, FrameLike, Label, Name
@@ -1170,6 +1185,7 @@ class GroupBy(Generic[FrameLike], metaclass=ABCMeta):
             column_labels=[psser._column_label for psser in agg_columns],
             data_fields=[psser._internal.data_fields[0] for psser in agg_columns],
             column_label_names=self._psdf._internal.column_label_names,
+            default_index_cache_entry=internal._default_index_cache_entry,
         )
 
         agg_column_names = (
@@ -1953,52 +1969,69 @@ class GroupBy(Generic[FrameLike], metaclass=ABCMeta):
         should_return_series = False
 
         if should_infer_schema:
-            # Here we execute with the first 1000 to get the return type.
-            log_advice(
-                "If the type hints is not specified for `groupby.apply`, "
-                "it is expensive to infer the data type internally."
-            )
-            limit = get_option("compute.shortcut_limit")
-            # Ensure sampling rows >= 2 to make sure apply's infer schema is accurate
-            # See related: https://github.com/pandas-dev/pandas/issues/46893
-            sample_limit = limit + 1 if limit else 2
-            pdf = psdf.head(sample_limit)._to_internal_pandas()
-            groupkeys = [
-                pdf[groupkey_name].rename(psser.name)
-                for groupkey_name, psser in zip(groupkey_names, self._groupkeys)
-            ]
-            grouped = pdf.groupby(groupkeys)
-            if is_series_groupby:
-                pser_or_pdf = grouped[name].apply(pandas_apply, *args, **kwargs)
-            else:
-                pser_or_pdf = grouped.apply(pandas_apply, *args, **kwargs)
-            psser_or_psdf = ps.from_pandas(pser_or_pdf.infer_objects())
 
-            if len(pdf) <= limit:
-                if isinstance(psser_or_psdf, ps.Series) and is_series_groupby:
-                    psser_or_psdf = psser_or_psdf.rename(cast(SeriesGroupBy, self)._psser.name)
-                return cast(Union[Series, DataFrame], psser_or_psdf)
+            def apply_to_pandas(pdf: pd.DataFrame) -> Tuple[Any, Union[Series, DataFrame]]:
+                groupkeys = [
+                    pdf[groupkey_name].rename(psser.name)
+                    for groupkey_name, psser in zip(groupkey_names, self._groupkeys)
+                ]
+                grouped = pdf.groupby(groupkeys)
+                if is_series_groupby:
+                    pser_or_pdf = grouped[name].apply(pandas_apply, *args, **kwargs)
+                else:
+                    pser_or_pdf = grouped.apply(pandas_apply, *args, **kwargs)
+                return grouped, ps.from_pandas(pser_or_pdf.infer_objects())
 
-            if len(grouped) <= 1:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("always")
-                    warnings.warn(
-                        "The amount of data for return type inference might not be large enough. "
-                        "Consider increasing an option `compute.shortcut_limit`."
+            schema_inference = get_option("compute.apply_schema_inference")
+            cache_key = (
+                _inferred_schema_key(
+                    "apply-series" if is_series_groupby else "apply", func, args, kwargs, psdf
+                )
+                if schema_inference != "sample"
+                else None
+            )
+            inferred_schema = _get_inferred_schema(cache_key)
+            if inferred_schema is None:
+                psser_or_psdf = None
+                if schema_inference == "trace":
+                    psser_or_psdf = _trace(
+                        psdf, lambda pdf: apply_to_pandas(pdf)[1], groupkey_labels
                     )
 
-            if isinstance(psser_or_psdf, Series):
-                should_return_series = True
-                psdf_from_pandas = psser_or_psdf._psdf
-            else:
-                psdf_from_pandas = cast(DataFrame, psser_or_psdf)
+                if psser_or_psdf is None:
+                    # Here we execute with the first 1000 to get the return type.
+                    log_advice(
+                        "If the type hints is not specified for `groupby.apply`, "
+                        "it is expensive to infer the data type internally."
+                    )
+                    limit = get_option("compute.shortcut_limit")
+                    # Ensure sampling rows >= 2 to make sure apply's infer schema is accurate
+                    # See related: https://github.com/pandas-dev/pandas/issues/46893
+                    sample_limit = limit + 1 if limit else 2
+                    pdf = psdf.head(sample_limit)._to_internal_pandas()
+                    grouped, psser_or_psdf = apply_to_pandas(pdf)
+
+                    if len(pdf) <= limit:
+                        if isinstance(psser_or_psdf, ps.Series) and is_series_groupby:
+                            psser_or_psdf = psser_or_psdf.rename(
+                                cast(SeriesGroupBy, self)._psser.name
+                            )
+                        return cast(Union[Series, DataFrame], psser_or_psdf)
+
+                    if len(grouped) <= 1:
+                        with warnings.catch_warnings():
+                            warnings.simplefilter("always")
+                            warnings.warn(
+                                "The amount of data for return type inference might not be "
+                                "large enough. Consider increasing an option "
+                                "`compute.shortcut_limit`."
+                            )
+                inferred_schema = _InferredSchema(psser_or_psdf)
+                _put_inferred_schema(cache_key, inferred_schema)
 
-            index_fields = [
-                field.normalize_spark_type() for field in psdf_from_pandas._internal.index_fields
-            ]
-            data_fields = [
-                field.normalize_spark_type() for field in psdf_from_pandas._internal.data_fields
-            ]
+            should_return_series = inferred_schema.is_series
+            index_fields = [field.normalize_spark_type() for field in inferred_schema.index_fields]
+            data_fields = [field.normalize_spark_type() for field in inferred_schema.data_fields]
             return_schema = StructType([field.struct_field for field in index_fields + data_fields])
         else:
             return_type = infer_return_type(func)
@@ -2013,7 +2046,7 @@ class GroupBy(Generic[FrameLike], metaclass=ABCMeta):
                 return_schema = return_type.spark_type
                 index_fields = return_type.index_fields
                 should_retain_index = len(index_fields) > 0
-                psdf_from_pandas = None
+                inferred_schema = None
             else:
                 should_return_series = True
                 dtype = cast(Union[SeriesType, ScalarType], return_type).dtype
@@ -2058,9 +2091,9 @@ class GroupBy(Generic[FrameLike], metaclass=ABCMeta):
 
         if should_retain_index:
             # If schema is inferred, we can restore indexes too.
-            if psdf_from_pandas is not None:
-                internal = psdf_from_pandas._internal.with_new_sdf(
-                    spark_frame=sdf, index_fields=index_fields, data_fields=data_fields
+            if inferred_schema is not None:
+                internal = inferred_schema.with_new_sdf(
+                    sdf, index_fields=index_fields, data_fields=data_fields
                 )
             else:
                 index_names: Optional[List[Optional[Tuple[Any, ...]]]] = None
@@ -3082,23 +3115,47 @@ class GroupBy(Generic[FrameLike], metaclass=ABCMeta):
         should_infer_schema = return_sig is None
 
         if should_infer_schema:
-            # Here we execute with the first 1000 to get the return type.
-            # If the records were less than 1000, it uses pandas API directly for a shortcut.
-            log_advice(
-                "If the type hints is not specified for `groupby.transform`, "
-                "it is expensive to infer the data type internally."
+            schema_inference = get_option("compute.apply_schema_inference")
+            cache_key = (
+                _inferred_schema_key("transform", func, args, kwargs, psdf)
+                if schema_inference != "sample"
+                else None
             )
-            limit = get_option("compute.shortcut_limit")
-            pdf = psdf.head(limit + 1)._to_internal_pandas()
-            pdf = pdf.groupby(groupkey_names).transform(func, *args, **kwargs)
-            psdf_from_pandas: DataFrame = DataFrame(pdf)
+            inferred_schema = _get_inferred_schema(cache_key)
+            if inferred_schema is None:
+                psdf_from_pandas = None
+                if schema_inference == "trace":
+                    psdf_from_pandas = _trace(
+                        psdf, lambda pdf: DataFrame(pandas_transform(pdf)), groupkey_labels
+                    )
+
+                if psdf_from_pandas is None:
+                    # Here we execute with the first 1000 to get the return type.
+                    # If the records were less than 1000, it uses pandas API directly for a
+                    # shortcut.
+                    log_advice(
+                        "If the type hints is not specified for `groupby.transform`, "
+                        "it is expensive to infer the data type internally."
+                    )
+                    limit = get_option("compute.shortcut_limit")
+                    pdf = psdf.head(limit + 1)._to_internal_pandas()
+                    pdf = pdf.groupby(groupkey_names).transform(func, *args, **kwargs)
+                    psdf_from_pandas = DataFrame(pdf)
+                    if len(pdf) <= limit:
+                        return self._handle_output(psdf_from_pandas)
+                inferred_schema = _InferredSchema(psdf_from_pandas)
+                _put_inferred_schema(cache_key, inferred_schema)
+
             return_schema = force_decimal_precision_scale(
                 as_nullable_spark_type(
-                    psdf_from_pandas._internal.spark_frame.drop(*HIDDEN_COLUMNS).schema
+                    StructType(
+                        [
+                            field.struct_field
+                            for field in inferred_schema.index_fields + inferred_schema.data_fields
+                        ]
+                    )
                 )
             )
-            if len(pdf) <= limit:
-                return self._handle_output(psdf_from_pandas)
 
             sdf = GroupBy._spark_group_map_apply(
                 psdf,
@@ -3108,14 +3165,10 @@ class GroupBy(Generic[FrameLike], metaclass=ABCMeta):
                 retain_index=True,
             )
             # If schema is inferred, we can restore indexes too.
-            internal = psdf_from_pandas._internal.with_new_sdf(
+            internal = inferred_schema.with_new_sdf(
                 sdf,
-                index_fields=[
-                    field.copy(nullable=True) for field in psdf_from_pandas._internal.index_fields
-                ],
-                data_fields=[
-                    field.copy(nullable=True) for field in psdf_from_pandas._internal.data_fields
-                ],
+                index_fields=[field.copy(nullable=True) for field in inferred_schema.index_fields],
+                data_fields=[field.copy(nullable=True) for field in inferred_schema.data_fields],
             )
         else:
             return_type = infer_return_type(func)
@@ -4588,6 +4641,188 @@ def normalize_keyword_aggregation(
     return aggspec, list(columns), order
 
 
+class _InferredSchema:
+    """
+    The schema of the result of a function given to `GroupBy.apply` or `GroupBy.transform`
+    without return type hints, inferred on sampled or synthetic data, without the data.
+    """
+
+    def __init__(self, psser_or_psdf: Union[Series, DataFrame]):
+        self.is_series = isinstance(psser_or_psdf, Series)
+        internal = psser_or_psdf._internal
+        self.index_names = internal.index_names
+        self.index_fields = internal.index_fields
+        self.column_labels = internal.column_labels
+        self.data_fields = internal.data_fields
+        self.column_label_names = internal.column_label_names
+
+    def with_new_sdf(
+        self,
+        spark_frame: SparkDataFrame,
+        index_fields: List[InternalField],
+        data_fields: List[InternalField],
+    ) -> InternalFrame:
+        """Create an InternalFrame of the result computed by `spark_frame`."""
+        return InternalFrame(
+            spark_frame=spark_frame,
+            index_spark_columns=[
+                scol_for(spark_frame, field.struct_field.name) for field in self.index_fields
+            ],
+            index_names=self.index_names,
+            index_fields=index_fields,
+            column_labels=self.column_labels,
+            data_spark_columns=[
+                scol_for(spark_frame, field.struct_field.name) for field in self.data_fields
+            ],
+            data_fields=data_fields,
+            column_label_names=self.column_label_names,
+        )
+
+
+# The schemas inferred for the functions given to `GroupBy.apply` and `GroupBy.transform`
+# without return type hints, which are reused by `compute.apply_schema_inference`.
+_inferred_schemas: "OrderedDict[Any, _InferredSchema]" = OrderedDict()
+_INFERRED_SCHEMAS_MAX_SIZE = 128
+
+
+def _weak_key(value: Any) -> Any:
+    # A weak reference hashes and compares as its referent while it is alive, so the key does
+    # not keep the objects the function refers to alive, e.g. a DataFrame or `self`.
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return value
+
+
+def _inferred_schema_key(
+    kind: str, func: Callable, args: Tuple, kwargs: Dict[str, Any], psdf: DataFrame
+) -> Optional[Any]:
+    """
+    Return the key of the schema inferred for `func` applied to `psdf` with the given arguments,
+    made of the code of the function with its closure and defaults, the arguments and the
+    metadata of `psdf`, or None if any of them is not hashable.
+
+    The global variables `func` refers to are not part of the key.
+    """
+    internal = psdf._internal
+    try:
+        code = getattr(func, "__code__", None)
+        if code is None:
+            func_key: Any = _weak_key(func)
+        else:
+            func_key = (
+                code,
+                _weak_key(getattr(func, "__self__", None)),
+                tuple(_weak_key(cell.cell_contents) for cell in func.__closure__ or ()),
+                tuple(_weak_key(value) for value in func.__defaults__ or ()),
+                tuple(
+                    (name, _weak_key(value))
+                    for name, value in sorted((func.__kwdefaults__ or {}).items())
+                ),
+            )
+        key = (
+            kind,
+            func_key,
+            tuple(_weak_key(arg) for arg in args),
+            tuple((name, _weak_key(value)) for name, value in sorted(kwargs.items())),
+            tuple(internal.index_names),
+            tuple(internal.column_labels),
+            tuple(internal.column_label_names),
+            tuple(
+                (field.dtype, field.spark_type)
+                for field in internal.index_fields + internal.data_fields
+            ),
+        )
+        hash(key)
+    except (TypeError, ValueError):
+        return None
+    return key
+
+
+def _get_inferred_schema(key: Optional[Any]) -> Optional[_InferredSchema]:
+    if key is None or key not in _inferred_schemas:
+        return None
+    _inferred_schemas.move_to_end(key)
+    return _inferred_schemas[key]
+
+
+def _put_inferred_schema(key: Optional[Any], schema: _InferredSchema) -> None:
+    if key is None:
+        return
+    _inferred_schemas[key] = schema
+    _inferred_schemas.move_to_end(key)
+    while len(_inferred_schemas) > _INFERRED_SCHEMAS_MAX_SIZE:
+        _inferred_schemas.popitem(last=False)
+
+
+def _synthetic_values(field: InternalField, num_values: int) -> Optional[List[Any]]:
+    """
+    Return `num_values` values of the field as collected from Spark, distinct as far as the type
+    allows, or None if unknown.
+    """
+    spark_type = field.spark_type
+    indices = range(num_values)
+    if isinstance(field.dtype, CategoricalDtype):
+        # The codes of the categories.
+        num_categories = len(field.dtype.categories)
+        return [i % num_categories for i in indices] if num_categories > 0 else None
+    elif isinstance(spark_type, BooleanType):
+        return [i % 2 == 0 for i in indices]
+    elif isinstance(spark_type, IntegralType):
+        return [i + 1 for i in indices]
+    elif isinstance(spark_type, DecimalType):
+        return [decimal.Decimal(i + 1) for i in indices]
+    elif isinstance(spark_type, FractionalType):
+        return [float(i + 1) for i in indices]
+    elif isinstance(spark_type, StringType):
+        return [chr(ord("a") + i % 26) for i in indices]
+    elif isinstance(spark_type, DateType):
+        return [datetime.date(1970, 1, 1) + datetime.timedelta(i) for i in indices]
+    elif isinstance(spark_type, (TimestampType, TimestampNTZType)):
+        return [datetime.datetime(1970, 1, 1) + datetime.timedelta(i) for i in indices]
+    elif isinstance(spark_type, DayTimeIntervalType):
+        return [datetime.timedelta(i) for i in indices]
+    else:
+        return None
+
+
+def _trace(
+    psdf: DataFrame,
+    func: Callable[[pd.DataFrame], Union[Series, DataFrame]],
+    groupkey_labels: List[Label],
+) -> Optional[Union[Series, DataFrame]]:
+    """
+    Return the result of `func` on a pandas DataFrame with four rows of synthetic values of the
+    dtypes of `psdf`, in two groups of two rows, or None if it cannot be built or `func` fails
+    on it.
+
+    Each group has more than one row, as pandas returns a different shape for some functions
+    when all the groups have a single row, see https://github.com/pandas-dev/pandas/issues/46893.
+    """
+    internal = psdf._internal
+    columns = {}
+    for column, label, field in zip(
+        internal.index_spark_column_names + internal.data_spark_column_names,
+        [None] * internal.index_level + internal.column_labels,
+        internal.index_fields + internal.data_fields,
+    ):
+        values = _synthetic_values(field, 4)
+        if values is None:
+            return None
+        if label in groupkey_labels:
+            # The same group key values in the first two rows and in the last two rows.
+            values = [values[0], values[0], values[1], values[1]]
+        columns[column] = values
+    try:
+        pdf = InternalFrame.restore_index(
+            pd.DataFrame(columns), **internal.arguments_for_restore_index
+        )
+        result = func(pdf)
+    except Exception:
+        return None
+    return result if len(result) > 0 else None
+
+
 def _test() -> None:
     import os
     import doctest
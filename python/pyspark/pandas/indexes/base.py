@@ -163,6 +163,7 @@ class Index(IndexOpsMixin):
                 column_labels=[],
                 data_spark_columns=[],
                 data_fields=[],
+                default_index_cache_entry=data._internal._default_index_cache_entry,
             )
             return DataFrame(internal).index
         elif isinstance(data, Index):
@@ -833,6 +834,7 @@ class Index(IndexOpsMixin):
                 scol_for(sdf, col) for col in self._internal.index_spark_column_names
             ],
             index_names=self._internal.index_names,
+            default_index_cache_entry=self._internal._default_index_cache_entry,
         )
         return DataFrame(internal).index
 
@@ -1010,6 +1012,7 @@ class Index(IndexOpsMixin):
             column_labels=names,
             data_spark_columns=self._internal.index_spark_columns,
             data_fields=self._internal.index_fields,
+            default_index_cache_entry=self._internal._default_index_cache_entry,
         )
         return DataFrame(internal)
 
@@ -1152,6 +1155,7 @@ class Index(IndexOpsMixin):
             ],
             index_names=self._internal.index_names,
             index_fields=self._internal.index_fields,
+            default_index_cache_entry=self._internal._default_index_cache_entry,
         )
         return DataFrame(internal).index
 
@@ -1240,6 +1244,7 @@ class Index(IndexOpsMixin):
             column_labels=[],
             data_spark_columns=[],
             data_fields=[],
+            default_index_cache_entry=internal._default_index_cache_entry,
         )
         return DataFrame(internal).index
 
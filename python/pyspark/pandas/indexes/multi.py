@@ -542,6 +542,7 @@ class MultiIndex(Index):
             ],
             index_names=self._internal.index_names,
             index_fields=self._internal.index_fields,
+            default_index_cache_entry=self._internal._default_index_cache_entry,
         )
 
         return first_series(DataFrame(internal))
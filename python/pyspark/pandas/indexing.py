@@ -558,6 +558,7 @@ class LocIndexerLike(IndexerLike, metaclass=ABCMeta):
             data_spark_columns=data_spark_columns,
             data_fields=data_fields,
             column_label_names=column_label_names,
+            default_index_cache_entry=self._internal._default_index_cache_entry,
         )
         psdf = DataFrame(internal)
 
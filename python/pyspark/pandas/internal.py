@@ -19,13 +19,16 @@
 An internal immutable DataFrame with some metadata to manage indexes.
 """
 import re
+import threading
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING, cast
+import weakref
 
 import numpy as np
 import pandas as pd
 from pandas.api.types import CategoricalDtype  # noqa: F401
 
 from pyspark._globals import _NoValue, _NoValueType
+from pyspark.storagelevel import StorageLevel
 from pyspark.sql import (
     functions as F,
     Column as PySparkColumn,
@@ -215,6 +218,89 @@ class InternalField:
         )
 
 
+class _DefaultIndexCacheEntry:
+    """
+    A Spark DataFrame with the distributed-sequence default index attached, which is persisted
+    while any InternalFrame refers to this entry and unpersisted when it is garbage-collected.
+    """
+
+    def __init__(self, source: PySparkDataFrame, spark_frame: PySparkDataFrame, storage_level: str):
+        self.source = source
+        self.spark_frame = spark_frame
+        self.storage_level = storage_level
+        if storage_level != "LOCAL_CHECKPOINT":
+            # Not at exit, where the JVM or the server is shut down with the session anyway.
+            weakref.finalize(self, _DefaultIndexCacheEntry._unpersist, spark_frame).atexit = False
+
+    @staticmethod
+    def _unpersist(spark_frame: PySparkDataFrame) -> None:
+        # Called by the garbage collector, which can run after the session is stopped.
+        session = spark_frame.sparkSession
+        if is_remote():
+            stopped = session.is_stopped  # type: ignore[attr-defined]
+        else:
+            stopped = session.sparkContext._jsc is None
+        if not stopped:
+            spark_frame.unpersist()
+
+
+class _DefaultIndexCache:
+    """
+    The distributed-sequence default indexes attached to Spark DataFrames, keyed by the semantic
+    hash of their logical plans, so that the index of the same Spark DataFrame is computed once.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, "weakref.WeakSet[_DefaultIndexCacheEntry]"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.rebuilds = 0
+
+    def get_or_attach(self, sdf: PySparkDataFrame, storage_level: str) -> _DefaultIndexCacheEntry:
+        key = sdf.semanticHash()
+        with self._lock:
+            for entry in self._entries.get(key, ()):
+                if entry.storage_level == storage_level and entry.source.sameSemantics(sdf):
+                    self.hits += 1
+                    return entry
+
+            spark_frame = InternalFrame.attach_default_index(
+                sdf, default_index_type="distributed-sequence"
+            )
+            if storage_level == "LOCAL_CHECKPOINT":
+                spark_frame = spark_frame.localCheckpoint(eager=False)
+            else:
+                # The storage levels in Python are serialized, e.g. MEMORY_ONLY is MEMORY_ONLY_SER.
+                spark_frame = spark_frame.persist(
+                    getattr(StorageLevel, storage_level.replace("_SER", ""))
+                )
+            entry = _DefaultIndexCacheEntry(sdf, spark_frame, storage_level)
+            self._entries.setdefault(key, weakref.WeakSet()).add(entry)
+            self.rebuilds += 1
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            for entries in self._entries.values():
+                for entry in entries:
+                    if entry.storage_level != "LOCAL_CHECKPOINT":
+                        entry.spark_frame.unpersist()
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            for key in [key for key, entries in self._entries.items() if len(entries) == 0]:
+                del self._entries[key]
+            return {
+                "entries": sum(len(entries) for entries in self._entries.values()),
+                "hits": self.hits,
+                "rebuilds": self.rebuilds,
+            }
+
+
+_default_index_cache = _DefaultIndexCache()
+
+
 class InternalFrame:
     """
     The internal immutable DataFrame which manages Spark DataFrame and column names and index
@@ -543,6 +629,8 @@ class InternalFrame:
         data_spark_columns: Optional[List[PySparkColumn]] = None,
         data_fields: Optional[List[InternalField]] = None,
         column_label_names: Optional[List[Optional[Label]]] = None,
+        *,
+        default_index_cache_entry: Optional[_DefaultIndexCacheEntry] = None,
     ):
         """
         Create a new internal immutable DataFrame to manage Spark DataFrame, column fields and
@@ -563,6 +651,9 @@ class InternalFrame:
         :param data_fields: list of InternalField
                             the InternalFields for the data columns
         :param column_label_names: Names for each of the column index levels.
+        :param default_index_cache_entry: the reused default index which `spark_frame` is
+                                          derived from, kept persisted while this frame is
+                                          alive.
 
         See the examples below to refer what each parameter means.
 
@@ -638,7 +729,9 @@ class InternalFrame:
             )
 
             # Create default index.
-            spark_frame = InternalFrame.attach_default_index(spark_frame)
+            spark_frame, entry = InternalFrame._attach_default_index_with_cache(spark_frame)
+            if entry is not None:
+                default_index_cache_entry = entry
             index_spark_columns = [scol_for(spark_frame, SPARK_DEFAULT_INDEX_NAME)]
 
             index_fields = [
@@ -664,6 +757,12 @@ class InternalFrame:
                         for field, struct_field in zip(data_fields, data_struct_fields)
                     ]
 
+        # Keep the reused default index persisted while this frame or the frames derived from it
+        # are alive.
+        self._default_index_cache_entry: Optional[
+            _DefaultIndexCacheEntry
+        ] = default_index_cache_entry
+
         if NATURAL_ORDER_COLUMN_NAME not in spark_frame.columns:
             spark_frame = spark_frame.withColumn(
                 NATURAL_ORDER_COLUMN_NAME, F.monotonically_increasing_id()
@@ -900,6 +999,43 @@ class InternalFrame:
                 " 'distributed-sequence' and 'distributed'"
             )
 
+    @staticmethod
+    def _attach_default_index_with_cache(
+        sdf: PySparkDataFrame,
+    ) -> Tuple[PySparkDataFrame, Optional[_DefaultIndexCacheEntry]]:
+        """
+        Attach the default index as `attach_default_index` does. If `compute.default_index_reuse`
+        is set and the default index type is 'distributed-sequence', the index attached to the
+        same Spark DataFrame before is reused, and the entry keeping it is returned.
+        """
+        default_index_type = ps.get_option("compute.default_index_type")
+        if default_index_type != "distributed-sequence":
+            return InternalFrame.attach_default_index(sdf, default_index_type), None
+
+        storage_level = ps.get_option("compute.default_index_cache")
+        if not ps.get_option("compute.default_index_reuse") or storage_level == "NONE":
+            _default_index_cache.rebuilds += 1
+            return InternalFrame.attach_default_index(sdf, default_index_type), None
+
+        entry = _default_index_cache.get_or_attach(sdf, storage_level)
+        return entry.spark_frame, entry
+
+    @staticmethod
+    def clear_default_index_cache() -> None:
+        """
+        Unpersist all the distributed-sequence default indexes kept for reuse by
+        `compute.default_index_reuse`. The frames referring to them compute them again if needed.
+        """
+        _default_index_cache.clear()
+
+    @staticmethod
+    def default_index_cache_metrics() -> Dict[str, int]:
+        """
+        Return the number of the distributed-sequence default indexes kept for reuse, and how many
+        times a default index was reused or rebuilt, i.e. computed for a new frame.
+        """
+        return _default_index_cache.metrics()
+
     @staticmethod
     def attach_sequence_column(sdf: PySparkDataFrame, column_name: str) -> PySparkDataFrame:
         sequential_index = (
@@ -1444,6 +1580,7 @@ class InternalFrame:
             data_spark_columns=cast(Optional[List[PySparkColumn]], data_spark_columns),
             data_fields=cast(Optional[List[InternalField]], data_fields),
             column_label_names=cast(Optional[List[Optional[Label]]], column_label_names),
+            default_index_cache_entry=self._default_index_cache_entry,
         )
 
     @staticmethod
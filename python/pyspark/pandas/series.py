@@ -462,6 +462,10 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
 
     @property
     def _psdf(self) -> DataFrame:
+        if self._anchor is None:
+            internal = self._detached_internal
+            del self._detached_internal
+            self._update_anchor(DataFrame(internal.select_column(self._column_label)))
         return self._anchor
 
     @property
@@ -480,6 +484,17 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         self._anchor = psdf
         object.__setattr__(psdf, "_psseries", {self._column_label: self})
 
+    def _detach_anchor(self, internal: InternalFrame) -> None:
+        """
+        Disconnect the Series from its anchor.
+
+        The new anchor is created from the given InternalFrame of the original anchor only
+        when the Series is used, so that updating a DataFrame does not have to create one for
+        every Series of it.
+        """
+        self._anchor = None  # type: ignore[assignment]
+        self._detached_internal = internal
+
     def _with_new_scol(
         self, scol: PySparkColumn, *, field: Optional[InternalField] = None
     ) -> "Series":
@@ -4269,9 +4284,13 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         DataFrame (default is the element in the same column of the previous row).
 
         .. note:: the current implementation of diff uses Spark's Window without
-            specifying partition specification. This leads to moving all data into
-            a single partition in a single machine and could cause serious
-            performance degradation. Avoid this method with very large datasets.
+            specifying partition specification, which moves all data into a single
+            partition. If the DataFrame is cached, see :meth:`DataFrame.spark.cache`, each
+            partition is computed in parallel instead with the rows it needs from the
+            neighboring partitions, which are collected for all the columns in a separate
+            job, unless `periods` is larger than 100, the values are not numbers, booleans,
+            strings or dates, or more than 10000 rows are collected for all the columns,
+            i.e. `periods` times the number of partitions for each column.
 
         Parameters
         ----------
@@ -4332,12 +4351,7 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
     def _diff(self, periods: int, *, part_cols: Sequence["ColumnOrName"] = ()) -> "Series":
         if not isinstance(periods, int):
             raise TypeError("periods should be an int; however, got [%s]" % type(periods).__name__)
-        window = (
-            Window.partitionBy(*part_cols)
-            .orderBy(NATURAL_ORDER_COLUMN_NAME)
-            .rowsBetween(-periods, -periods)
-        )
-        scol = self.spark.column - F.lag(self.spark.column, periods).over(window)
+        scol = self.spark.column - self._lag(periods, part_cols=part_cols)
         return self._with_new_scol(scol, field=self._internal.data_fields[0].copy(nullable=True))
 
     def idxmax(self, skipna: bool = True) -> Union[Tuple, Any]:
@@ -6619,6 +6633,7 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
             data_spark_columns=[scol_for(sdf, this_column_label), scol_for(sdf, that_column_label)],
             data_fields=[this_field, that_field],
             column_label_names=[None],
+            default_index_cache_entry=combined._internal._default_index_cache_entry,
         )
         return DataFrame(internal)
 
@@ -6904,21 +6919,13 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
         skipna: bool,
         part_cols: Sequence["ColumnOrName"] = (),
         ascending: bool = True,
+        *,
+        combine: Optional[Callable[[PySparkColumn, PySparkColumn], PySparkColumn]] = None,
     ) -> "Series":
         # This is used to cummin, cummax, cumsum, etc.
-
-        if ascending:
-            window = (
-                Window.orderBy(F.asc(NATURAL_ORDER_COLUMN_NAME))
-                .partitionBy(*part_cols)
-                .rowsBetween(Window.unboundedPreceding, Window.currentRow)
-            )
-        else:
-            window = (
-                Window.orderBy(F.desc(NATURAL_ORDER_COLUMN_NAME))
-                .partitionBy(*part_cols)
-                .rowsBetween(Window.unboundedPreceding, Window.currentRow)
-            )
+        #
+        # With `combine`, which combines the results of `func` of two consecutive ranges, the
+        # partitions are scanned in parallel unless `part_cols` are given.
 
         if skipna:
             # There is a behavior difference between pandas and PySpark. In case of cummax,
@@ -6951,7 +6958,11 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
                 # Manually sets nulls given the column defined above.
                 self.spark.column.isNull(),
                 F.lit(None),
-            ).otherwise(func(self.spark.column).over(window))
+            ).otherwise(
+                self._scan(
+                    self.spark.column, func, combine, part_cols=part_cols, ascending=ascending
+                )
+            )
         else:
             # Here, we use two Windows.
             # One for real data.
@@ -6984,10 +6995,20 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
             # 4  5.0  9.0
             scol = F.when(
                 # By going through with max, it sets True after the first time it meets null.
-                F.max(self.spark.column.isNull()).over(window),
+                self._scan(
+                    self.spark.column.isNull(),
+                    F.max,
+                    None if combine is None else F.greatest,
+                    part_cols=part_cols,
+                    ascending=ascending,
+                ),
                 # Manually sets nulls given the column defined above.
                 F.lit(None),
-            ).otherwise(func(self.spark.column).over(window))
+            ).otherwise(
+                self._scan(
+                    self.spark.column, func, combine, part_cols=part_cols, ascending=ascending
+                )
+            )
 
         return self._with_new_scol(scol)
 
@@ -7002,7 +7023,7 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
                     psser.spark.data_type.simpleString(),
                 )
             )
-        return psser._cum(F.sum, skipna, part_cols)
+        return psser._cum(F.sum, skipna, part_cols, combine=lambda x, y: x + y)
 
     def _cumprod(self, skipna: bool, part_cols: Sequence["ColumnOrName"] = ()) -> "Series":
         psser = self
@@ -7015,7 +7036,9 @@ class Series(Frame, IndexOpsMixin, Generic[T]):
                     psser.spark.data_type.simpleString(),
                 )
             )
-        return psser._cum(lambda c: SF.product(c, skipna), skipna, part_cols)
+        return psser._cum(
+            lambda c: SF.product(c, skipna), skipna, part_cols, combine=lambda x, y: x * y
+        )
 
     # ----------------------------------------------------------------------
     # Accessor Methods
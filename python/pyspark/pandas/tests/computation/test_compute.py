@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -211,6 +212,34 @@ class FrameComputeMixin:
 
         self.assert_eq(pdf.diff(), psdf.diff())
 
+    def test_shift_and_diff_across_partitions(self):
+        pdf = pd.DataFrame(
+            {
+                "a": [float(i % 7) if i % 5 else None for i in range(50)],
+                "b": list(range(50)),
+                "c": ["a", "b", "c", "d", "e"] * 10,
+            }
+        )
+        psdf = ps.from_pandas(pdf)
+        num_partitions = psdf.to_spark().rdd.getNumPartitions()
+        self.assertGreater(num_partitions, 1)
+
+        # The halos are only collected for persisted frames, whose order is the same in every job.
+        with mock.patch("pyspark.pandas.base._PartitionScans._collect") as collect:
+            self.assert_eq(pdf.shift(1), psdf.shift(1))
+            self.assert_eq(pdf.a.diff(1), psdf.a.diff(1))
+            collect.assert_not_called()
+
+        # Without embedding the halos of all the columns, i.e. with too many partitions.
+        with psdf.spark.cache() as cached:
+            for max_literals in [10000, num_partitions, 0]:
+                with mock.patch("pyspark.pandas.base._MAX_PARTITION_LITERALS", max_literals):
+                    for periods in [1, 3, -20]:
+                        self.assert_eq(pdf.shift(periods), cached.shift(periods))
+                        self.assert_eq(
+                            pdf[["a", "b"]].diff(periods), cached[["a", "b"]].diff(periods)
+                        )
+
     def test_pct_change(self):
         pdf = pd.DataFrame(
             {"a": [1, 2, 3, 2], "b": [4.0, 2.0, 3.0, 1.0], "c": [300, 200, 400, 200]},
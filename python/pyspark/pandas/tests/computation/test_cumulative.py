@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -109,6 +110,36 @@ class FrameCumulativeMixin:
         psdf = ps.from_pandas(pdf)
         self._test_cumprod(pdf, psdf)
 
+    def test_cumulative_across_partitions(self):
+        pdf = pd.DataFrame(
+            {
+                "A": [[0.5, 2.0, -1.0, 1.5][i % 4] if i % 7 else None for i in range(1, 50)],
+                "B": [float(i % 5) if i % 9 else None for i in range(1, 50)],
+                "C": list(range(1, 50)),
+            }
+        )
+        psdf = ps.from_pandas(pdf)
+        num_partitions = psdf.to_spark().rdd.getNumPartitions()
+        self.assertGreater(num_partitions, 1)
+
+        # The carries are only collected for persisted frames, whose order is the same in every
+        # job, unlike after a shuffle.
+        with mock.patch("pyspark.pandas.base._PartitionScans._collect") as collect:
+            self.assert_eq(pdf.cumsum(), psdf.cumsum())
+            self.assert_eq(pdf.A.cummax(), psdf.A.cummax())
+            collect.assert_not_called()
+
+        # Without embedding the carries of all the columns, i.e. with too many partitions.
+        shuffled = (pdf.sort_values("C", ascending=False), psdf.sort_values("C", ascending=False))
+        for pdf_, psdf_ in [(pdf, psdf), shuffled]:
+            with psdf_.spark.cache() as cached:
+                for max_literals in [10000, num_partitions, 0]:
+                    with mock.patch("pyspark.pandas.base._MAX_PARTITION_LITERALS", max_literals):
+                        for skipna in [True, False]:
+                            self.assert_eq(pdf_.cummin(skipna=skipna), cached.cummin(skipna=skipna))
+                            self.assert_eq(pdf_.cummax(skipna=skipna), cached.cummax(skipna=skipna))
+                            self.assert_eq(pdf_.cumsum(skipna=skipna), cached.cumsum(skipna=skipna))
+
 
 class FrameCumulativeTests(
     FrameCumulativeMixin,
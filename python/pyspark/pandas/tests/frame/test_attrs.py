@@ -187,6 +187,28 @@ class FrameAttrsMixin:
         self.assert_eq(psdf, pdf)
         self.assert_eq(psser, pser)
 
+    def test_inplace_detached_series(self):
+        pdf = pd.DataFrame({"c%d" % i: range(i, i + 5) for i in range(10)})
+        psdf = ps.from_pandas(pdf)
+
+        psers = [psdf["c%d" % i] for i in range(10)]
+        for i in range(10):
+            psdf["n%d" % i] = psdf["c%d" % i] + psdf["c%d" % ((i + 1) % 10)] * 2
+            pdf["n%d" % i] = pdf["c%d" % i] + pdf["c%d" % ((i + 1) % 10)] * 2
+        psdf["c0"] = psdf["c0"] - 1
+        pdf["c0"] = pdf["c0"] - 1
+
+        # The Series taken before the updates are not materialized until they are used.
+        self.assertTrue(all(psser._anchor is None for psser in psers))
+        self.assert_eq(psdf, pdf)
+        for i, psser in enumerate(psers):
+            self.assert_eq(psser, pdf["c%d" % i] + (1 if i == 0 else 0))
+            self.assert_eq(psser + psser, (pdf["c%d" % i] + (1 if i == 0 else 0)) * 2)
+            self.assertIsNotNone(psser._anchor)
+
+        psers[1].fillna(0, inplace=True)
+        self.assert_eq(psdf, pdf)
+
     def test_dataframe_multiindex_columns(self):
         pdf = pd.DataFrame(
             {
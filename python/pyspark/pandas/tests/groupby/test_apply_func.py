@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import gc
 import unittest
+import weakref
 
 import numpy as np
 import pandas as pd
@@ -26,6 +28,9 @@ from pyspark.testing.sqlutils import SQLTestUtils
 
 
 class GroupbyApplyFuncMixin:
+    # Counts the calls of the applied function made on the driver side.
+    driver_calls = 0
+
     def test_apply(self):
         pdf = pd.DataFrame(
             {"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 3, 5, 8], "c": [1, 4, 9, 16, 25, 36]},
@@ -126,6 +131,87 @@ class GroupbyApplyFuncMixin:
         with option_context("compute.shortcut_limit", 0):
             self.test_apply()
 
+    def test_apply_with_schema_inference(self):
+        for schema_inference in ["cache", "trace"]:
+            with option_context("compute.apply_schema_inference", schema_inference):
+                self.test_apply()
+                self.test_apply_return_series()
+                # with the inferred schemas reused
+                self.test_apply()
+
+    def test_apply_inferred_schema_cache(self):
+        pdf = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 3, 5, 8]})
+        psdf = ps.from_pandas(pdf)
+
+        def plus_min(x):
+            GroupbyApplyFuncMixin.driver_calls += 1
+            return x + x.min()
+
+        with option_context("compute.apply_schema_inference", "cache", "compute.shortcut_limit", 0):
+            expected = pdf.groupby("b").apply(plus_min).sort_index()
+            GroupbyApplyFuncMixin.driver_calls = 0
+            self.assert_eq(psdf.groupby("b").apply(plus_min).sort_index(), expected)
+            self.assertGreater(GroupbyApplyFuncMixin.driver_calls, 0)
+
+            # The schema is reused without executing the function on the driver side.
+            expected = (pdf + 1).groupby("b").apply(plus_min).sort_index()
+            GroupbyApplyFuncMixin.driver_calls = 0
+            self.assert_eq((psdf + 1).groupby("b").apply(plus_min).sort_index(), expected)
+            self.assertEqual(GroupbyApplyFuncMixin.driver_calls, 0)
+
+            # A different input schema infers the schema again.
+            expected = (pdf / 2).groupby("b").apply(plus_min).sort_index()
+            GroupbyApplyFuncMixin.driver_calls = 0
+            self.assert_eq((psdf / 2).groupby("b").apply(plus_min).sort_index(), expected)
+            self.assertGreater(GroupbyApplyFuncMixin.driver_calls, 0)
+
+    def test_apply_inferred_schema_cache_references(self):
+        from pyspark.pandas.groupby import _inferred_schemas
+
+        class Offset:
+            value = 1
+
+        pdf = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 3, 5, 8]})
+        psdf = ps.from_pandas(pdf)
+
+        def plus(offset):
+            return lambda x: x + offset.value
+
+        offset = Offset()
+        plus_offset = plus(offset)
+        with option_context("compute.apply_schema_inference", "cache", "compute.shortcut_limit", 0):
+            self.assert_eq(
+                psdf.groupby("b").apply(plus_offset).sort_index(),
+                pdf.groupby("b").apply(plus_offset).sort_index(),
+            )
+
+        # The cache keeps neither the data the schema is inferred from nor the closure.
+        for schema in _inferred_schemas.values():
+            for value in vars(schema).values():
+                self.assertNotIsInstance(value, (ps.DataFrame, ps.Series))
+        offset_ref = weakref.ref(offset)
+        del offset, plus_offset
+        gc.collect()
+        self.assertIsNone(offset_ref())
+
+    def test_apply_inferred_schema_trace_groups(self):
+        pdf = pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 3, 5, 8]})
+        psdf = ps.from_pandas(pdf)
+        group_sizes = []
+
+        def minus_mean(x):
+            group_sizes.append(len(x))
+            return x - x.mean()
+
+        expected = pdf.groupby("b").apply(minus_mean).sort_index()
+        group_sizes.clear()
+        with option_context("compute.apply_schema_inference", "trace", "compute.shortcut_limit", 0):
+            self.assert_eq(psdf.groupby("b").apply(minus_mean).sort_index(), expected)
+
+        # The function is traced on groups of more than one row, see pandas-dev/pandas#46893.
+        self.assertGreater(len(group_sizes), 0)
+        self.assertTrue(all(size > 1 for size in group_sizes), group_sizes)
+
     def test_apply_with_type_hint(self):
         pdf = pd.DataFrame(
             {"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 3, 5, 8], "c": [1, 4, 9, 16, 25, 36]},
@@ -417,6 +503,13 @@ class GroupbyApplyFuncMixin:
         with option_context("compute.shortcut_limit", 0):
             self.test_transform()
 
+    def test_transform_with_schema_inference(self):
+        for schema_inference in ["cache", "trace"]:
+            with option_context("compute.apply_schema_inference", schema_inference):
+                self.test_transform()
+                # with the inferred schemas reused
+                self.test_transform()
+
     def test_filter(self):
         pdf = pd.DataFrame(
             {"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 3, 5, 8], "c": [1, 4, 9, 16, 25, 36]},
@@ -156,6 +156,23 @@ class SeriesComputeMixin:
         self.assert_eq(psser.diff().diff(-1), pser.diff().diff(-1))
         self.assert_eq(psser.diff().sum(), pser.diff().sum())
 
+    def test_shift_and_diff_across_partitions(self):
+        pser = pd.Series([float(i % 7) if i % 5 else None for i in range(50)], name="x")
+        # The halos are only collected for persisted frames.
+        with ps.from_pandas(pser.to_frame()).spark.cache() as cached:
+            psser = cached.x
+            self.assertGreater(cached.to_spark().rdd.getNumPartitions(), 1)
+
+            for periods in [1, 3, 20, -1, -20, 60, 200]:
+                self.assert_eq(psser.shift(periods), pser.shift(periods))
+                self.assert_eq(psser.diff(periods), pser.diff(periods))
+
+        pser = pd.Series(["a", "b", "c", "d", "e"] * 10, name="x")
+        with ps.from_pandas(pser.to_frame()).spark.cache() as cached:
+            psser = cached.x
+            self.assert_eq(psser.shift(12), pser.shift(12))
+            self.assert_eq(psser.shift(-12), pser.shift(-12))
+
     def test_aggregate(self):
         pser = pd.Series([10, 20, 15, 30, 45], name="x")
         psser = ps.Series(pser)
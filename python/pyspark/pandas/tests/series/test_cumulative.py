@@ -113,6 +113,29 @@ class SeriesCumulativeMixin:
         with self.assertRaisesRegex(TypeError, r"Could not convert object \(string\) to numeric"):
             ps.Series(["a", "b", "c", "d"]).cumprod()
 
+    def test_cumulative_across_partitions(self):
+        pser = pd.Series(
+            [[0.5, 2.0, -1.0, 1.5][i % 4] if i % 7 else None for i in range(1, 50)], name="x"
+        )
+        # The carries are only collected for persisted frames.
+        with ps.from_pandas(pser.to_frame()).spark.cache() as cached:
+            psser = cached.x
+            self.assertGreater(cached.to_spark().rdd.getNumPartitions(), 1)
+
+            for skipna in [True, False]:
+                self.assert_eq(pser.cummin(skipna=skipna), psser.cummin(skipna=skipna))
+                self.assert_eq(pser.cummax(skipna=skipna), psser.cummax(skipna=skipna))
+                self.assert_eq(pser.cumsum(skipna=skipna), psser.cumsum(skipna=skipna))
+                self.assert_eq(
+                    pser.cumprod(skipna=skipna), psser.cumprod(skipna=skipna), almost=True
+                )
+
+        pser = pd.Series(["b", "c", "a", "d", "e"] * 10, name="x")
+        with ps.from_pandas(pser.to_frame()).spark.cache() as cached:
+            psser = cached.x
+            self.assert_eq(pser.cummin(), psser.cummin())
+            self.assert_eq(pser.cummax(), psser.cummax())
+
 
 class SeriesCumulativeTests(
     SeriesCumulativeMixin,
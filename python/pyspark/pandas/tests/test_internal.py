@@ -15,10 +15,15 @@
 # limitations under the License.
 #
 
+import gc
+from unittest import mock
+
 import pandas as pd
 
+from pyspark import pandas as ps
 from pyspark.sql.types import LongType, StructType, StructField
 from pyspark.pandas.internal import (
+    _DefaultIndexCacheEntry,
     InternalFrame,
     SPARK_DEFAULT_INDEX_NAME,
     SPARK_INDEX_NAME_FORMAT,
@@ -133,6 +138,70 @@ class InternalFrameTestsMixin:
             StructType([StructField("index", LongType(), False)]),
         )
 
+    def test_default_index_reuse(self):
+        with ps.option_context("compute.default_index_reuse", True):
+            InternalFrame.clear_default_index_cache()
+            metrics = InternalFrame.default_index_cache_metrics()
+
+            psdf1 = ps.DataFrame(self.spark.range(10, numPartitions=3))
+            psdf2 = ps.DataFrame(self.spark.range(10, numPartitions=3))
+            psdf3 = ps.DataFrame(self.spark.range(20, numPartitions=3))
+            self.assert_eq(psdf2, pd.DataFrame({"id": range(10)}))
+            self.assert_eq(psdf3.id + 1, pd.Series(range(1, 21), name="id"))
+
+            new_metrics = InternalFrame.default_index_cache_metrics()
+            self.assertEqual(new_metrics["entries"], 2)
+            self.assertEqual(new_metrics["hits"] - metrics["hits"], 1)
+            self.assertEqual(new_metrics["rebuilds"] - metrics["rebuilds"], 2)
+
+            # The index is kept while any frame derived from the same Spark DataFrame is alive.
+            cached = psdf1._internal._default_index_cache_entry.spark_frame
+            self.assertTrue(cached.is_cached)
+            psser = psdf2.id * 2
+            del psdf1, psdf2
+            gc.collect()
+            self.assertTrue(cached.is_cached)
+            del psser
+            gc.collect()
+            self.assertFalse(cached.is_cached)
+            self.assertEqual(InternalFrame.default_index_cache_metrics()["entries"], 1)
+
+            InternalFrame.clear_default_index_cache()
+            self.assertEqual(InternalFrame.default_index_cache_metrics()["entries"], 0)
+            self.assert_eq(psdf3.id + 1, pd.Series(range(1, 21), name="id"))
+
+    def test_default_index_reuse_derived_frames(self):
+        with ps.option_context("compute.default_index_reuse", True):
+            InternalFrame.clear_default_index_cache()
+            psdf = ps.DataFrame(self.spark.range(10, numPartitions=3))
+            cached = psdf._internal._default_index_cache_entry.spark_frame
+
+            # Built by `with_new_sdf` and by the constructor directly.
+            derived = [
+                psdf.sort_values("id"),
+                psdf.loc[psdf.id > 3],
+                psdf.index.to_frame(),
+                psdf.stack(),
+            ]
+            for frame in derived:
+                self.assertIs(
+                    frame._internal._default_index_cache_entry,
+                    psdf._internal._default_index_cache_entry,
+                )
+            del psdf
+            gc.collect()
+            self.assertTrue(cached.is_cached)
+            del derived, frame
+            gc.collect()
+            self.assertFalse(cached.is_cached)
+
+    def test_default_index_unpersist_after_stop(self):
+        spark_frame = mock.MagicMock()
+        spark_frame.sparkSession.is_stopped = True
+        spark_frame.sparkSession.sparkContext._jsc = None
+        _DefaultIndexCacheEntry._unpersist(spark_frame)
+        spark_frame.unpersist.assert_not_called()
+
 
 class InternalFrameTests(InternalFrameTestsMixin, PandasOnSparkTestCase, SQLTestUtils):
     pass
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 
@@ -246,6 +248,27 @@ class EWMMeanMixin:
     def test_ewm_mean(self):
         self._test_ewm_func("mean")
 
+    def test_ewm_mean_across_blocks(self):
+        pdf = pd.DataFrame(
+            {
+                "a": [1.0, 2.0, np.nan, 7.0, 9.0, np.nan, np.nan, np.nan, 6.0, 3.0],
+                "b": [4, 2, 3, 1, 0, 6, 5, 9, 8, 7],
+                "c": [np.nan, np.nan, np.nan, np.nan, 1.0, 2.0, np.nan, 3.0, np.nan, np.nan],
+            },
+            index=np.random.rand(10),
+        )
+        psdf = ps.from_pandas(pdf)
+        with mock.patch("pyspark.pandas.window._BLOCK_SIZE", 3):
+            for kwargs in [
+                dict(com=0.2),
+                dict(alpha=1.0),
+                dict(halflife=0.5, min_periods=3),
+                dict(span=1.7, ignore_na=True),
+                dict(alpha=1.0, ignore_na=True),
+            ]:
+                self.assert_eq(psdf.ewm(**kwargs).mean(), pdf.ewm(**kwargs).mean(), almost=True)
+                self.assert_eq(psdf.a.ewm(**kwargs).mean(), pdf.a.ewm(**kwargs).mean(), almost=True)
+
 
 class EWMMeanTests(
     EWMMeanMixin,
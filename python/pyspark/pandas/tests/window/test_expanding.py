@@ -15,6 +15,8 @@
 # limitations under the License.
 #
 
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 
@@ -75,6 +77,28 @@ class ExpandingMixin(ExpandingTestingFuncMixin):
     def test_expanding_sum(self):
         self._test_expanding_func("sum")
 
+    def test_expanding_across_blocks(self):
+        pdf = pd.DataFrame(
+            {
+                "a": [1.0, 2.0, np.nan, 7.0, 9.0, np.nan, np.nan, 4.0, 6.0, 3.0],
+                "b": [4, 2, 3, 1, 0, 6, 5, 9, 8, 7],
+            },
+            index=np.random.rand(10),
+        )
+        psdf = ps.from_pandas(pdf)
+        with mock.patch("pyspark.pandas.window._BLOCK_SIZE", 3):
+            for f in ["count", "sum", "min", "max", "mean", "std", "var"]:
+                self.assert_eq(
+                    getattr(psdf.expanding(1), f)(),
+                    getattr(pdf.expanding(1), f)(),
+                    almost=True,
+                )
+                self.assert_eq(
+                    getattr(psdf.b.expanding(4), f)(),
+                    getattr(pdf.b.expanding(4), f)(),
+                    almost=True,
+                )
+
 
 class ExpandingTests(
     ExpandingMixin,
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 
@@ -70,6 +72,26 @@ class RollingMixin(RollingTestingFuncMixin):
     def test_rolling_sum(self):
         self._test_rolling_func("sum")
 
+    def test_rolling_across_blocks(self):
+        pdf = pd.DataFrame(
+            {"a": [1.0, 2.0, 3.0, 7.0, 9.0, 8.0, 5.0, 4.0], "b": [4, 2, 3, 1, 0, 6, 5, 9]},
+            index=np.random.rand(8),
+        )
+        psdf = ps.from_pandas(pdf)
+        with mock.patch("pyspark.pandas.window._BLOCK_SIZE", 3):
+            for window, min_periods in [(1, None), (2, None), (3, 1), (5, 2)]:
+                for f in ["sum", "min", "max", "mean", "std"]:
+                    self.assert_eq(
+                        getattr(psdf.rolling(window, min_periods), f)(),
+                        getattr(pdf.rolling(window, min_periods), f)(),
+                        almost=True,
+                    )
+                    self.assert_eq(
+                        getattr(psdf.b.rolling(window, min_periods), f)(),
+                        getattr(pdf.b.rolling(window, min_periods), f)(),
+                        almost=True,
+                    )
+
 
 class RollingTests(
     RollingMixin,
@@ -312,6 +312,7 @@ def combine_frames(
                 data_spark_columns=[scol_for(joined_df, col) for col in new_data_columns],
                 data_fields=data_fields,
                 column_label_names=column_label_names,
+                default_index_cache_entry=this_internal._default_index_cache_entry,
             )
         )
     else:
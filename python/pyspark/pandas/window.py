@@ -16,11 +16,11 @@
 #
 from abc import ABCMeta, abstractmethod
 from functools import partial
-from typing import Any, Callable, Generic, List, Optional
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, cast
 
 import numpy as np
 
-from pyspark.sql import Window
+from pyspark.sql import DataFrame as PySparkDataFrame, Window
 from pyspark.sql import functions as F
 from pyspark.sql.internal import InternalFunction as SF
 from pyspark.pandas.missing.window import (
@@ -34,15 +34,59 @@ from pyspark.pandas.missing.window import (
 from pyspark import pandas as ps  # noqa: F401
 from pyspark.pandas._typing import FrameLike
 from pyspark.pandas.groupby import GroupBy, DataFrameGroupBy
-from pyspark.pandas.internal import NATURAL_ORDER_COLUMN_NAME, SPARK_INDEX_NAME_FORMAT
-from pyspark.pandas.utils import scol_for
+from pyspark.pandas.internal import (
+    InternalFrame,
+    NATURAL_ORDER_COLUMN_NAME,
+    SPARK_INDEX_NAME_FORMAT,
+)
+from pyspark.pandas.utils import scol_for, verify_temp_column_name
 from pyspark.sql.column import Column
 from pyspark.sql.types import (
     DoubleType,
+    LongType,
+    StructField,
+    StructType,
 )
 from pyspark.sql.window import WindowSpec
 
 
+# The number of consecutive rows in the blocks the rolling, expanding and exponentially weighted
+# windows over a whole DataFrame or Series are computed in, each block by a single task.
+_BLOCK_SIZE = 1 << 16
+
+
+def _attach_position_and_block(
+    internal: InternalFrame, position: str, block: str, block_size: int
+) -> PySparkDataFrame:
+    """
+    Return the Spark DataFrame of the resolved `internal` with the 0-based position of each row in
+    the natural order, and the block of `block_size` consecutive rows it belongs to.
+    """
+    sdf = internal.spark_frame.orderBy(NATURAL_ORDER_COLUMN_NAME)
+    sdf = InternalFrame.attach_distributed_sequence_column(sdf, column_name=position)
+    return sdf.withColumn(block, F.floor(F.col(position) / block_size))
+
+
+def _with_spark_frame(
+    psdf_or_psser: FrameLike, internal: InternalFrame, sdf: PySparkDataFrame
+) -> FrameLike:
+    """
+    Return the DataFrame or Series like `psdf_or_psser` with the data columns of the resolved
+    `internal` computed in `sdf`, which keeps the index columns and the natural order.
+    """
+    from pyspark.pandas.frame import DataFrame
+    from pyspark.pandas.series import Series, first_series
+
+    internal = internal.copy(
+        spark_frame=sdf,
+        index_spark_columns=[scol_for(sdf, col) for col in internal.index_spark_column_names],
+        data_spark_columns=[scol_for(sdf, col) for col in internal.data_spark_column_names],
+        data_fields=None,
+    )
+    psdf: DataFrame = DataFrame(internal)
+    return cast(FrameLike, first_series(psdf) if isinstance(psdf_or_psser, Series) else psdf)
+
+
 class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def __init__(self, window: WindowSpec, min_periods: int):
         self._window = window
@@ -52,6 +96,11 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
         )
         self._min_periods = min_periods
 
+    @property
+    def _row_number(self) -> Column:
+        """The 1-based number of the current row, to handle 'min_periods'."""
+        return F.row_number().over(self._unbounded_window)
+
     @abstractmethod
     def _apply_as_series_or_frame(self, func: Callable[[Column], Column]) -> FrameLike:
         """
@@ -68,7 +117,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def sum(self) -> FrameLike:
         def sum(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.sum(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -77,7 +126,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def min(self) -> FrameLike:
         def min(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.min(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -86,7 +135,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def max(self) -> FrameLike:
         def max(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.max(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -95,7 +144,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def mean(self) -> FrameLike:
         def mean(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.mean(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -104,7 +153,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def quantile(self, q: float, accuracy: int = 10000) -> FrameLike:
         def quantile(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.percentile_approx(scol.cast(DoubleType()), q, accuracy).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -113,7 +162,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def std(self) -> FrameLike:
         def std(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.stddev(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -122,7 +171,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def var(self) -> FrameLike:
         def var(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.variance(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -131,7 +180,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def skew(self) -> FrameLike:
         def skew(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 SF.skew(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -140,7 +189,7 @@ class RollingAndExpanding(Generic[FrameLike], metaclass=ABCMeta):
     def kurt(self) -> FrameLike:
         def kurt(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 SF.kurt(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -167,6 +216,7 @@ class RollingLike(RollingAndExpanding[FrameLike]):
         )
 
         super().__init__(window_spec, min_periods)
+        self._window_size = window
 
     def count(self) -> FrameLike:
         def count(scol: Column) -> Column:
@@ -195,6 +245,19 @@ class Rolling(RollingLike[FrameLike]):
                 % type(psdf_or_psser)
             )
 
+        # The rows are computed in blocks of consecutive rows, each block together with the
+        # preceding 'window - 1' rows of the previous block, so that the blocks are computed
+        # in parallel instead of moving all the rows into a single partition.
+        sdf = psdf_or_psser._internal.spark_frame
+        self._position = verify_temp_column_name(sdf, "__rolling_position__")
+        self._block = verify_temp_column_name(sdf, "__rolling_block__")
+        self._block_size = max(_BLOCK_SIZE, window - 1)
+        self._window = (
+            Window.partitionBy(self._block)
+            .orderBy(self._position)
+            .rowsBetween(Window.currentRow - (window - 1), Window.currentRow)
+        )
+
     def __getattr__(self, item: str) -> Any:
         if hasattr(MissingPandasLikeRolling, item):
             property_or_func = getattr(MissingPandasLikeRolling, item)
@@ -204,21 +267,41 @@ class Rolling(RollingLike[FrameLike]):
                 return partial(property_or_func, self)
         raise AttributeError(item)
 
+    @property
+    def _row_number(self) -> Column:
+        return F.col(self._position) + 1
+
     def _apply_as_series_or_frame(self, func: Callable[[Column], Column]) -> FrameLike:
-        return self._psdf_or_psser._apply_series_op(
-            lambda psser: psser._with_new_scol(func(psser.spark.column)),  # TODO: dtype?
-            should_resolve=True,
+        internal = self._psdf_or_psser._internal.resolved_copy
+        sdf = _attach_position_and_block(internal, self._position, self._block, self._block_size)
+
+        position = F.col(self._position)
+        block = F.col(self._block)
+        # The last 'window - 1' rows of each block also belong to the next block, to be dropped
+        # from there once computed.
+        halo = F.when(
+            position % self._block_size >= self._block_size - (self._window_size - 1),
+            F.array(block, block + 1),
+        ).otherwise(F.array(block))
+        sdf = sdf.withColumn(self._block, F.explode(halo)).repartitionByRange(self._block)
+
+        sdf = (
+            sdf.select(
+                *[scol_for(sdf, col) for col in internal.index_spark_column_names],
+                *[func(scol_for(sdf, col)).alias(col) for col in internal.data_spark_column_names],
+                NATURAL_ORDER_COLUMN_NAME,
+                self._position,
+                self._block,
+            )
+            .where(block == F.floor(position / self._block_size))
+            .drop(self._position, self._block)
         )
+        return _with_spark_frame(self._psdf_or_psser, internal, sdf)
 
     def count(self) -> FrameLike:
         """
         The rolling count of any non-NaN observations inside the window.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -268,11 +351,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate rolling summation of given DataFrame or Series.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -346,11 +424,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate the rolling minimum.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -424,11 +497,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate the rolling maximum.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -501,11 +569,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate the rolling mean of the values.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -606,11 +669,6 @@ class Rolling(RollingLike[FrameLike]):
         algorithm unlike pandas, the result might be different with pandas, also `interpolation`
         parameter is not supported yet.
 
-        the current implementation of this API uses Spark's Window without
-        specifying partition specification. This leads to move all data into
-        single partition in single machine and could cause serious
-        performance degradation. Avoid this method against very large dataset.
-
         See Also
         --------
         pyspark.pandas.Series.rolling : Calling rolling with Series data.
@@ -678,11 +736,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate rolling standard deviation.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -728,11 +781,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate unbiased rolling variance.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -778,11 +826,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate unbiased rolling skew.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -830,11 +873,6 @@ class Rolling(RollingLike[FrameLike]):
         """
         Calculate unbiased rolling kurtosis.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1411,7 +1449,7 @@ class ExpandingLike(RollingAndExpanding[FrameLike]):
     def count(self) -> FrameLike:
         def count(scol: Column) -> Column:
             return F.when(
-                F.row_number().over(self._unbounded_window) >= self._min_periods,
+                self._row_number >= self._min_periods,
                 F.count(scol).over(self._window),
             ).otherwise(F.lit(None))
 
@@ -1432,6 +1470,10 @@ class Expanding(ExpandingLike[FrameLike]):
             )
         self._psdf_or_psser = psdf_or_psser
 
+        sdf = psdf_or_psser._internal.spark_frame
+        self._position = verify_temp_column_name(sdf, "__expanding_position__")
+        self._block = verify_temp_column_name(sdf, "__expanding_block__")
+
     def __getattr__(self, item: str) -> Any:
         if hasattr(MissingPandasLikeExpanding, item):
             property_or_func = getattr(MissingPandasLikeExpanding, item)
@@ -1445,17 +1487,166 @@ class Expanding(ExpandingLike[FrameLike]):
     def __repr__(self) -> str:
         return "Expanding [min_periods={}]".format(self._min_periods)
 
-    _apply_as_series_or_frame = Rolling._apply_as_series_or_frame
+    def _apply_as_series_or_frame(self, func: Callable[[Column], Column]) -> FrameLike:
+        return self._psdf_or_psser._apply_series_op(
+            lambda psser: psser._with_new_scol(func(psser.spark.column)),  # TODO: dtype?
+            should_resolve=True,
+        )
+
+    def _apply_with_block_prefix(self, name: str) -> FrameLike:
+        """
+        Compute the expanding 'count', 'sum', 'min', 'max', 'mean', 'std' or 'var' in blocks of
+        consecutive rows in parallel.
+
+        The aggregations of each block are computed first, and combined into the aggregations of
+        all the rows before each block. These are then combined with the expanding aggregations
+        within each block.
+        """
+        internal = self._psdf_or_psser._internal.resolved_copy
+        sdf = _attach_position_and_block(internal, self._position, self._block, _BLOCK_SIZE)
+
+        if name in ("mean", "std", "var"):
+            stat_names = ["count", "mean", "m2"]
+        else:
+            stat_names = [name]
+
+        # The aggregations of the blocks, and of all the rows before them, of each data column.
+        stats: List[Dict[str, str]] = []
+        stat_scols = []
+        for i, col in enumerate(internal.data_spark_column_names):
+            scol = scol_for(sdf, col)
+            stats.append({})
+            for stat_name in stat_names:
+                stats[i][stat_name] = verify_temp_column_name(
+                    sdf, "__expanding_{}_{}__".format(stat_name, i)
+                )
+                if stat_name == "count":
+                    stat_scol = F.count(scol)
+                elif stat_name == "sum":
+                    stat_scol = F.sum(scol)
+                elif stat_name == "min":
+                    stat_scol = F.min(scol)
+                elif stat_name == "max":
+                    stat_scol = F.max(scol)
+                elif stat_name == "mean":
+                    stat_scol = F.mean(scol.cast(DoubleType()))
+                else:
+                    stat_scol = F.var_pop(scol.cast(DoubleType())) * F.count(scol)
+                stat_scols.append(stat_scol.alias(stats[i][stat_name]))
+        stats_sdf = sdf.groupBy(self._block).agg(*stat_scols)
+
+        if name in ("mean", "std", "var"):
+            # The moments of the rows before each block, combined by Chan et al.'s formula.
+            blocks = {row[self._block]: row for row in stats_sdf.collect()}
+            moments: List[Tuple[int, Any, Any]] = [(0, None, None)] * len(stats)
+            prefixes = []
+            for b in range(len(blocks)):
+                prefixes.append(
+                    (b, *[moment for moments_of_col in moments for moment in moments_of_col])
+                )
+                row = blocks[b]
+                for i, stats_of_col in enumerate(stats):
+                    n, mean, m2 = moments[i]
+                    n_b, mean_b, m2_b = (row[stats_of_col[stat]] for stat in stat_names)
+                    if n_b == 0:
+                        continue
+                    elif n == 0:
+                        moments[i] = (n_b, mean_b, m2_b)
+                    else:
+                        delta = mean_b - mean
+                        moments[i] = (
+                            n + n_b,
+                            mean + delta * n_b / (n + n_b),
+                            m2 + m2_b + delta * delta * n * n_b / (n + n_b),
+                        )
+            prefix_sdf = sdf.sparkSession.createDataFrame(
+                prefixes,
+                schema=StructType(
+                    [StructField(self._block, LongType())]
+                    + [
+                        StructField(stat, LongType() if stat_name == "count" else DoubleType())
+                        for stats_of_col in stats
+                        for stat_name, stat in stats_of_col.items()
+                    ]
+                ),
+            )
+        else:
+            blocks_before = Window.orderBy(self._block).rowsBetween(Window.unboundedPreceding, -1)
+            prefix_scols = []
+            for stats_of_col in stats:
+                stat = stats_of_col[name]
+                if name == "count":
+                    prefix_scol = F.coalesce(F.sum(stat).over(blocks_before), F.lit(0))
+                elif name == "sum":
+                    prefix_scol = F.sum(stat).over(blocks_before)
+                elif name == "min":
+                    prefix_scol = F.min(stat).over(blocks_before)
+                else:
+                    prefix_scol = F.max(stat).over(blocks_before)
+                prefix_scols.append(prefix_scol.alias(stat))
+            prefix_sdf = stats_sdf.select(self._block, *prefix_scols)
+
+        sdf = sdf.join(F.broadcast(prefix_sdf), on=self._block).repartitionByRange(self._block)
+        window = (
+            Window.partitionBy(self._block)
+            .orderBy(self._position)
+            .rowsBetween(Window.unboundedPreceding, Window.currentRow)
+        )
+
+        def expanding(scol: Column, stats_of_col: Dict[str, str]) -> Column:
+            if name == "count":
+                return F.col(stats_of_col["count"]) + F.count(scol).over(window)
+            elif name == "sum":
+                prefix_sum, block_sum = F.col(stats_of_col["sum"]), F.sum(scol).over(window)
+                return F.coalesce(prefix_sum + block_sum, prefix_sum, block_sum).cast(
+                    sdf.select(F.sum(scol)).schema[0].dataType
+                )
+            elif name == "min":
+                return F.least(F.col(stats_of_col["min"]), F.min(scol).over(window))
+            elif name == "max":
+                return F.greatest(F.col(stats_of_col["max"]), F.max(scol).over(window))
+
+            prefix_n, prefix_mean, prefix_m2 = (F.col(stats_of_col[stat]) for stat in stat_names)
+            scol = scol.cast(DoubleType())
+            n_b = F.count(scol).over(window)
+            mean_b = F.mean(scol).over(window)
+            n = prefix_n + n_b
+            delta = mean_b - prefix_mean
+            if name == "mean":
+                return (
+                    F.when(n_b == 0, prefix_mean)
+                    .when(prefix_n == 0, mean_b)
+                    .otherwise(prefix_mean + delta * n_b / n)
+                    .cast(sdf.select(F.mean(scol)).schema[0].dataType)
+                )
+            m2_b = F.var_pop(scol).over(window) * n_b
+            m2 = (
+                F.when(n_b == 0, prefix_m2)
+                .when(prefix_n == 0, m2_b)
+                .otherwise(prefix_m2 + m2_b + delta * delta * prefix_n * n_b / n)
+            )
+            var = F.when(n > 1, m2 / (n - 1))
+            return var if name == "var" else F.sqrt(var)
+
+        sdf = sdf.select(
+            *[scol_for(sdf, col) for col in internal.index_spark_column_names],
+            *[
+                F.when(
+                    F.col(self._position) + 1 >= self._min_periods,
+                    expanding(scol_for(sdf, col), stats_of_col),
+                )
+                .otherwise(F.lit(None))
+                .alias(col)
+                for col, stats_of_col in zip(internal.data_spark_column_names, stats)
+            ],
+            NATURAL_ORDER_COLUMN_NAME,
+        )
+        return _with_spark_frame(self._psdf_or_psser, internal, sdf)
 
     def count(self) -> FrameLike:
         """
         The expanding count of any non-NaN observations inside the window.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1486,17 +1677,14 @@ class Expanding(ExpandingLike[FrameLike]):
         2  2.0
         3  3.0
         """
-        return super().count()
+        return self._apply_with_block_prefix("count").astype(  # type: ignore[attr-defined]
+            "float64"
+        )
 
     def sum(self) -> FrameLike:
         """
         Calculate expanding summation of given DataFrame or Series.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1548,17 +1736,12 @@ class Expanding(ExpandingLike[FrameLike]):
         3  10.0  30.0
         4  15.0  55.0
         """
-        return super().sum()
+        return self._apply_with_block_prefix("sum")
 
     def min(self) -> FrameLike:
         """
         Calculate the expanding minimum.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1585,17 +1768,12 @@ class Expanding(ExpandingLike[FrameLike]):
         4    2.0
         dtype: float64
         """
-        return super().min()
+        return self._apply_with_block_prefix("min")
 
     def max(self) -> FrameLike:
         """
         Calculate the expanding maximum.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1621,17 +1799,12 @@ class Expanding(ExpandingLike[FrameLike]):
         4    6.0
         dtype: float64
         """
-        return super().max()
+        return self._apply_with_block_prefix("max")
 
     def mean(self) -> FrameLike:
         """
         Calculate the expanding mean of the values.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1665,7 +1838,7 @@ class Expanding(ExpandingLike[FrameLike]):
         3    2.5
         dtype: float64
         """
-        return super().mean()
+        return self._apply_with_block_prefix("mean")
 
     def quantile(self, quantile: float, accuracy: int = 10000) -> FrameLike:
         """
@@ -1731,11 +1904,6 @@ class Expanding(ExpandingLike[FrameLike]):
         """
         Calculate expanding standard deviation.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1775,17 +1943,12 @@ class Expanding(ExpandingLike[FrameLike]):
         5  0.836660   9.928075
         6  0.786796   9.327379
         """
-        return super().std()
+        return self._apply_with_block_prefix("std")
 
     def var(self) -> FrameLike:
         """
         Calculate unbiased expanding variance.
 
-        .. note:: the current implementation of this API uses Spark's Window without
-            specifying partition specification. This leads to move all data into
-            single partition in single machine and could cause serious
-            performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -1825,7 +1988,7 @@ class Expanding(ExpandingLike[FrameLike]):
         5  0.700000   98.566667
         6  0.619048   87.000000
         """
-        return super().var()
+        return self._apply_with_block_prefix("var")
 
     def skew(self) -> FrameLike:
         """
@@ -2487,6 +2650,10 @@ class ExponentialMoving(ExponentialMovingLike[FrameLike]):
 
         super().__init__(window_spec, com, span, halflife, alpha, min_periods, ignore_na)
 
+        sdf = psdf_or_psser._internal.spark_frame
+        self._position = verify_temp_column_name(sdf, "__ewm_position__")
+        self._block = verify_temp_column_name(sdf, "__ewm_block__")
+
     def __getattr__(self, item: str) -> Any:
         if hasattr(MissingPandasLikeExponentialMoving, item):
             property_or_func = getattr(MissingPandasLikeExponentialMoving, item)
@@ -2496,21 +2663,187 @@ class ExponentialMoving(ExponentialMovingLike[FrameLike]):
                 return partial(property_or_func, self)
         raise AttributeError(item)
 
-    _apply_as_series_or_frame = Rolling._apply_as_series_or_frame
+    _apply_as_series_or_frame = Expanding._apply_as_series_or_frame
+
+    def _mean_with_block_prefix(self) -> FrameLike:
+        """
+        Compute the exponentially weighted mean in blocks of consecutive rows in parallel.
+
+        The weighted sums of the values and of the weights of each block are computed first, and
+        combined into the state at the last non-null value before each block. Each row is then
+        computed from that state and the exponentially weighted mean within its block.
+        """
+        alpha = self._compute_unified_alpha()
+        beta = 1.0 - alpha
+        internal = self._psdf_or_psser._internal.resolved_copy
+        sdf = _attach_position_and_block(internal, self._position, self._block, _BLOCK_SIZE)
+
+        position = F.col(self._position)
+        block = Window.partitionBy(self._block)
+        names = [
+            {
+                name: verify_temp_column_name(sdf, "__ewm_{}_{}__".format(name, i))
+                for name in (
+                    "value",
+                    "exponent",
+                    "numerator",
+                    "denominator",
+                    "count",
+                    "steps",
+                    "tail",
+                    "gap",
+                    "mean",
+                )
+            }
+            for i in range(len(internal.data_spark_column_names))
+        ]
+
+        def steps(scol: Column) -> Column:
+            # The rows decaying the weights of the rows before them.
+            return scol if self._ignore_na else F.lit(1)
+
+        # The weighted sums of each block, weighted as of its last non-null value.
+        stats_scols = []
+        for col, names_of_col in zip(internal.data_spark_column_names, names):
+            scol = scol_for(sdf, col).cast(DoubleType())
+            if self._ignore_na:
+                exponent = F.count(scol).over(
+                    block.orderBy(self._position).rowsBetween(1, Window.unboundedFollowing)
+                )
+            else:
+                exponent = F.max(F.when(scol.isNotNull(), position)).over(block) - position
+            stats_scols.append(scol.alias(names_of_col["value"]))
+            stats_scols.append(exponent.alias(names_of_col["exponent"]))
+        stats_sdf = sdf.select(self._position, self._block, *stats_scols)
+
+        stats_scols = []
+        for names_of_col in names:
+            scol = F.col(names_of_col["value"])
+            weight = F.pow(F.lit(beta), F.col(names_of_col["exponent"]))
+            if self._ignore_na:
+                tail = F.lit(0)
+            else:
+                tail = F.max(position) - F.max(F.when(scol.isNotNull(), position))
+            stats_scols.extend(
+                [
+                    F.sum(scol * weight).alias(names_of_col["numerator"]),
+                    F.sum(F.when(scol.isNotNull(), weight)).alias(names_of_col["denominator"]),
+                    F.count(scol).alias(names_of_col["count"]),
+                    F.count(steps(scol)).alias(names_of_col["steps"]),
+                    tail.alias(names_of_col["tail"]),
+                ]
+            )
+        blocks = {
+            row[self._block]: row
+            for row in stats_sdf.groupBy(self._block).agg(*stats_scols).collect()
+        }
+
+        # The numerator and the denominator at the last non-null value before each block, the
+        # number of steps since then, and the number of non-null values before each block.
+        states = [(0.0, 0.0, 0, 0)] * len(names)
+        prefixes = []
+        for b in range(len(blocks)):
+            prefix: List[Any] = [b]
+            for numerator, denominator, gap, count in states:
+                mean = numerator / denominator if count > 0 else None
+                prefix.extend([numerator, denominator, gap, mean, count])
+            prefixes.append(prefix)
+
+            row = blocks[b]
+            for i, names_of_col in enumerate(names):
+                numerator, denominator, gap, count = states[i]
+                if row[names_of_col["count"]] > 0:
+                    decay = beta ** (gap + row[names_of_col["steps"]] - row[names_of_col["tail"]])
+                    states[i] = (
+                        decay * numerator + row[names_of_col["numerator"]],
+                        decay * denominator + row[names_of_col["denominator"]],
+                        row[names_of_col["tail"]],
+                        count + row[names_of_col["count"]],
+                    )
+                else:
+                    states[i] = (numerator, denominator, gap + row[names_of_col["steps"]], count)
+        prefix_sdf = sdf.sparkSession.createDataFrame(
+            prefixes,
+            schema=StructType(
+                [StructField(self._block, LongType())]
+                + [
+                    StructField(names_of_col[name], data_type)
+                    for names_of_col in names
+                    for name, data_type in [
+                        ("numerator", DoubleType()),
+                        ("denominator", DoubleType()),
+                        ("gap", LongType()),
+                        ("mean", DoubleType()),
+                        ("count", LongType()),
+                    ]
+                ]
+            ),
+        )
+
+        sdf = sdf.join(F.broadcast(prefix_sdf), on=self._block).repartitionByRange(self._block)
+        window = block.orderBy(self._position).rowsBetween(
+            Window.unboundedPreceding, Window.currentRow
+        )
+
+        # The exponentially weighted means at the non-null values, combining the state before
+        # the block with the numerator and the denominator within the block.
+        scols = []
+        for col, names_of_col in zip(internal.data_spark_column_names, names):
+            scol = scol_for(sdf, col).cast(DoubleType())
+            steps_in_block = F.count(steps(scol)).over(window)
+            indicator = F.when(scol.isNotNull(), F.lit(1.0)).otherwise(
+                F.lit(None) if self._ignore_na else F.lit(0.0)
+            )
+            denominator = (
+                SF.ewm(indicator, alpha, self._ignore_na).over(window)
+                * (1 - F.pow(F.lit(beta), steps_in_block))
+                / alpha
+            )
+            numerator = SF.ewm(scol, alpha, self._ignore_na).over(window) * denominator
+            decay = F.pow(F.lit(beta), F.col(names_of_col["gap"]) + steps_in_block)
+            scols.append(
+                F.when(
+                    scol.isNotNull(),
+                    (decay * F.col(names_of_col["numerator"]) + numerator)
+                    / (decay * F.col(names_of_col["denominator"]) + denominator),
+                ).alias(col)
+            )
+            scols.append(
+                (F.col(names_of_col["count"]) + F.count(scol).over(window)).alias(
+                    names_of_col["count"]
+                )
+            )
+            scols.append(F.col(names_of_col["mean"]))
+        sdf = sdf.select(
+            *[scol_for(sdf, col) for col in internal.index_spark_column_names],
+            *scols,
+            NATURAL_ORDER_COLUMN_NAME,
+            self._position,
+            self._block,
+        )
+
+        sdf = sdf.select(
+            *[scol_for(sdf, col) for col in internal.index_spark_column_names],
+            *[
+                F.when(
+                    F.col(names_of_col["count"]) >= self._min_periods,
+                    F.coalesce(
+                        F.last(scol_for(sdf, col), ignorenulls=True).over(window),
+                        F.col(names_of_col["mean"]),
+                    ),
+                )
+                .otherwise(F.lit(None))
+                .alias(col)
+                for col, names_of_col in zip(internal.data_spark_column_names, names)
+            ],
+            NATURAL_ORDER_COLUMN_NAME,
+        )
+        return _with_spark_frame(self._psdf_or_psser, internal, sdf)
 
     def mean(self) -> FrameLike:
         """
         Calculate an online exponentially weighted mean.
 
-        Notes
-        -----
-        There are behavior differences between pandas-on-Spark and pandas.
-
-        * the current implementation of this API uses Spark's Window without
-          specifying partition specification. This leads to move all data into
-          single partition in single machine and could cause serious
-          performance degradation. Avoid this method against very large dataset.
-
         Returns
         -------
         Series or DataFrame
@@ -2549,7 +2882,7 @@ class ExponentialMoving(ExponentialMovingLike[FrameLike]):
         6    0.364668
         Name: s2, dtype: float64
         """
-        return super().mean()
+        return self._mean_with_block_prefix()
 
     # TODO: when add 'adjust' parameter, should add to here too.
     def __repr__(self) -> str:
@@ -15,6 +15,8 @@
 # limitations under the License.
 #
 
+import collections
+import math
 import os
 import platform
 import shutil
@@ -25,6 +27,7 @@ import operator
 import random
 import sys
 import heapq
+import types
 
 from pyspark.serializers import (
     BatchedSerializer,
@@ -87,6 +90,119 @@ def _get_local_dirs(sub):
     return [os.path.join(d, "python", str(os.getpid()), sub) for d in dirs]
 
 
+# the containers with more items than the threshold are estimated from a sample of their
+# items, like SizeEstimator of the JVM
+_SIZE_SAMPLE_THRESHOLD = 400
+_SIZE_SAMPLE_NUM = 100
+# the objects whose attributes are not counted in the size of the objects referring to them
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def _estimate_size(obj, rnd=None):
+    """
+    Return the estimated size in bytes of obj and of the objects it refers to through
+    containers and instance attributes, counting each object once. The size of the items of
+    the large containers is extrapolated from a sample of them.
+
+    Examples
+    --------
+    >>> _estimate_size([]) == sys.getsizeof([])
+    True
+    >>> s = "x" * 1000
+    >>> _estimate_size([s, s]) == sys.getsizeof([s, s]) + sys.getsizeof(s)
+    True
+    >>> 10 ** 6 < _estimate_size({i: str(i) for i in range(10 ** 4)}) < 2 * 10 ** 6
+    True
+    """
+    rnd = rnd or random.Random(42)
+    seen = set()
+    size = 0.0
+    # the objects to visit with the number of objects each of them stands for
+    stack = [(obj, 1.0)]
+    while stack:
+        o, weight = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o) * weight
+
+        if isinstance(o, dict):
+            items = o.items()
+        elif isinstance(o, (list, tuple, set, frozenset, collections.deque)):
+            items = o
+        elif isinstance(o, _SHARED_TYPES) or not isinstance(getattr(o, "__dict__", None), dict):
+            continue
+        else:
+            stack.append((o.__dict__, weight))
+            continue
+
+        n = len(items)
+        if n > _SIZE_SAMPLE_THRESHOLD:
+            if isinstance(o, (list, tuple)):
+                items = [o[i] for i in rnd.sample(range(n), _SIZE_SAMPLE_NUM)]
+            else:
+                start = rnd.randrange(n - _SIZE_SAMPLE_NUM)
+                items = itertools.islice(items, start, start + _SIZE_SAMPLE_NUM)
+            weight *= n / _SIZE_SAMPLE_NUM
+        if isinstance(o, dict):
+            for k, v in items:
+                stack.append((k, weight))
+                stack.append((v, weight))
+        else:
+            stack.extend((v, weight) for v in items)
+    return int(size)
+
+
+class _SizeTracker:
+    """
+    Track the estimated size in bytes of a collection updated in place, like SizeTracker of
+    the JVM.
+
+    The size of the collection is estimated once its number of updates has grown by
+    SAMPLE_GROWTH_RATE since the last sample, and extrapolated in between from the bytes
+    per update of the last two samples.
+
+    Examples
+    --------
+    >>> l = []
+    >>> tracker = _SizeTracker(lambda: _estimate_size(l))
+    >>> for i in range(10 ** 5):
+    ...     l.append(str(i))
+    ...     tracker.update()
+    >>> 0.9 < tracker.size() / _estimate_size(l) < 1.1
+    True
+    """
+
+    SAMPLE_GROWTH_RATE = 1.1
+
+    def __init__(self, estimate):
+        self._estimate = estimate
+        self.reset()
+
+    def reset(self):
+        """Forget the samples taken before the collection was cleared or replaced"""
+        self._updates = 0
+        self._bytes_per_update = 0.0
+        self._last_updates, self._last_size = 0, self._estimate()
+        self._next_sample = 1
+
+    def update(self, n=1):
+        """Record n updates of the collection"""
+        self._updates += n
+        if self._updates >= self._next_sample:
+            size = self._estimate()
+            if self._updates > self._last_updates:
+                self._bytes_per_update = max(
+                    (size - self._last_size) / (self._updates - self._last_updates), 0.0
+                )
+            self._last_updates, self._last_size = self._updates, size
+            self._next_sample = math.ceil(self._updates * self.SAMPLE_GROWTH_RATE)
+
+    def size(self):
+        """Return the estimated size in bytes of the collection"""
+        return self._last_size + int(self._bytes_per_update * (self._updates - self._last_updates))
+
+
 # global stats
 MemoryBytesSpilled = 0
 DiskBytesSpilled = 0
@@ -102,12 +218,19 @@ class Aggregator:
     mergeCombiners:  (combiner, combiner) -> combiner
     """
 
+    # The name of the NumPy ufunc equivalent to the aggregation, see ExternalArrayMerger.
+    reduction = None
+
     def __init__(self, createCombiner, mergeValue, mergeCombiners):
         self.createCombiner = fail_on_stopiteration(createCombiner)
         self.mergeValue = fail_on_stopiteration(mergeValue)
         self.mergeCombiners = fail_on_stopiteration(mergeCombiners)
 
 
+# The reduce functions that have an equivalent NumPy ufunc, by name.
+_NUMERIC_REDUCTIONS = {operator.add: "add", min: "minimum", max: "maximum"}
+
+
 class SimpleAggregator(Aggregator):
 
     """
@@ -117,6 +240,10 @@ class SimpleAggregator(Aggregator):
 
     def __init__(self, combiner):
         Aggregator.__init__(self, lambda x: x, combiner, combiner)
+        try:
+            self.reduction = _NUMERIC_REDUCTIONS.get(combiner)
+        except TypeError:  # unhashable combiner
+            pass
 
 
 class Merger:
@@ -156,9 +283,9 @@ class ExternalMerger(Merger):
     This class works as follows:
 
     - It repeatedly combine the items and save them in one dict in
-      memory.
+      memory, and tracks the estimated size of the dict.
 
-    - When the used memory goes above memory limit, it will split
+    - When the estimated size goes above memory limit, it will split
       the combined data into partitions by hash code, dump them
       into disk, one file per partition.
 
@@ -188,18 +315,18 @@ class ExternalMerger(Merger):
     Examples
     --------
     >>> agg = SimpleAggregator(lambda x, y: x + y)
-    >>> merger = ExternalMerger(agg, 10)
-    >>> N = 10000
+    >>> merger = ExternalMerger(agg, 1)
+    >>> N = 100000
     >>> merger.mergeValues(zip(range(N), range(N)))
     >>> assert merger.spills > 0
     >>> sum(v for k,v in merger.items())
-    49995000
+    4999950000
 
-    >>> merger = ExternalMerger(agg, 10)
+    >>> merger = ExternalMerger(agg, 1)
     >>> merger.mergeCombiners(zip(range(N), range(N)))
     >>> assert merger.spills > 0
     >>> sum(v for k,v in merger.items())
-    49995000
+    4999950000
     """
 
     # the max total partitions created recursively
@@ -233,25 +360,23 @@ class ExternalMerger(Merger):
         self.spills = 0
         # randomize the hash of key, id(o) is the address of o (aligned by 8)
         self._seed = id(self) + 7
+        # estimated size of the merged data in memory
+        self._tracker = _SizeTracker(self._used_memory)
 
     def _get_spill_dir(self, n):
         """Choose one directory for spill by number n"""
         return os.path.join(self.localdirs[n % len(self.localdirs)], str(n))
 
-    def _next_limit(self):
-        """
-        Return the next memory limit. If the memory is not released
-        after spilling, it will dump the data only when the used memory
-        starts to increase.
-        """
-        return max(self.memory_limit, get_used_memory() * 1.05)
+    def _used_memory(self):
+        """Return the estimated size in bytes of the merged data in memory"""
+        return _estimate_size(self.pdata if self.pdata else self.data)
 
     def mergeValues(self, iterator):
         """Combine the items by creator and combiner"""
         # speedup attribute lookup
         creator, comb = self.agg.createCombiner, self.agg.mergeValue
         c, data, pdata, hfun, batch = 0, self.data, self.pdata, self._partition, self.batch
-        limit = self.memory_limit
+        tracker, limit = self._tracker, self.memory_limit * (1 << 20)
 
         for k, v in iterator:
             d = pdata[hfun(k)] if pdata else data
@@ -259,52 +384,44 @@ class ExternalMerger(Merger):
 
             c += 1
             if c >= batch:
-                if get_used_memory() >= limit:
+                tracker.update(c)
+                c = 0
+                if tracker.size() >= limit:
                     self._spill()
-                    limit = self._next_limit()
-                    batch /= 2
-                    c = 0
-                else:
-                    batch *= 1.5
 
-        if get_used_memory() >= limit:
+        tracker.update(c)
+        if tracker.size() >= limit:
             self._spill()
 
     def _partition(self, key):
         """Return the partition for key"""
         return hash((key, self._seed)) % self.partitions
 
-    def _object_size(self, obj):
-        """How much of memory for this obj, assume that all the objects
-        consume similar bytes of memory
-        """
-        return 1
-
     def mergeCombiners(self, iterator, limit=None):
         """Merge (K,V) pair by mergeCombiner"""
         if limit is None:
             limit = self.memory_limit
         # speedup attribute lookup
-        comb, hfun, objsize = self.agg.mergeCombiners, self._partition, self._object_size
+        comb, hfun, tracker = self.agg.mergeCombiners, self._partition, self._tracker
         c, data, pdata, batch = 0, self.data, self.pdata, self.batch
+        limit *= 1 << 20
         for k, v in iterator:
             d = pdata[hfun(k)] if pdata else data
             d[k] = comb(d[k], v) if k in d else v
             if not limit:
                 continue
 
-            c += objsize(v)
-            if c > batch:
-                if get_used_memory() > limit:
+            c += 1
+            if c >= batch:
+                tracker.update(c)
+                c = 0
+                if tracker.size() > limit:
                     self._spill()
-                    limit = self._next_limit()
-                    batch /= 2
-                    c = 0
-                else:
-                    batch *= 1.5
 
-        if limit and get_used_memory() >= limit:
-            self._spill()
+        if limit:
+            tracker.update(c)
+            if tracker.size() >= limit:
+                self._spill()
 
     def _spill(self):
         """
@@ -317,7 +434,7 @@ class ExternalMerger(Merger):
         if not os.path.exists(path):
             os.makedirs(path)
 
-        used_memory = get_used_memory()
+        used_memory = self._used_memory()
         if not self.pdata:
             # The data has not been partitioned, it will iterator the
             # dataset once, write them into different files, has no
@@ -351,7 +468,8 @@ class ExternalMerger(Merger):
 
         self.spills += 1
         gc.collect()  # release the memory as much as possible
-        MemoryBytesSpilled += max(used_memory - get_used_memory(), 0) << 20
+        self._tracker.reset()
+        MemoryBytesSpilled += used_memory
 
     def items(self):
         """Return all merged items as iterator"""
@@ -380,21 +498,23 @@ class ExternalMerger(Merger):
         finally:
             self._cleanup()
 
+    def _load_spilled_items(self, spill, index):
+        """Return the items of partition `index` dumped by spill number `spill`"""
+        with open(os.path.join(self._get_spill_dir(spill), str(index)), "rb") as f:
+            yield from self.serializer.load_stream(f)
+
     def _merged_items(self, index):
         self.data = {}
-        limit = self._next_limit()
+        limit = self.memory_limit * (1 << 20)
         for j in range(self.spills):
-            path = self._get_spill_dir(j)
-            p = os.path.join(path, str(index))
             # do not check memory during merging
-            with open(p, "rb") as f:
-                self.mergeCombiners(self.serializer.load_stream(f), 0)
+            self.mergeCombiners(self._load_spilled_items(j, index), 0)
 
             # limit the total partitions
             if (
                 self.scale * self.partitions < self.MAX_TOTAL_PARTITIONS
                 and j < self.spills - 1
-                and get_used_memory() > limit
+                and self._used_memory() > limit
             ):
                 self.data.clear()  # will read from disk again
                 gc.collect()  # release the memory as much as possible
@@ -420,17 +540,13 @@ class ExternalMerger(Merger):
             self.batch,
         )
         m.pdata = [{} for _ in range(self.partitions)]
-        limit = self._next_limit()
+        limit = self.memory_limit * (1 << 20)
 
         for j in range(self.spills):
-            path = self._get_spill_dir(j)
-            p = os.path.join(path, str(index))
-            with open(p, "rb") as f:
-                m.mergeCombiners(self.serializer.load_stream(f), 0)
+            m.mergeCombiners(self._load_spilled_items(j, index), 0)
 
-            if get_used_memory() > limit:
+            if m._used_memory() > limit:
                 m._spill()
-                limit = self._next_limit()
 
         return m._external_items()
 
@@ -440,6 +556,303 @@ class ExternalMerger(Merger):
             shutil.rmtree(d, True)
 
 
+def _int_hash_partitions(keys, partitions, scale=1):
+    """
+    Return `hash(k) // scale % partitions` for each integer `k` of an int64 NumPy array, the
+    same as Python computes it.
+    """
+    import numpy as np
+
+    modulus = sys.hash_info.modulus
+    # ~k is -k - 1, which does not overflow for the negative keys
+    hashes = np.where(keys < 0, -((~keys % modulus + 1) % modulus), keys % modulus)
+    hashes[hashes == -1] = -2
+    return hashes // scale % partitions
+
+
+class ExternalArrayMerger(ExternalMerger):
+
+    """
+    ExternalMerger specialized for the aggregators that have a `reduction`, which reduces
+    `int` keys and `int` or `float` values with NumPy.
+
+    The items are read in batches, converted into NumPy arrays, and reduced by sorting them
+    by key. They are merged into a table made of a sorted array of distinct keys and an
+    array of their reduced values, whose size is accounted for directly rather than by
+    sampling the memory used by the process. When it goes above the limit, the table is
+    partitioned by key and dumped into disks as NumPy arrays, one file per partition. Before
+    returning any items, the arrays dumped for each partition are merged together one after
+    another. If they do not fit in memory, they are partitioned and merged recursively.
+
+    As soon as a batch has other keys or values, the values of the keys could overflow 64-bit
+    integers, or the order of NaN values matters for the reduction, the table is moved into
+    the dicts of ExternalMerger, which merges the rest of the items.
+
+    Examples
+    --------
+    >>> from operator import add
+    >>> N = 100000
+    >>> merger = ExternalArrayMerger(SimpleAggregator(add), 1)
+    >>> merger.mergeValues(zip(range(N), range(N)))
+    >>> merger.mergeValues(zip(range(N), range(N)))
+    >>> assert merger.spills > 0
+    >>> sum(v for k, v in merger.items())
+    9999900000
+
+    >>> merger = ExternalArrayMerger(SimpleAggregator(max), 1)
+    >>> merger.mergeCombiners([(1, 2), (1, 3), ("a", 1)])
+    >>> sorted(merger.items(), key=lambda kv: str(kv[0]))
+    [(1, 3), ('a', 1)]
+    """
+
+    # the number of items converted into arrays at once
+    BATCH_SIZE = 1 << 16
+
+    def __init__(
+        self,
+        aggregator,
+        memory_limit=512,
+        serializer=None,
+        localdirs=None,
+        scale=1,
+        partitions=59,
+        batch=1000,
+    ):
+        import numpy as np
+
+        ExternalMerger.__init__(
+            self, aggregator, memory_limit, serializer, localdirs, scale, partitions, batch
+        )
+        self._ufunc = getattr(np, aggregator.reduction)
+        # the table of merged items, the dtype of the values is set by the first batch
+        self._keys = np.empty(0, dtype=np.int64)
+        self._values = None
+        # upper bound of the absolute values of the sums of integers
+        self._sum_bound = 0.0
+        # number of spills dumped as arrays, the later ones are dumped by ExternalMerger
+        self._array_spills = 0
+        self._fallback = False
+
+    def mergeValues(self, iterator):
+        """Combine the items by creator and combiner"""
+        self._merge(iterator, ExternalMerger.mergeValues)
+
+    def mergeCombiners(self, iterator, limit=None):
+        """Merge (K,V) pair by mergeCombiner"""
+        self._merge(iterator, lambda self, it: ExternalMerger.mergeCombiners(self, it, limit))
+
+    def _merge(self, iterator, merge):
+        iterator = iter(iterator)
+        while not self._fallback:
+            batch = list(itertools.islice(iterator, self.BATCH_SIZE))
+            if not batch:
+                return
+            if not self._merge_batch(batch):
+                self._fall_back()
+                iterator = itertools.chain(batch, iterator)
+        merge(self, iterator)
+
+    def _merge_batch(self, batch):
+        """Merge the batch into the table, return whether it can be merged"""
+        import numpy as np
+
+        keys = list(map(operator.itemgetter(0), batch))
+        values = list(map(operator.itemgetter(1), batch))
+        value_types = set(map(type, values))
+        if set(map(type, keys)) != {int} or len(value_types) != 1:
+            return False
+        dtype = {int: np.int64, float: np.float64}.get(value_types.pop())
+        if dtype is None or (self._values is not None and self._values.dtype != dtype):
+            return False
+        try:
+            keys = np.array(keys, dtype=np.int64)
+            values = np.array(values, dtype=dtype)
+        except OverflowError:
+            return False
+
+        if dtype is np.int64 and self._ufunc is np.add:
+            self._sum_bound += float(np.abs(values.astype(np.float64)).sum())
+            if self._sum_bound >= 2.0**62:
+                return False
+        elif dtype is np.float64 and self._ufunc is not np.add and np.isnan(values).any():
+            # min and max of Python depend on the order of the NaN values
+            return False
+
+        self._merge_table(*self._reduce(keys, values))
+        return True
+
+    def _merge_table(self, keys, values):
+        """Merge the distinct keys in order and their values into the table"""
+        if self._values is None:
+            self._keys, self._values = keys, values
+        else:
+            self._keys, self._values = self._merge_runs(self._keys, self._values, keys, values)
+        if self._keys.nbytes + self._values.nbytes > self.memory_limit * (1 << 20):
+            self._spill()
+
+    def _reduce(self, keys, values):
+        """Return the distinct keys in order and their reduced values"""
+        import numpy as np
+
+        # the stable sort keeps the order of the values of each key
+        order = np.argsort(keys, kind="stable")
+        keys, values = keys[order], values[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        return keys[starts], self._ufunc.reduceat(values, starts)
+
+    def _merge_runs(self, keys, values, other_keys, other_values):
+        """
+        Merge two runs of distinct keys in order and their values, the values of `other_keys`
+        are reduced after those of `keys`. Only the smaller run is searched and sorted.
+        """
+        import numpy as np
+
+        positions = np.searchsorted(keys, other_keys)
+        found = positions < len(keys)
+        found[found] = keys[positions[found]] == other_keys[found]
+        values[positions[found]] = self._ufunc(values[positions[found]], other_values[found])
+        new = ~found
+        return (
+            np.insert(keys, positions[new], other_keys[new]),
+            np.insert(values, positions[new], other_values[new]),
+        )
+
+    def _fall_back(self):
+        """Move the table into the dicts of ExternalMerger"""
+        self._fallback = True
+        if self._values is None:
+            return
+        items = zip(self._keys.tolist(), self._values.tolist())
+        if self.spills:
+            # merge the rest of the items into partitions like the spilled ones
+            self.pdata = [{} for _ in range(self.partitions)]
+            for k, v in items:
+                self.pdata[self._partition(k)][k] = v
+        else:
+            self.data = dict(items)
+        self._keys = self._keys[:0]
+        self._values = None
+        self._tracker.reset()
+
+    def _partition(self, key):
+        """Return the partition for key, the same for the keys spilled as arrays"""
+        return hash(key) // self.scale % self.partitions
+
+    def _spill(self):
+        """
+        dump the table into disks, partitioned by key, or the partitioned data once
+        it fell back to dicts.
+        """
+        if self._fallback:
+            return ExternalMerger._spill(self)
+
+        import numpy as np
+
+        global MemoryBytesSpilled, DiskBytesSpilled
+        path = self._get_spill_dir(self.spills)
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        partitions = _int_hash_partitions(self._keys, self.partitions, self.scale)
+        order = np.argsort(partitions, kind="stable")
+        bounds = np.searchsorted(partitions[order], np.arange(self.partitions + 1))
+        keys, values = self._keys[order], self._values[order]
+        for i in range(self.partitions):
+            with open(os.path.join(path, str(i)), "wb") as f:
+                np.save(f, keys[bounds[i] : bounds[i + 1]])
+                np.save(f, values[bounds[i] : bounds[i + 1]])
+                DiskBytesSpilled += f.tell()
+
+        MemoryBytesSpilled += self._keys.nbytes + self._values.nbytes
+        self._keys = self._keys[:0]
+        self._values = self._values[:0]
+        self.spills += 1
+        self._array_spills += 1
+
+    def items(self):
+        """Return all merged items as iterator"""
+        if self._fallback:
+            return ExternalMerger.items(self)
+        if self._values is None:
+            return iter([])
+        if not self.spills:
+            return zip(self._keys.tolist(), self._values.tolist())
+        if len(self._keys):
+            self._spill()
+        return self._external_items()
+
+    def _load_spilled_arrays(self, spill, index):
+        import numpy as np
+
+        with open(os.path.join(self._get_spill_dir(spill), str(index)), "rb") as f:
+            return np.load(f), np.load(f)
+
+    def _load_spilled_items(self, spill, index):
+        if spill >= self._array_spills:
+            yield from ExternalMerger._load_spilled_items(self, spill, index)
+        else:
+            keys, values = self._load_spilled_arrays(spill, index)
+            yield from zip(keys.tolist(), values.tolist())
+
+    def _merged_items(self, index):
+        if self._fallback:
+            return ExternalMerger._merged_items(self, index)
+
+        limit = self.memory_limit * (1 << 20)
+        keys, values = self._load_spilled_arrays(0, index)
+        for j in range(1, self.spills):
+            keys, values = self._merge_runs(keys, values, *self._load_spilled_arrays(j, index))
+
+            # limit the total partitions
+            if (
+                self.scale * self.partitions < self.MAX_TOTAL_PARTITIONS
+                and j < self.spills - 1
+                and keys.nbytes + values.nbytes > limit
+            ):
+                del keys, values  # will read from disk again
+                return self._recursive_merged_items(index)
+
+        return zip(keys.tolist(), values.tolist())
+
+    def _recursive_merged_items(self, index):
+        """
+        merge the arrays dumped for the partition by another ExternalArrayMerger, which
+        partitions them by the next digits of the hash of the keys when they do not fit in
+        memory.
+        """
+        if self._fallback:
+            return ExternalMerger._recursive_merged_items(self, index)
+
+        subdirs = [os.path.join(d, "parts", str(index)) for d in self.localdirs]
+        m = ExternalArrayMerger(
+            self.agg,
+            self.memory_limit,
+            self.serializer,
+            subdirs,
+            self.scale * self.partitions,
+            self.partitions,
+            self.batch,
+        )
+        for j in range(self.spills):
+            m._merge_table(*self._load_spilled_arrays(j, index))
+        return m.items()
+
+
+def _create_merger(aggregator, memory_limit, serializer=None):
+    """
+    Return an ExternalArrayMerger for the aggregators that have a `reduction` if NumPy is
+    installed, or an ExternalMerger otherwise.
+    """
+    if aggregator.reduction is not None:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            return ExternalArrayMerger(aggregator, memory_limit, serializer)
+    return ExternalMerger(aggregator, memory_limit, serializer)
+
+
 class ExternalSorter:
     """
     ExternalSorter will divide the elements into chunks, sort them in
@@ -530,10 +943,190 @@ class ExternalSorter:
         return heapq.merge(*chunks, key=key, reverse=reverse)
 
 
+class ExternalArraySorter(ExternalSorter):
+    """
+    ExternalSorter specialized for the elements whose keys are all `int`, all `float` or
+    all `str`, which sorts them with Arrow rather than by comparing Python objects.
+
+    When the used memory goes above the limit, the keys of the elements are converted into
+    an Arrow array, the elements are sorted by their keys with a stable `sort_indices` and
+    dumped into disks as a run of Arrow IPC record batches holding the keys, next to the
+    elements dumped by the serializer, which compresses them as in ExternalSorter. The runs
+    are merged back batch by batch: all the rows that do not come after the smallest last
+    key of the current batches of the runs are taken at once and sorted together. The
+    elements that fit in memory are sorted as by ExternalSorter.
+
+    As soon as a chunk has other keys, NaN keys, or integers that do not fit in 64 bits,
+    the elements read so far and the rest of them are sorted by ExternalSorter.
+
+    Examples
+    --------
+    >>> sorter = ExternalArraySorter(1)  # 1M
+    >>> import random
+    >>> l = list(range(1024))
+    >>> random.shuffle(l)
+    >>> sorted(l) == list(sorter.sorted(l))
+    True
+    >>> sorted(l) == list(sorter.sorted(l, key=lambda x: -x, reverse=True))
+    True
+    >>> list(sorter.sorted([(2, "a"), ("b", 1), (1, "c")], key=lambda kv: str(kv[0])))
+    [(1, 'c'), (2, 'a'), ('b', 1)]
+    """
+
+    # the number of elements converted into arrays, and of rows in the spilled batches
+    BATCH_SIZE = 1 << 14
+
+    def sorted(self, iterator, key=None, reverse=False):
+        """
+        Sort the elements in iterator, do external sort when the memory
+        goes above the limit.
+        """
+        global MemoryBytesSpilled
+        limit = self._next_limit()
+        runs, chunk, key_type = [], [], None
+        iterator = iter(iterator)
+        while True:
+            batch = list(itertools.islice(iterator, self.BATCH_SIZE))
+            chunk.extend(batch)
+            if len(batch) < self.BATCH_SIZE and not (runs and chunk):
+                break
+
+            used_memory = get_used_memory()
+            if used_memory > limit or len(batch) < self.BATCH_SIZE:
+                keys = self._to_array(chunk if key is None else list(map(key, chunk)), key_type)
+                if keys is None:
+                    # sort the elements of the spilled runs again, they are in the order of
+                    # the iterator up to the equal keys, which the stable sort keeps
+                    spilled = (e for run in runs for _, elements in run for e in elements)
+                    iterator = itertools.chain(spilled, chunk, iterator)
+                    return ExternalSorter.sorted(self, iterator, key, reverse)
+                key_type = keys.type
+                order = self._sort_indices(keys, reverse)
+                keys, chunk = keys.take(order), list(map(chunk.__getitem__, order.to_pylist()))
+                if len(batch) < self.BATCH_SIZE:
+                    # the last chunk is merged from memory
+                    runs.append(
+                        (keys.slice(i, self.BATCH_SIZE), chunk[i : i + self.BATCH_SIZE])
+                        for i in range(0, len(chunk), self.BATCH_SIZE)
+                    )
+                    return self._merge(runs, reverse)
+                runs.append(self._spill(len(runs), keys, chunk))
+                chunk = []
+                MemoryBytesSpilled += max(used_memory - get_used_memory(), 0) << 20
+
+        if not runs:
+            # the elements fit in memory, the keys are compared by sort() as fast as by Arrow
+            chunk.sort(key=key, reverse=reverse)
+            return chunk
+        return self._merge(runs, reverse)
+
+    @staticmethod
+    def _to_array(keys, key_type):
+        """Return the keys as an Arrow array of key_type, or None if they cannot be sorted"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        types = set(map(type, keys))
+        if len(types) != 1:
+            return None
+        arrow_type = {int: pa.int64(), float: pa.float64(), str: pa.string()}.get(types.pop())
+        if arrow_type is None or (key_type is not None and key_type != arrow_type):
+            return None
+        try:
+            keys = pa.array(keys, type=arrow_type)
+        except (OverflowError, UnicodeEncodeError, pa.ArrowInvalid):
+            return None
+        if arrow_type == pa.float64() and pc.any(pc.is_nan(keys)).as_py():
+            return None
+        return keys
+
+    @staticmethod
+    def _sort_indices(keys, reverse):
+        import pyarrow.compute as pc
+
+        return pc.array_sort_indices(keys, order="descending" if reverse else "ascending")
+
+    def _spill(self, n, keys, elements):
+        """
+        Dump the sorted keys and elements into disks, return the iterator of their batches
+        loaded back.
+        """
+        import pyarrow as pa
+
+        global DiskBytesSpilled
+        path = self._get_path(n)
+        # the keys are dumped as Arrow, the elements by the serializer in the same order
+        keys_path = path + ".keys"
+        with pa.OSFile(keys_path, "wb") as f:
+            with pa.ipc.new_stream(f, pa.schema([("key", keys.type)])) as writer:
+                for i in range(0, len(keys), self.BATCH_SIZE):
+                    writer.write(pa.record_batch([keys.slice(i, self.BATCH_SIZE)], ["key"]))
+        with open(path, "wb") as f:
+            self.serializer.dump_stream(elements, f)
+
+        def load(keys_file, f):
+            loaded = self.serializer.load_stream(f)
+            for batch in pa.ipc.open_stream(keys_file):
+                yield batch.column(0), list(itertools.islice(loaded, batch.num_rows))
+            # close the files explicit once we consume all the items
+            keys_file.close()
+            f.close()
+
+        run = load(open(keys_path, "rb"), open(path, "rb"))
+        DiskBytesSpilled += os.path.getsize(keys_path) + os.path.getsize(path)
+        os.unlink(keys_path)
+        os.unlink(path)  # data will be deleted after close
+        return run
+
+    def _merge(self, runs, reverse):
+        """Merge the sorted runs of batches of keys and elements"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        taken = pc.greater_equal if reverse else pc.less_equal
+        # the current batch of each run which is not exhausted, with its number of taken rows
+        heads = [[*head, 0, run] for run in map(iter, runs) for head in [next(run, None)] if head]
+        while len(heads) > 1:
+            # the rows up to the bound in every run come before the rest of the rows
+            bound = (max if reverse else min)(keys[-1].as_py() for keys, _, _, _ in heads)
+            keys, elements = [], []
+            for head in heads:
+                head_keys, head_elements, offset, run = head
+                n = pc.sum(taken(head_keys, bound)).as_py() or 0
+                keys.append(head_keys.slice(0, n))
+                elements.extend(head_elements[offset : offset + n])
+                head[0], head[2] = head_keys.slice(n), offset + n
+                if len(head[0]) == 0:
+                    head[:3] = (*next(run, (None, None)), 0)
+            heads = [head for head in heads if head[0] is not None]
+
+            # the stable sort keeps the equal keys in the order of the runs
+            order = self._sort_indices(pa.concat_arrays(keys), reverse).to_pylist()
+            yield from map(elements.__getitem__, order)
+
+        for _, elements, offset, run in heads:
+            yield from elements[offset:]
+            for _, elements in run:
+                yield from elements
+
+
+def _create_sorter(memory_limit, serializer=None):
+    """
+    Return an ExternalArraySorter if PyArrow is installed, or an ExternalSorter otherwise.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return ExternalSorter(memory_limit, serializer)
+    return ExternalArraySorter(memory_limit, serializer)
+
+
 class ExternalList:
     """
     ExternalList can have many items which cannot be hold in memory in
-    the same time.
+    the same time. The items are dumped into disks once there are LIMIT of
+    them, or their estimated size goes above MEMORY_LIMIT bytes, which is
+    checked every SIZE_CHECK_INTERVAL items.
 
     Examples
     --------
@@ -556,6 +1149,8 @@ class ExternalList:
     """
 
     LIMIT = 10240
+    MEMORY_LIMIT = 16 << 20
+    SIZE_CHECK_INTERVAL = 256
 
     def __init__(self, values):
         self.values = values
@@ -601,7 +1196,10 @@ class ExternalList:
         self.values.append(value)
         self.count += 1
         # dump them into disk if the key is huge
-        if len(self.values) >= self.LIMIT:
+        n = len(self.values)
+        if n >= self.LIMIT or (
+            n % self.SIZE_CHECK_INTERVAL == 0 and _estimate_size(self.values) >= self.MEMORY_LIMIT
+        ):
             self._spill()
 
     def _open_file(self):
@@ -625,13 +1223,13 @@ class ExternalList:
         if self._file is None:
             self._open_file()
 
-        used_memory = get_used_memory()
+        used_memory = _estimate_size(self.values)
         pos = self._file.tell()
         self._ser.dump_stream(self.values, self._file)
         self.values = []
         gc.collect()
         DiskBytesSpilled += self._file.tell() - pos
-        MemoryBytesSpilled += max(used_memory - get_used_memory(), 0) << 20
+        MemoryBytesSpilled += used_memory
 
 
 class ExternalListOfList(ExternalList):
@@ -740,9 +1338,6 @@ class ExternalGroupBy(ExternalMerger):
         ser = self.serializer
         return FlattenedValuesSerializer(ser, 20)
 
-    def _object_size(self, obj):
-        return len(obj)
-
     def _spill(self):
         """
         dump already partitioned data into disks.
@@ -752,7 +1347,7 @@ class ExternalGroupBy(ExternalMerger):
         if not os.path.exists(path):
             os.makedirs(path)
 
-        used_memory = get_used_memory()
+        used_memory = self._used_memory()
         if not self.pdata:
             # The data has not been partitioned, it will iterator the
             # data once, write them into different files, has no
@@ -799,7 +1394,8 @@ class ExternalGroupBy(ExternalMerger):
 
         self.spills += 1
         gc.collect()  # release the memory as much as possible
-        MemoryBytesSpilled += max(used_memory - get_used_memory(), 0) << 20
+        self._tracker.reset()
+        MemoryBytesSpilled += used_memory
 
     def _merged_items(self, index):
         size = sum(
@@ -0,0 +1,113 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import datetime
+import decimal
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from unittest import mock
+
+from pyspark.sql.conversion import LocalDataToArrowConversion
+from pyspark.sql.types import (
+    ArrayType,
+    DecimalType,
+    DoubleType,
+    LongType,
+    StringType,
+    StructType,
+    TimestampType,
+)
+
+
+def primitive_data(num_rows: int) -> Tuple[List[Any], StructType]:
+    schema = (
+        StructType()
+        .add("id", LongType(), nullable=False)
+        .add("x", DoubleType())
+        .add("name", StringType())
+    )
+    return [(i, i * 0.5, "name_%d" % i) for i in range(num_rows)], schema
+
+
+def temporal_data(num_rows: int) -> Tuple[List[Any], StructType]:
+    schema = StructType().add("ts", TimestampType()).add("amount", DecimalType(18, 2))
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        (start + datetime.timedelta(seconds=i), decimal.Decimal(i) / 100) for i in range(num_rows)
+    ], schema
+
+
+def nested_data(num_rows: int) -> Tuple[List[Any], StructType]:
+    schema = (
+        StructType()
+        .add("id", LongType())
+        .add("point", StructType().add("x", DoubleType()).add("y", DoubleType()))
+        .add("tags", ArrayType(StringType()))
+    )
+    return [(i, (i * 0.5, i * 2.0), ["a", "b"]) for i in range(num_rows)], schema
+
+
+def measure(f: Callable[..., Any], *args: Any, repeat: int = 3) -> float:
+    # Best of `repeat` runs, to leave out warm-up and garbage collection pauses.
+    timings = []
+    for _ in range(repeat):
+        start_time_ns = time.perf_counter_ns()
+        f(*args)
+        timings.append((time.perf_counter_ns() - start_time_ns) / 1000 / 1000)
+    return min(timings)
+
+
+def benchmark(num_rows: int) -> None:
+    shapes: Dict[str, Callable[[int], Tuple[List[Any], StructType]]] = {
+        "primitive": primitive_data,
+        "timestamp and decimal": temporal_data,
+        "nested": nested_data,
+    }
+    print(" ==================== LocalDataToArrowConversion (millis) ======================")
+    print("rows: %d" % num_rows)
+    for name, generate in shapes.items():
+        data, schema = generate(num_rows)
+        bulk = measure(LocalDataToArrowConversion.convert, data, schema, False)
+        # Force every column through the per-value converters.
+        with mock.patch.object(
+            LocalDataToArrowConversion, "_convert_column", staticmethod(lambda *_: None)
+        ):
+            per_value = measure(LocalDataToArrowConversion.convert, data, schema, False)
+        print("%s:" % name)
+        print("  per-value converters:\t{:.3f}".format(per_value))
+        print("  bulk columns:\t\t{:.3f}".format(bulk))
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/sql/benchmark/benchmark_local_data_to_arrow.py <number of rows>`
+
+    The benchmark converts local rows of several schema shapes to an Arrow table, once with
+    the columnar fast path and once with the per-value converters only.
+    """
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    benchmark(num_rows)
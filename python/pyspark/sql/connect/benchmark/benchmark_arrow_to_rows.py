@@ -0,0 +1,137 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import datetime
+import time
+from typing import Callable, List
+
+import numpy as np
+import pyarrow as pa
+
+from pyspark.sql.conversion import ArrowTableToRowsConversion
+from pyspark.sql.types import (
+    BinaryType,
+    DoubleType,
+    LongType,
+    Row,
+    StringType,
+    StructType,
+    TimestampNTZType,
+    TimestampType,
+)
+
+
+def flat_table(num_rows: int) -> pa.Table:
+    micros = np.random.randint(0, 2 * 10**15, num_rows)
+    return pa.table(
+        {
+            "id": np.arange(num_rows, dtype=np.int64),
+            "value": np.random.rand(num_rows),
+            "name": pa.array(np.random.randint(0, 1000, num_rows).astype(str)),
+            "data": pa.array([b"%d" % i for i in range(num_rows)], pa.binary()),
+            "ts": pa.array(micros, pa.timestamp("us", tz="UTC")),
+            "ts_ntz": pa.array(micros, pa.timestamp("us")),
+        }
+    )
+
+
+FLAT_SCHEMA = (
+    StructType()
+    .add("id", LongType())
+    .add("value", DoubleType())
+    .add("name", StringType())
+    .add("data", BinaryType())
+    .add("ts", TimestampType())
+    .add("ts_ntz", TimestampNTZType())
+)
+
+
+def convert_per_value(table: pa.Table, schema: StructType) -> List[Row]:
+    """
+    Converts the table value by value with the converter of each column, and creates the rows
+    with Row(*values).
+    """
+    field_converters = [
+        ArrowTableToRowsConversion._create_converter(f.dataType, none_on_identity=True)
+        for f in schema.fields
+    ]
+    columnar_data = [
+        [conv(v) for v in column.to_pylist()] if conv is not None else column.to_pylist()
+        for column, conv in zip(table.columns, field_converters)
+    ]
+    rows = []
+    for values in zip(*columnar_data):
+        row = Row(*values)
+        row.__fields__ = schema.names
+        rows.append(row)
+    return rows
+
+
+def measure(func: Callable[[], List], iterations: int) -> float:
+    elapsed = []
+    for _ in range(iterations):
+        start_time_ns = time.perf_counter_ns()
+        func()
+        elapsed.append((time.perf_counter_ns() - start_time_ns) / 1000 / 1000)
+    return float(np.median(elapsed))
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/sql/connect/benchmark/benchmark_arrow_to_rows.py
+        <number of rows> <iterations>`
+
+    The benchmark converts an Arrow table with a flat schema of numeric, string, binary and
+    timestamp columns to rows, as DataFrame.collect() does with the results of Spark Connect.
+    It compares ArrowTableToRowsConversion.convert, which converts the null, binary and
+    timestamp columns in bulk and pauses the garbage collector while creating the rows, with
+    converting every value with the converter of its column, and with Table.to_pylist(),
+    which creates a dict per row without any conversion.
+    """
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    table = flat_table(num_rows)
+    print(" ==================== Arrow table to rows (millis) ======================")
+    print("rows: %d, timezone: %s" % (num_rows, datetime.datetime.now().astimezone().tzname()))
+    for column in FLAT_SCHEMA.names + [None]:
+        if column is None:
+            label, tbl, schema = "all columns", table, FLAT_SCHEMA
+        else:
+            label, tbl, schema = column, table.select([column]), StructType([FLAT_SCHEMA[column]])
+        print(label)
+        print(
+            "  convert:\t{:.3f}".format(
+                measure(lambda: ArrowTableToRowsConversion.convert(tbl, schema), iterations)
+            )
+        )
+        print(
+            "  per value:\t{:.3f}".format(
+                measure(lambda: convert_per_value(tbl, schema), iterations)
+            )
+        )
+        print("  to_pylist:\t{:.3f}".format(measure(lambda: tbl.to_pylist(), iterations)))
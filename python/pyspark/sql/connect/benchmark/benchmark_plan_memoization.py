@@ -0,0 +1,72 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import time
+
+from pyspark.sql.connect.functions import builtin as F
+from pyspark.sql.connect.plan import LogicalPlan, PlanCache, Range, WithColumns
+
+
+class SessionStub:
+    """
+    Stand-in for the Spark Connect client, only used for its plan cache.
+    """
+
+    def __init__(self, plan_cache_size: int) -> None:
+        self._plan_cache = PlanCache(plan_cache_size)
+
+
+def measure(depth: int, action_every: int, plan_cache_size: int) -> float:
+    session = SessionStub(plan_cache_size)
+    plan: LogicalPlan = Range(0, 10, 1, None)
+
+    start_time_ns = time.perf_counter_ns()
+    for i in range(depth):
+        plan = WithColumns(plan, ["c%d" % i], [F.lit(i) + F.col("id")])
+        if (i + 1) % action_every == 0:
+            plan.to_proto(session)  # type: ignore[arg-type]
+    plan.to_proto(session)  # type: ignore[arg-type]
+    return (time.perf_counter_ns() - start_time_ns) / 1000 / 1000
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/sql/connect/benchmark/benchmark_plan_memoization.py <plan depth>`
+
+    The benchmark builds a chain of `withColumn` plans, as iterative code does, and converts
+    the plan to a proto message after every step, every 10 steps, and only at the end, without
+    and with the plan cache.
+    """
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    print(" ==================== Deep plan to proto (millis) ======================")
+    print("plan depth: %d" % depth)
+    for plan_cache_size in [0, 16]:
+        print("plan cache size: %d" % plan_cache_size)
+        for action_every in [1, 10, depth]:
+            elapsed = measure(depth, action_every, plan_cache_size)
+            print("  action every {} steps:\t{:.3f}".format(action_every, elapsed))
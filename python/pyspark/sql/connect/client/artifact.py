@@ -25,9 +25,11 @@ import importlib
 import io
 import sys
 import os
+import threading
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
-from typing import List, Iterable, BinaryIO, Iterator, Optional, Tuple
+from typing import Dict, List, Iterable, BinaryIO, Iterator, Optional, Tuple
 import abc
 from pathlib import Path
 from urllib.parse import urlparse
@@ -62,6 +64,26 @@ class LocalData(metaclass=abc.ABCMeta):
     def size(self) -> int:
         pass
 
+    @cached_property
+    def digest(self) -> str:
+        """
+        SHA-256 hex digest of the payload.
+        """
+        return self._hash()
+
+    def _hash(self) -> str:
+        sha = hashlib.sha256()
+        with self.stream() as stream:
+            for block in iter(lambda: stream.read(1024 * 1024), b""):
+                sha.update(block)
+        return sha.hexdigest()
+
+
+# The digests of local files by absolute path, along with the size and modification time of the
+# file they were computed for, so that files that did not change are not hashed again.
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+_file_digests_lock = threading.Lock()
+
 
 class LocalFile(LocalData):
     """
@@ -82,6 +104,22 @@ class LocalFile(LocalData):
     def size(self) -> int:
         return os.path.getsize(self.path)
 
+    @cached_property
+    def digest(self) -> str:
+        """
+        SHA-256 hex digest of the file, which is only computed again if the file changed.
+        """
+        path = os.path.abspath(self.path)
+        stat = os.stat(path)
+        with _file_digests_lock:
+            cached = _file_digests.get(path)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        digest = self._hash()
+        with _file_digests_lock:
+            _file_digests[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
     def stream(self) -> BinaryIO:
         return open(self.path, "rb")
 
@@ -161,18 +199,27 @@ class ArtifactManager:
         An unique identifier of the session which the artifact manager belongs to.
     channel: grpc.Channel
         GRPC Channel instance.
+    upload_parallelism: int
+        Maximum number of `AddArtifacts` streams that upload the artifacts of a single
+        :meth:`add_artifacts` call concurrently.
     """
 
     # Using the midpoint recommendation of 32KiB for chunk size as specified in
     # https://github.com/grpc/grpc.github.io/issues/371.
     CHUNK_SIZE: int = 32 * 1024
 
+    # The digests of the artifacts that have been uploaded, by session and name. These are shared
+    # by all the artifact managers of a session in this process.
+    _uploaded: Dict[Tuple[str, str], str] = {}
+    _uploaded_lock = threading.Lock()
+
     def __init__(
         self,
         user_id: Optional[str],
         session_id: str,
         channel: grpc.Channel,
         metadata: Iterable[Tuple[str, str]],
+        upload_parallelism: int = 1,
     ):
         self._user_context = proto.UserContext()
         if user_id is not None:
@@ -180,6 +227,7 @@ class ArtifactManager:
         self._stub = grpc_lib.SparkConnectServiceStub(channel)
         self._session_id = session_id
         self._metadata = metadata
+        self._upload_parallelism = max(upload_parallelism, 1)
 
     def _parse_artifacts(
         self, path_or_uri: str, pyfile: bool, archive: bool, file: bool
@@ -294,14 +342,75 @@ class ArtifactManager:
 
     def add_artifacts(self, *path: str, pyfile: bool, archive: bool, file: bool) -> None:
         """
-        Add a single artifact to the session.
+        Add artifacts to the session.
         Currently only local files with .jar extension is supported.
+
+        Artifacts whose content has already been uploaded to the session under the same name
+        are skipped if the server still has them, so that calling this again after a failure
+        only uploads the artifacts that did not make it. The remaining artifacts are split into
+        up to `upload_parallelism` groups of similar size that are uploaded in concurrent
+        streams.
         """
-        requests: Iterator[proto.AddArtifactsRequest] = self._create_requests(
-            *path, pyfile=pyfile, archive=archive, file=file
-        )
+        artifacts = [
+            artifact
+            for p in path
+            for artifact in self._parse_artifacts(p, pyfile=pyfile, archive=archive, file=file)
+        ]
+        uploaded = [artifact.path for artifact in artifacts if self._is_uploaded(artifact)]
+        if len(uploaded) > 0:
+            statuses = self._artifact_statuses(uploaded)
+            artifacts = [artifact for artifact in artifacts if not statuses.get(artifact.path)]
+        if len(artifacts) == 0:
+            return
+
+        groups = self._group_artifacts(artifacts)
+        if len(groups) == 1:
+            self._upload_artifacts(groups[0])
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(groups), thread_name_prefix="artifact-upload"
+            ) as pool:
+                # Wait for all the uploads, so that the successful ones are recorded even if
+                # another one fails, and raise the first failure.
+                futures = [pool.submit(self._upload_artifacts, group) for group in groups]
+                for future in futures:
+                    future.exception()
+                for future in futures:
+                    future.result()
+
+    def _is_uploaded(self, artifact: Artifact) -> bool:
+        with self._uploaded_lock:
+            digest = self._uploaded.get((self._session_id, artifact.path))
+        return digest is not None and digest == artifact.storage.digest
+
+    def _group_artifacts(self, artifacts: List[Artifact]) -> List[List[Artifact]]:
+        """
+        Split the artifacts into up to `upload_parallelism` groups of similar total size,
+        assigning the largest artifacts first to the smallest group.
+        """
+        num_groups = min(self._upload_parallelism, len(artifacts))
+        if num_groups == 1:
+            return [artifacts]
+        groups: List[List[Artifact]] = [[] for _ in range(num_groups)]
+        sizes = [0] * num_groups
+        for artifact in sorted(artifacts, key=lambda a: a.size, reverse=True):
+            i = sizes.index(min(sizes))
+            groups[i].append(artifact)
+            sizes[i] += artifact.size
+        return groups
+
+    def _upload_artifacts(self, artifacts: List[Artifact]) -> None:
+        def generator() -> Iterator[proto.AddArtifactsRequest]:
+            try:
+                yield from self._add_artifacts(artifacts)
+            except Exception as e:
+                logger.error(f"Failed to submit addArtifacts request: {e}")
+                raise
 
-        self._request_add_artifacts(requests)
+        self._request_add_artifacts(generator())
+        with self._uploaded_lock:
+            for artifact in artifacts:
+                self._uploaded[(self._session_id, artifact.path)] = artifact.storage.digest
 
     def _add_forward_to_fs_artifacts(self, local_path: str, dest_path: str) -> None:
         requests: Iterator[proto.AddArtifactsRequest] = self._add_artifacts(
@@ -413,19 +522,24 @@ class ArtifactManager:
                         ),
                     )
 
-    def is_cached_artifact(self, hash: str) -> bool:
+    def _artifact_statuses(self, names: List[str]) -> Dict[str, bool]:
         """
-        Ask the server either any artifact with `hash` has been cached at the server side or not.
+        Ask the server which of the artifacts with the given names exist at the server side.
         """
-        artifactName = CACHE_PREFIX + "/" + hash
         request = proto.ArtifactStatusesRequest(
-            user_context=self._user_context, session_id=self._session_id, names=[artifactName]
+            user_context=self._user_context, session_id=self._session_id, names=names
         )
         resp: proto.ArtifactStatusesResponse = self._stub.ArtifactStatus(
             request, metadata=self._metadata
         )
-        status = resp.statuses.get(artifactName)
-        return status.exists if status is not None else False
+        return {name: status.exists for name, status in resp.statuses.items()}
+
+    def is_cached_artifact(self, hash: str) -> bool:
+        """
+        Ask the server either any artifact with `hash` has been cached at the server side or not.
+        """
+        artifactName = CACHE_PREFIX + "/" + hash
+        return self._artifact_statuses([artifactName]).get(artifactName, False)
 
     def cache_artifact(self, blob: bytes) -> str:
         """
@@ -34,7 +34,10 @@ import platform
 import urllib.parse
 import uuid
 import sys
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
+    Deque,
     Iterable,
     Iterator,
     Optional,
@@ -96,6 +99,7 @@ from pyspark.sql.connect.plan import (
     CommonInlineUserDefinedDataSource,
     PythonUDTF,
     PythonDataSource,
+    PlanCache,
 )
 from pyspark.sql.connect.observation import Observation
 from pyspark.sql.connect.utils import get_python_ver
@@ -126,6 +130,9 @@ class ChannelBuilder:
     PARAM_USER_ID = "user_id"
     PARAM_USER_AGENT = "user_agent"
     PARAM_SESSION_ID = "session_id"
+    PARAM_ARROW_DECODE_THREADS = "arrow_decode_threads"
+    PARAM_ARTIFACT_UPLOAD_PARALLELISM = "artifact_upload_parallelism"
+    PARAM_PLAN_CACHE_SIZE = "plan_cache_size"
 
     GRPC_MAX_MESSAGE_LENGTH_DEFAULT = 128 * 1024 * 1024
 
@@ -244,6 +251,9 @@ class ChannelBuilder:
                 ChannelBuilder.PARAM_USER_ID,
                 ChannelBuilder.PARAM_USER_AGENT,
                 ChannelBuilder.PARAM_SESSION_ID,
+                ChannelBuilder.PARAM_ARROW_DECODE_THREADS,
+                ChannelBuilder.PARAM_ARTIFACT_UPLOAD_PARALLELISM,
+                ChannelBuilder.PARAM_PLAN_CACHE_SIZE,
             ]
         ]
 
@@ -266,6 +276,50 @@ class ChannelBuilder:
                 )
         return session_id
 
+    @property
+    def arrow_decode_threads(self) -> Optional[int]:
+        """
+        Returns
+        -------
+        The number of threads decoding Arrow batches of results extracted from the parameters
+        of the connection string or `None` if not specified.
+        """
+        return self._get_non_negative_int(ChannelBuilder.PARAM_ARROW_DECODE_THREADS)
+
+    @property
+    def artifact_upload_parallelism(self) -> Optional[int]:
+        """
+        Returns
+        -------
+        The maximum number of concurrent artifact upload streams extracted from the parameters
+        of the connection string or `None` if not specified.
+        """
+        return self._get_non_negative_int(ChannelBuilder.PARAM_ARTIFACT_UPLOAD_PARALLELISM)
+
+    @property
+    def plan_cache_size(self) -> Optional[int]:
+        """
+        Returns
+        -------
+        The maximum number of cached relations of logical plans extracted from the parameters
+        of the connection string or `None` if not specified.
+        """
+        return self._get_non_negative_int(ChannelBuilder.PARAM_PLAN_CACHE_SIZE)
+
+    def _get_non_negative_int(self, key: str) -> Optional[int]:
+        value = self._params.get(key, None)
+        if value is None:
+            return None
+        if not str(value).isdigit():
+            raise PySparkValueError(
+                errorClass="INVALID_CONNECT_URL",
+                messageParameters={
+                    "detail": f"Parameter '{key}' should be a non-negative integer, "
+                    f"found '{value}'.",
+                },
+            )
+        return int(value)
+
     @property
     def userAgent(self) -> str:
         """
@@ -582,6 +636,62 @@ class AnalyzeResult:
         )
 
 
+class AnalyzeCache:
+    """
+    Bounded LRU cache of the results of the AnalyzePlan methods that only depend on the analyzed
+    plan, keyed by the method and the serialized plan. Since the plan contains the plan ids of
+    its DataFrames, entries are only shared between analyses of the same DataFrames. All
+    entries are dropped when the session state that the analysis depends on may have changed,
+    i.e. when a config is set or unset, a command or catalog operation is executed, or an
+    artifact is added.
+    """
+
+    CACHED_METHODS = ("schema", "is_streaming")
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, bytes], AnalyzeResult]" = OrderedDict()
+        # Incremented on every invalidation, so that results of analyses that were running
+        # concurrently with an invalidation are not cached.
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def key(self, method: str, plan: pb2.Plan) -> Optional[Tuple[str, bytes]]:
+        if self._max_size <= 0 or method not in AnalyzeCache.CACHED_METHODS:
+            return None
+        return method, plan.SerializeToString(deterministic=True)
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[AnalyzeResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Tuple[str, bytes], result: AnalyzeResult, epoch: int) -> None:
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+
 class ConfigResult:
     def __init__(self, pairs: List[Tuple[str, Optional[str]]], warnings: List[str]):
         self.pairs = pairs
@@ -608,6 +718,10 @@ class SparkConnectClient(object):
         retry_policy: Optional[Dict[str, Any]] = None,
         use_reattachable_execute: bool = True,
         session_hooks: Optional[list["SparkSession.Hook"]] = None,
+        arrow_decode_threads: Optional[int] = None,
+        analyze_cache_size: int = 128,
+        artifact_upload_parallelism: Optional[int] = None,
+        plan_cache_size: Optional[int] = None,
     ):
         """
         Creates a new SparkSession for the Spark Connect interface.
@@ -640,6 +754,25 @@ class SparkConnectClient(object):
             Enable reattachable execution.
         session_hooks: list[SparkSession.Hook], optional
             List of session hooks to call.
+        arrow_decode_threads: int, optional
+            Number of threads that decode the Arrow batches of results while the following
+            responses are received. The batches are still returned in the order of the
+            responses. 0, the default, decodes the batches in the thread consuming the results.
+            The threads hide the latency of receiving the responses; the speedup from decoding
+            on several CPUs at once is not measured yet.
+            Defining `arrow_decode_threads` as part of the connection string takes precedence.
+        analyze_cache_size: int
+            Maximum number of cached schema and streaming analyses of plans, see
+            :class:`AnalyzeCache`. 0 disables the cache.
+        artifact_upload_parallelism: int, optional
+            Maximum number of concurrent streams that upload the artifacts added at once.
+            Defaults to 1, a single stream. Defining `artifact_upload_parallelism` as part of
+            the connection string takes precedence.
+        plan_cache_size: int, optional
+            Maximum number of relations of logical plans that are cached and reused when the
+            plans are built again, e.g. as the children of the next step of an iterative chain
+            of `withColumn` calls, see :class:`PlanCache`. 0, the default, disables the cache.
+            Defining `plan_cache_size` as part of the connection string takes precedence.
         """
         self.thread_local = threading.local()
 
@@ -675,10 +808,28 @@ class SparkConnectClient(object):
         self._channel = self._builder.toChannel()
         self._closed = False
         self._internal_stub = grpc_lib.SparkConnectServiceStub(self._channel)
+        if self._builder.artifact_upload_parallelism is not None:
+            artifact_upload_parallelism = self._builder.artifact_upload_parallelism
+        elif artifact_upload_parallelism is None:
+            artifact_upload_parallelism = 1
         self._artifact_manager = ArtifactManager(
-            self._user_id, self._session_id, self._channel, self._builder.metadata()
+            self._user_id,
+            self._session_id,
+            self._channel,
+            self._builder.metadata(),
+            upload_parallelism=artifact_upload_parallelism,
         )
         self._use_reattachable_execute = use_reattachable_execute
+        if self._builder.arrow_decode_threads is not None:
+            self._arrow_decode_threads = self._builder.arrow_decode_threads
+        elif arrow_decode_threads is not None:
+            self._arrow_decode_threads = arrow_decode_threads
+        else:
+            self._arrow_decode_threads = 0
+        self._analyze_cache = AnalyzeCache(analyze_cache_size)
+        if self._builder.plan_cache_size is not None:
+            plan_cache_size = self._builder.plan_cache_size
+        self._plan_cache = PlanCache(plan_cache_size or 0)
         self._session_hooks = session_hooks or []
         # Configure logging for the SparkConnect client.
 
@@ -898,9 +1049,13 @@ class SparkConnectClient(object):
 
     def to_table_as_iterator(
         self, plan: pb2.Plan, observations: Dict[str, Observation]
-    ) -> Iterator[Union[StructType, "pa.Table"]]:
+    ) -> Iterator[Union[StructType, "pa.Table", ExecutionInfo]]:
         """
         Return given plan as a PyArrow Table iterator.
+
+        The tables are yielded one Arrow batch at a time as the batches arrive, and the next
+        response is only fetched when the consumer asks for the next table. The execution info
+        is yielded last, once the whole result was consumed.
         """
         if logger.isEnabledFor(logging.DEBUG):
             # inside an if statement to not incur a performance cost converting proto to string
@@ -908,12 +1063,19 @@ class SparkConnectClient(object):
             logger.debug(f"Executing plan {self._proto_to_string(plan, True)}")
         req = self._execute_plan_request_with_metadata()
         req.plan.CopyFrom(plan)
+        metrics: List[PlanMetrics] = []
+        observed_metrics: List[PlanObservedMetrics] = []
         with Progress(handlers=self._progress_handlers, operation_id=req.operation_id) as progress:
             for response in self._execute_and_fetch_as_iterator(req, observations, progress):
                 if isinstance(response, StructType):
                     yield response
                 elif isinstance(response, pa.RecordBatch):
                     yield pa.Table.from_batches([response])
+                elif isinstance(response, PlanMetrics):
+                    metrics.append(response)
+                elif isinstance(response, PlanObservedMetrics):
+                    observed_metrics.append(response)
+        yield ExecutionInfo(metrics, observed_metrics)
 
     def to_table(
         self, plan: pb2.Plan, observations: Dict[str, Observation]
@@ -1348,16 +1510,40 @@ class SparkConnectClient(object):
                 },
             )
 
+        cache_key = (
+            self._analyze_cache.key(method, cast(pb2.Plan, kwargs.get("plan")))
+            if "plan" in kwargs
+            else None
+        )
+        if cache_key is not None:
+            cached = self._analyze_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"AnalyzePlan cache hit for method {method}.")
+                return cached
+        epoch = self._analyze_cache.epoch
+
         try:
             for attempt in self._retrying():
                 with attempt:
                     resp = self._stub.AnalyzePlan(req, metadata=self._builder.metadata())
                     self._verify_response_integrity(resp)
-                    return AnalyzeResult.fromProto(resp)
+                    result = AnalyzeResult.fromProto(resp)
+                    if cache_key is not None:
+                        self._analyze_cache.put(cache_key, result, epoch)
+                    return result
             raise SparkConnectException("Invalid state during retry exception handling.")
         except Exception as error:
             self._handle_error(error)
 
+    def _may_change_analysis(self, req: pb2.ExecutePlanRequest) -> bool:
+        """
+        Whether executing the request may change the results of analyzing other plans, e.g.
+        by creating or altering tables, views or functions.
+        """
+        if req.plan.HasField("command"):
+            return True
+        return req.plan.root.WhichOneof("rel_type") in ("catalog", "sql")
+
     def _execute(self, req: pb2.ExecutePlanRequest) -> None:
         """
         Execute the passed request `req` and drop all results.
@@ -1376,6 +1562,9 @@ class SparkConnectClient(object):
         def handle_response(b: pb2.ExecutePlanResponse) -> None:
             self._verify_response_integrity(b)
 
+        may_change_analysis = self._may_change_analysis(req)
+        if may_change_analysis:
+            self._analyze_cache.invalidate()
         try:
             if self._use_reattachable_execute:
                 # Don't use retryHandler - own retry handling is inside.
@@ -1394,6 +1583,9 @@ class SparkConnectClient(object):
                             handle_response(b)
         except Exception as error:
             self._handle_error(error)
+        finally:
+            if may_change_analysis:
+                self._analyze_cache.invalidate()
 
     def _execute_and_fetch_as_iterator(
         self,
@@ -1421,6 +1613,7 @@ class SparkConnectClient(object):
 
         def handle_response(
             b: pb2.ExecutePlanResponse,
+            decoded_batches: Optional["Future[List[pa.RecordBatch]]"] = None,
         ) -> Iterator[
             Union[
                 "pa.RecordBatch",
@@ -1519,11 +1712,16 @@ class SparkConnectClient(object):
                     )
 
                 num_records_in_batch = 0
-                with pa.ipc.open_stream(b.arrow_batch.data) as reader:
-                    for batch in reader:
-                        assert isinstance(batch, pa.RecordBatch)
+                if decoded_batches is not None:
+                    for batch in decoded_batches.result():
                         num_records_in_batch += batch.num_rows
                         yield batch
+                else:
+                    with pa.ipc.open_stream(b.arrow_batch.data) as reader:
+                        for batch in reader:
+                            assert isinstance(batch, pa.RecordBatch)
+                            num_records_in_batch += batch.num_rows
+                            yield batch
 
                 if num_records_in_batch != b.arrow_batch.row_count:
                     raise SparkConnectException(
@@ -1543,6 +1741,42 @@ class SparkConnectClient(object):
             if b.HasField("ml_command_result"):
                 yield {"ml_command_result": b.ml_command_result}
 
+        def decode_arrow_batches(data: bytes) -> List[pa.RecordBatch]:
+            with pa.ipc.open_stream(data) as reader:
+                return list(reader)
+
+        def handle_responses(
+            responses: Iterable[pb2.ExecutePlanResponse],
+        ) -> Iterator[Any]:
+            if self._arrow_decode_threads <= 0:
+                for b in responses:
+                    yield from handle_response(b)
+                return
+
+            # Decode the Arrow batches of the next responses in a thread pool while the
+            # responses are received, and handle the responses in their original order.
+            max_pending_responses = 2 * self._arrow_decode_threads
+            with ThreadPoolExecutor(
+                max_workers=self._arrow_decode_threads, thread_name_prefix="arrow-decode"
+            ) as pool:
+                pending: Deque[
+                    Tuple[pb2.ExecutePlanResponse, Optional["Future[List[pa.RecordBatch]]"]]
+                ] = deque()
+                for b in responses:
+                    decoded_batches = (
+                        pool.submit(decode_arrow_batches, b.arrow_batch.data)
+                        if b.HasField("arrow_batch")
+                        else None
+                    )
+                    pending.append((b, decoded_batches))
+                    if len(pending) > max_pending_responses:
+                        yield from handle_response(*pending.popleft())
+                while pending:
+                    yield from handle_response(*pending.popleft())
+
+        may_change_analysis = self._may_change_analysis(req)
+        if may_change_analysis:
+            self._analyze_cache.invalidate()
         try:
             if self._use_reattachable_execute:
                 # Don't use retryHandler - own retry handling is inside.
@@ -1550,15 +1784,15 @@ class SparkConnectClient(object):
                     req, self._stub, self._retrying, self._builder.metadata()
                 )
                 try:
-                    for b in generator:
-                        yield from handle_response(b)
+                    yield from handle_responses(generator)
                 finally:
                     generator.close()
             else:
                 for attempt in self._retrying():
                     with attempt:
-                        for b in self._stub.ExecutePlan(req, metadata=self._builder.metadata()):
-                            yield from handle_response(b)
+                        yield from handle_responses(
+                            self._stub.ExecutePlan(req, metadata=self._builder.metadata())
+                        )
         except KeyboardInterrupt as kb:
             logger.debug(f"Interrupt request received for operation={req.operation_id}")
             if progress is not None:
@@ -1567,6 +1801,9 @@ class SparkConnectClient(object):
             raise kb
         except Exception as error:
             self._handle_error(error)
+        finally:
+            if may_change_analysis:
+                self._analyze_cache.invalidate()
 
     def _execute_and_fetch(
         self,
@@ -1683,6 +1920,9 @@ class SparkConnectClient(object):
         if self._server_session_id is not None:
             req.client_observed_server_side_session_id = self._server_session_id
         req.operation.CopyFrom(operation)
+        if operation.WhichOneof("op_type") in ("set", "unset"):
+            # Configs may change the analysis, e.g. the case sensitivity or ANSI mode.
+            self._analyze_cache.invalidate()
         try:
             for attempt in self._retrying():
                 with attempt:
@@ -1926,13 +2166,15 @@ class SparkConnectClient(object):
             raise SparkConnectGrpcException(str(rpc_error)) from None
 
     def add_artifacts(self, *paths: str, pyfile: bool, archive: bool, file: bool) -> None:
+        # Added jars may provide classes that the analysis resolves, e.g. for functions.
+        self._analyze_cache.invalidate()
         try:
-            for path in paths:
-                for attempt in self._retrying():
-                    with attempt:
-                        self._artifact_manager.add_artifacts(
-                            path, pyfile=pyfile, archive=archive, file=file
-                        )
+            # Retries only upload the artifacts that have not been uploaded yet.
+            for attempt in self._retrying():
+                with attempt:
+                    self._artifact_manager.add_artifacts(
+                        *paths, pyfile=pyfile, archive=archive, file=file
+                    )
         except Exception as error:
             self._handle_error(error)
 
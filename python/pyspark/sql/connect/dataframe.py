@@ -75,6 +75,7 @@ from pyspark.serializers import CPickleSerializer
 from pyspark.storagelevel import StorageLevel
 import pyspark.sql.connect.plan as plan
 from pyspark.sql.conversion import ArrowTableToRowsConversion
+from pyspark.sql.metrics import ExecutionInfo
 from pyspark.sql.connect.group import GroupedData
 from pyspark.sql.connect.merge import MergeIntoWriter
 from pyspark.sql.connect.readwriter import DataFrameWriter, DataFrameWriterV2
@@ -107,7 +108,6 @@ if TYPE_CHECKING:
     from pyspark.sql.connect.observation import Observation
     from pyspark.sql.connect.session import SparkSession
     from pyspark.pandas.frame import DataFrame as PandasOnSparkDataFrame
-    from pyspark.sql.metrics import ExecutionInfo
 
 
 class DataFrame(ParentDataFrame):
@@ -1781,16 +1781,31 @@ class DataFrame(ParentDataFrame):
         return sorted(attrs)
 
     def collect(self) -> List[Row]:
-        table, schema = self._to_table()
+        query = self._plan.to_proto(self._session.client)
 
-        # not all datatypes are supported in arrow based collect
-        # here always verify the schema by from_arrow_schema
-        schema2 = from_arrow_schema(table.schema, prefer_timestamp_ntz=True)
-        schema = schema or schema2
+        # Convert the Arrow batches to rows as they arrive, so that only one batch is kept in
+        # memory next to the rows instead of the whole result.
+        rows: List[Row] = []
+        schema: Optional[StructType] = None
+        for schema_or_table in self._session.client.to_table_as_iterator(
+            query, self._plan.observations
+        ):
+            if isinstance(schema_or_table, StructType):
+                schema = schema_or_table
+            elif isinstance(schema_or_table, ExecutionInfo):
+                self._execution_info = schema_or_table
+            else:
+                assert isinstance(schema_or_table, pa.Table)
+                table = schema_or_table
 
-        assert schema is not None and isinstance(schema, StructType)
+                # not all datatypes are supported in arrow based collect
+                # here always verify the schema by from_arrow_schema
+                schema2 = from_arrow_schema(table.schema, prefer_timestamp_ntz=True)
+                schema = schema or schema2
 
-        return ArrowTableToRowsConversion.convert(table, schema)
+                assert schema is not None and isinstance(schema, StructType)
+                rows.extend(ArrowTableToRowsConversion.convert(table, schema))
+        return rows
 
     def _to_table(self) -> Tuple["pa.Table", Optional[StructType]]:
         query = self._plan.to_proto(self._session.client)
@@ -2037,6 +2052,8 @@ class DataFrame(ParentDataFrame):
             if isinstance(schema_or_table, StructType):
                 assert schema is None
                 schema = schema_or_table
+            elif isinstance(schema_or_table, ExecutionInfo):
+                self._execution_info = schema_or_table
             else:
                 assert isinstance(schema_or_table, pa.Table)
                 table = schema_or_table
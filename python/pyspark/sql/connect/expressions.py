@@ -744,6 +744,9 @@ class PythonUDF:
         expr.output_type.CopyFrom(pyspark_types_to_proto_types(output_type))
         expr.eval_type = self._eval_type
         expr.command = CloudPickleSerializer().dumps((self._func, output_type))
+        from pyspark.sql.connect.plan import PlanCache
+
+        PlanCache.record_pickled_function()
         expr.python_ver = self._python_ver
         return expr
 
@@ -24,6 +24,7 @@ check_dependencies(__name__)
 
 from typing import (
     Any,
+    Callable,
     List,
     Optional,
     Type,
@@ -35,9 +36,11 @@ from typing import (
     Dict,
     Tuple,
 )
+from collections import OrderedDict
 import functools
 import json
 import pickle
+import threading
 from threading import Lock
 from inspect import signature, isclass
 
@@ -67,6 +70,133 @@ if TYPE_CHECKING:
     from pyspark.sql.connect.session import SparkSession
 
 
+class PlanCache:
+    """
+    Bounded LRU cache of the relations built for the logical plans of a session, keyed by the
+    plan ids. Logical plans are immutable, so a parent plan built later, e.g. by the next step
+    of an iterative chain of `withColumn` calls, copies the cached relation of its child into
+    its own instead of rebuilding the whole subtree on every action. It is disabled unless
+    `plan_cache_size` is set on the client, and only covers the relations defined in this
+    module.
+
+    Relations that embed pickled Python functions, e.g. of UDFs, are not cached, so that their
+    functions are pickled again by every action as without the cache. Relations larger than
+    `MAX_RELATION_BYTES`, e.g. with local data, are not cached either. The cached relations
+    are shared and must not be modified, callers copy them into their own messages.
+    """
+
+    # Maximum serialized size of a cached relation in bytes.
+    MAX_RELATION_BYTES = 1024 * 1024
+
+    # Number of Python functions pickled into relations by the current thread.
+    _pickled_functions = threading.local()
+    # The relations of the children built by the top-level `plan` call of the current thread
+    # that were not copied by their parents yet, see `cached`.
+    _building = threading.local()
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, proto.Relation]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def record_pickled_function() -> None:
+        """
+        Records that a Python function was pickled into the relation being built, so that the
+        relation and the relations containing it are not cached.
+        """
+        PlanCache._pickled_functions.count = PlanCache._pickled_function_count() + 1
+
+    @staticmethod
+    def _pickled_function_count() -> int:
+        return getattr(PlanCache._pickled_functions, "count", 0)
+
+    def __contains__(self, plan_id: int) -> bool:
+        with self._lock:
+            return plan_id in self._entries
+
+    def get(self, plan_id: int) -> Optional[proto.Relation]:
+        with self._lock:
+            relation = self._entries.get(plan_id)
+            if relation is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(plan_id)
+            return relation
+
+    def put(self, plan_id: int, relation: proto.Relation) -> None:
+        if relation.ByteSize() > PlanCache.MAX_RELATION_BYTES:
+            return
+        with self._lock:
+            self._entries[plan_id] = relation
+            self._entries.move_to_end(plan_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def cached(
+        plan: Callable[["LogicalPlan", "SparkConnectClient"], proto.Relation]
+    ) -> Callable[["LogicalPlan", "SparkConnectClient"], proto.Relation]:
+        """
+        Wraps the `plan` method of a logical plan to look up and fill the plan cache of the
+        session, if it has one. The top-level call builds the relations of the chain of children
+        first, bottom-up, so that deep chains do not recurse once per plan. Each child keeps
+        its relation only until its parent has copied it.
+        """
+
+        @functools.wraps(plan)
+        def wrapper(self: "LogicalPlan", session: "SparkConnectClient") -> proto.Relation:
+            cache = getattr(session, "_plan_cache", None)
+            if not isinstance(cache, PlanCache) or cache._max_size <= 0:
+                cache = None
+
+            children: Optional[Dict[int, proto.Relation]] = getattr(
+                PlanCache._building, "children", None
+            )
+            if children is not None:
+                relation = children.pop(self._plan_id, None)
+                if relation is not None:
+                    return relation
+                return PlanCache._build(plan, self, session, cache)
+
+            children = {}
+            PlanCache._building.children = children
+            try:
+                chain = []
+                child = self._child
+                while child is not None and (cache is None or child._plan_id not in cache):
+                    chain.append(child)
+                    child = child._child
+                for child in reversed(chain):
+                    children[child._plan_id] = child.plan(session)
+                return PlanCache._build(plan, self, session, cache)
+            finally:
+                PlanCache._building.children = None
+
+        return wrapper
+
+    @staticmethod
+    def _build(
+        plan: Callable[["LogicalPlan", "SparkConnectClient"], proto.Relation],
+        logical_plan: "LogicalPlan",
+        session: "SparkConnectClient",
+        cache: Optional["PlanCache"],
+    ) -> proto.Relation:
+        if cache is None:
+            return plan(logical_plan, session)
+
+        relation = cache.get(logical_plan._plan_id)
+        if relation is None:
+            pickled_functions = PlanCache._pickled_function_count()
+            relation = plan(logical_plan, session)
+            if PlanCache._pickled_function_count() == pickled_functions:
+                cache.put(logical_plan._plan_id, relation)
+        return relation
+
+
 class LogicalPlan:
     _lock: Lock = Lock()
     _nextPlanId: int = 0
@@ -94,6 +224,12 @@ class LogicalPlan:
             assert all(isinstance(r, LogicalPlan) for r in self._references)
             self._plan_id_with_rel = LogicalPlan._fresh_plan_id()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Only the relations defined in this module are cached, see `PlanCache`.
+        if cls.__module__ == __name__ and "plan" in cls.__dict__:
+            cls.plan = PlanCache.cached(cls.__dict__["plan"])  # type: ignore[method-assign]
+
     @property
     def _plan_id(self) -> int:
         return self._plan_id_with_rel or self._root_plan_id
@@ -2656,6 +2792,7 @@ class PythonUDTF:
         udtf.eval_type = self._eval_type
         try:
             udtf.command = CloudPickleSerializer().dumps(self._func)
+            PlanCache.record_pickled_function()
         except pickle.PicklingError:
             raise PySparkPicklingError(
                 errorClass="UDTF_SERIALIZATION_ERROR",
@@ -2738,6 +2875,7 @@ class PythonDataSource:
     def to_plan(self, session: "SparkConnectClient") -> proto.PythonDataSource:
         ds = proto.PythonDataSource()
         ds.command = CloudPickleSerializer().dumps(self._data_source)
+        PlanCache.record_pickled_function()
         ds.python_ver = self._python_ver
         return ds
 
@@ -18,6 +18,9 @@
 import array
 import datetime
 import decimal
+import gc
+import itertools
+import operator
 from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Union, overload
 
 from pyspark.errors import PySparkValueError
@@ -378,6 +381,55 @@ class LocalDataToArrowConversion:
             else:
                 return lambda value: value
 
+    @staticmethod
+    def _convert_column(
+        values: Sequence[Any], dataType: DataType, nullable: bool, arrow_type: "pa.DataType"
+    ) -> Optional["pa.Array"]:
+        """
+        Converts a column of an atomic type to an Arrow array in bulk, without a per-value
+        converter. Returns None if the values need the per-value conversion, e.g. to coerce
+        them, to handle Decimal('NaN') or to raise the proper error for unexpected values.
+        """
+        import pyarrow as pa
+
+        if isinstance(
+            dataType, (NullType, StructType, ArrayType, MapType, UserDefinedType, VariantType)
+        ):
+            return None
+
+        # Python types of the values that Arrow converts the same way as the per-value
+        # converter does.
+        value_types = set(map(type, values))
+        value_types.discard(type(None))
+        if isinstance(dataType, StringType):
+            if not value_types.issubset({str}):
+                return None
+        elif isinstance(dataType, BinaryType):
+            if not value_types.issubset({bytes}):
+                return None
+        elif isinstance(dataType, DecimalType):
+            if not value_types.issubset({decimal.Decimal}):
+                return None
+        elif isinstance(dataType, TimestampType):
+            # Arrow interprets naive datetimes as UTC rather than local time.
+            if not value_types.issubset({datetime.datetime}) or any(
+                v is not None and v.tzinfo is None for v in values
+            ):
+                return None
+        elif isinstance(dataType, TimestampNTZType):
+            if not value_types.issubset({datetime.datetime}) or any(
+                v is not None and v.tzinfo is not None for v in values
+            ):
+                return None
+
+        try:
+            arr = pa.array(values, type=arrow_type)
+        except (pa.ArrowException, TypeError, ValueError, OverflowError):
+            return None
+        if not nullable and arr.null_count > 0:
+            return None
+        return arr
+
     @staticmethod
     def convert(data: Sequence[Any], schema: StructType, use_large_var_types: bool) -> "pa.Table":
         require_minimum_pyarrow_version()
@@ -421,21 +473,15 @@ class LocalDataToArrowConversion:
                     )
                 return tuple(item)
 
-        rows = [to_row(item) for item in data]
+        if set(map(type, data)).issubset({tuple, Row}) and set(map(len, data)) == {
+            len_column_names
+        }:
+            # Tuples and Rows of the right length are used as they are.
+            rows = data
+        else:
+            rows = [to_row(item) for item in data]
 
         if len_column_names > 0:
-            column_convs = [
-                LocalDataToArrowConversion._create_converter(
-                    field.dataType, field.nullable, none_on_identity=True
-                )
-                for field in schema.fields
-            ]
-
-            pylist = [
-                [conv(row[i]) for row in rows] if conv is not None else [row[i] for row in rows]
-                for i, conv in enumerate(column_convs)
-            ]
-
             pa_schema = to_arrow_schema(
                 StructType(
                     [
@@ -448,7 +494,22 @@ class LocalDataToArrowConversion:
                 prefers_large_types=use_large_var_types,
             )
 
-            return pa.Table.from_arrays(pylist, schema=pa_schema)
+            columns: List[Any] = []
+            for i, (field, arrow_field) in enumerate(zip(schema.fields, pa_schema)):
+                values = list(map(operator.itemgetter(i), rows))
+                # Build the Arrow arrays of atomic columns in bulk, and only fall back to the
+                # per-value converters for nested, UDT and variant columns, or unexpected values.
+                arr = LocalDataToArrowConversion._convert_column(
+                    values, field.dataType, field.nullable, arrow_field.type
+                )
+                if arr is None:
+                    conv = LocalDataToArrowConversion._create_converter(
+                        field.dataType, field.nullable, none_on_identity=True
+                    )
+                    arr = [conv(v) for v in values] if conv is not None else values
+                columns.append(arr)
+
+            return pa.Table.from_arrays(columns, schema=pa_schema)
         else:
             return pa.Table.from_struct_array(pa.array([{}] * len(rows)))
 
@@ -691,6 +752,79 @@ class ArrowTableToRowsConversion:
             else:
                 return lambda value: value
 
+    @staticmethod
+    def _convert_column(column: Union["pa.Array", "pa.ChunkedArray"], dataType: DataType) -> List:
+        """
+        Converts an Arrow column to a list of Python values. Struct columns are converted field
+        by field into rows instead of through a dict per value, and null, binary and timestamp
+        columns are converted in bulk. Other columns are converted value by value with the
+        converter of their type, if they need one.
+        """
+        import pyarrow as pa
+
+        if isinstance(column, pa.ChunkedArray):
+            if column.num_chunks == 1:
+                return ArrowTableToRowsConversion._convert_column(column.chunk(0), dataType)
+            return list(
+                itertools.chain.from_iterable(
+                    ArrowTableToRowsConversion._convert_column(chunk, dataType)
+                    for chunk in column.chunks
+                )
+            )
+
+        if (
+            isinstance(dataType, StructType)
+            and len(dataType.fields) > 0
+            and pa.types.is_struct(column.type)
+            and column.type.num_fields == len(dataType.fields)
+        ):
+            field_names = dataType.names
+            # `flatten` applies the offset and the validity of the struct to its fields.
+            field_values = [
+                ArrowTableToRowsConversion._convert_column(child, field.dataType)
+                for child, field in zip(column.flatten(), dataType.fields)
+            ]
+            rows: List = [_create_row(field_names, values) for values in zip(*field_values)]
+            if column.null_count > 0:
+                rows = [
+                    None if is_null else row
+                    for row, is_null in zip(rows, column.is_null().to_pylist())
+                ]
+            return rows
+
+        if isinstance(dataType, NullType):
+            return [None] * len(column)
+
+        elif isinstance(dataType, BinaryType) and pa.types.is_binary(column.type):
+            return [None if v is None else bytearray(v) for v in column.to_pylist()]
+
+        elif isinstance(dataType, TimestampNTZType) and pa.types.is_timestamp(column.type):
+            # Arrow already returns naive datetimes for timestamps without a time zone.
+            return column.to_pylist()
+
+        elif (
+            isinstance(dataType, TimestampType)
+            and pa.types.is_timestamp(column.type)
+            and column.type.tz is not None
+            and column.type.unit == "us"
+        ):
+            # Same as the converter of TimestampType, without creating an aware datetime per
+            # value first. Out of range values fall back to the converter.
+            fromtimestamp = datetime.datetime.fromtimestamp
+            try:
+                return [
+                    None
+                    if v is None
+                    else fromtimestamp(v // 1000000).replace(microsecond=v % 1000000, fold=0)
+                    for v in column.cast(pa.int64()).to_pylist()
+                ]
+            except (OverflowError, ValueError, OSError):
+                pass
+
+        conv = ArrowTableToRowsConversion._create_converter(dataType, none_on_identity=True)
+        values = column.to_pylist()
+        return [conv(v) for v in values] if conv is not None else values
+
     @overload
     @staticmethod
     def convert(  # type: ignore[overload-overlap]
@@ -719,20 +853,23 @@ class ArrowTableToRowsConversion:
         fields = schema.fieldNames()
 
         if len(fields) > 0:
-            field_converters = [
-                ArrowTableToRowsConversion._create_converter(f.dataType, none_on_identity=True)
-                for f in schema.fields
-            ]
-
-            columnar_data = [
-                [conv(v) for v in column.to_pylist()] if conv is not None else column.to_pylist()
-                for column, conv in zip(table.columns, field_converters)
-            ]
-
-            if return_as_tuples:
-                rows = [tuple(cols) for cols in zip(*columnar_data)]
-            else:
-                rows = [_create_row(fields, tuple(cols)) for cols in zip(*columnar_data)]
+            # Creating a Row per value allocates many objects that stay alive, which would
+            # trigger the garbage collector over and over without freeing anything.
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                columnar_data = [
+                    ArrowTableToRowsConversion._convert_column(column, field.dataType)
+                    for column, field in zip(table.columns, schema.fields)
+                ]
+
+                if return_as_tuples:
+                    rows = [tuple(cols) for cols in zip(*columnar_data)]
+                else:
+                    rows = [_create_row(fields, cols) for cols in zip(*columnar_data)]
+            finally:
+                if gc_enabled:
+                    gc.enable()
             assert len(rows) == table.num_rows, f"{len(rows)}, {table.num_rows}"
             return rows
         else:
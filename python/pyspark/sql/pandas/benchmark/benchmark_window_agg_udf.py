@@ -0,0 +1,118 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import os
+
+# Required to run the script easily on PySpark's root directory on the Spark repo.
+sys.path.append(os.getcwd())
+
+import time
+from typing import Any, Callable, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pyspark.sql.types import DoubleType
+from pyspark.worker import (
+    wrap_bounded_window_agg_arrow_udf,
+    wrap_bounded_window_agg_pandas_udf,
+)
+
+
+class RollingSum:
+    def __init__(self) -> None:
+        self.total = 0.0
+
+    def add(self, v: float) -> None:
+        self.total += v
+
+    def remove(self, v: float) -> None:
+        self.total -= v
+
+    def evaluate(self) -> float:
+        return self.total
+
+
+def frame_indices(num_rows: int, window_size: int) -> List[np.ndarray]:
+    # Equivalent of ROWS BETWEEN (window_size - 1) PRECEDING AND CURRENT ROW.
+    end = np.arange(1, num_rows + 1, dtype=np.int32)
+    begin = np.maximum(end - window_size, 0).astype(np.int32)
+    return [begin, end]
+
+
+def measure(f: Callable[..., Any], *args: Any) -> float:
+    start_time_ns = time.perf_counter_ns()
+    f(*args)
+    return (time.perf_counter_ns() - start_time_ns) / 1000 / 1000
+
+
+def benchmark_pandas(num_rows: int, window_size: int) -> None:
+    begin, end = frame_indices(num_rows, window_size)
+    values = pd.Series(np.random.rand(num_rows))
+
+    def sum_udf(v: pd.Series) -> float:
+        return v.sum()
+
+    _, sliced = wrap_bounded_window_agg_pandas_udf(sum_udf, [0, 1, 2], {}, DoubleType(), {})
+    _, incremental = wrap_bounded_window_agg_pandas_udf(
+        sum_udf, [0, 1, 2], {}, DoubleType(), {}, RollingSum
+    )
+
+    args = (pd.Series(begin), pd.Series(end), values)
+    print(" ==================== pandas window aggregation (millis) ======================")
+    print("rows: %d, window size: %d" % (num_rows, window_size))
+    print("per-frame slices:\t{:.3f}".format(measure(sliced, *args)))
+    print("incremental:\t\t{:.3f}".format(measure(incremental, *args)))
+
+
+def benchmark_arrow(num_rows: int, window_size: int) -> None:
+    begin, end = frame_indices(num_rows, window_size)
+    values = pa.array(np.random.rand(num_rows))
+
+    def sum_udf(v: pa.Array) -> float:
+        return pa.compute.sum(v).as_py()
+
+    _, sliced = wrap_bounded_window_agg_arrow_udf(sum_udf, [0, 1, 2], {}, DoubleType(), {})
+    _, incremental = wrap_bounded_window_agg_arrow_udf(
+        sum_udf, [0, 1, 2], {}, DoubleType(), {}, RollingSum
+    )
+
+    args = (pa.array(begin), pa.array(end), values)
+    print(" ==================== arrow window aggregation (millis) ======================")
+    print("rows: %d, window size: %d" % (num_rows, window_size))
+    print("per-frame slices:\t{:.3f}".format(measure(sliced, *args)))
+    print("incremental:\t\t{:.3f}".format(measure(incremental, *args)))
+
+
+if __name__ == "__main__":
+    """
+    Instructions to run the benchmark:
+    (assuming you installed required dependencies for PySpark)
+
+    1. `cd python`
+    2. `python3 pyspark/sql/pandas/benchmark/benchmark_window_agg_udf.py
+        <number of rows> <window size>`
+
+    The benchmark evaluates a rolling sum over a single window partition, once by calling the
+    UDF on a slice of each frame and once through an incremental window aggregator.
+    """
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    window_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    benchmark_pandas(num_rows, window_size)
+    benchmark_arrow(num_rows, window_size)
@@ -333,6 +333,44 @@ def vectorized_udf(
             Therefore, mutating the input series is not allowed and will cause incorrect results.
             For the same reason, users should also not rely on the index of the input series.
 
+        Over bounded windows, the function is called once per row with a slice of the frame,
+        which costs time proportional to the frame size for each row. A class that maintains
+        the aggregate incrementally can be attached to the function as its
+        `window_aggregator` attribute before the UDF is created. It is instantiated with no
+        arguments, receives the values of each row entering and leaving the frame through
+        `add` and `remove`, and returns the aggregate of the current frame from `evaluate`.
+        The function itself is still used for grouped aggregation and unbounded windows.
+
+        The values are not skipped when they are null. With pandas UDFs, nulls are passed as
+        the elements of `Series.to_numpy()` are, e.g. `NaN` for doubles and `None` for
+        strings. With Arrow UDFs, they are passed as `None`. A `NaN` added to a running total
+        stays there after it is removed, so aggregators should skip nulls unless the result
+        is expected to be null, as below.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            class RollingSum:
+                def __init__(self):
+                    self.total = 0.0
+
+                def add(self, v):
+                    if not pd.isna(v):
+                        self.total += v
+
+                def remove(self, v):
+                    if not pd.isna(v):
+                        self.total -= v
+
+                def evaluate(self):
+                    return self.total
+
+            def sum_udf(v: pd.Series) -> float:
+                return v.sum()
+
+            sum_udf.window_aggregator = RollingSum
+            sum_udf = pandas_udf("double")(sum_udf)
+
     Notes
     -----
     The user-defined functions do not support conditional expressions or short circuiting
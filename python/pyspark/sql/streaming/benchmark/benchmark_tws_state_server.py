@@ -92,6 +92,60 @@ def benchmark_value_state(api_client: StatefulProcessorApiClient, params: List[s
     print_percentiles(measured_times_update, [50, 95, 99, 99.9, 100])
 
 
+def benchmark_value_state_batch(api_client: StatefulProcessorApiClient, params: List[str]) -> None:
+    data_size = int(params[0])
+    num_keys = int(params[1])
+    max_pending_requests = int(params[2]) if len(params) > 2 else num_keys * 2
+
+    value_state = get_value_state(
+        api_client, "example_value_state", StructType([StructField("value", StringType(), True)])
+    )
+
+    uuid_long = []
+    for i in range(int(data_size / 32) + 1):
+        uuid_long.append(str(uuid.uuid4()))
+
+    grouping_keys = [("example_grouping_key_%d" % i,) for i in range(num_keys)]
+
+    measured_times_sequential = []
+    measured_times_pipelined = []
+
+    # Each iteration simulates a batch with `num_keys` grouping keys which reads and updates
+    # the value state of every key, once with a round trip per request and once with the
+    # implicit key changes and the updates pipelined.
+    # TODO: Use streaming quantiles in Apache DataSketch if we want to run this longer
+    for i in range(10000):
+        random.shuffle(uuid_long)
+        value = ("".join(uuid_long))[0:data_size]
+
+        api_client._max_pending_requests = 0
+        start_time_ns = time.perf_counter_ns()
+        for key in grouping_keys:
+            api_client.set_implicit_key(key)
+            value_state.get()
+            value_state.update((value,))
+        api_client.remove_implicit_key()
+        end_time_ns = time.perf_counter_ns()
+        measured_times_sequential.append((end_time_ns - start_time_ns) / 1000)
+
+        api_client._max_pending_requests = max_pending_requests
+        start_time_ns = time.perf_counter_ns()
+        for key in grouping_keys:
+            api_client.set_implicit_key(key)
+            value_state.get()
+            value_state.update((value,))
+        api_client.remove_implicit_key()
+        api_client._flush_pending_requests()
+        end_time_ns = time.perf_counter_ns()
+        measured_times_pipelined.append((end_time_ns - start_time_ns) / 1000)
+
+    print(" ==================== SEQUENTIAL batch latency (micros) ======================")
+    print_percentiles(measured_times_sequential, [50, 95, 99, 99.9, 100])
+
+    print(" ==================== PIPELINED batch latency (micros) ======================")
+    print_percentiles(measured_times_pipelined, [50, 95, 99, 99.9, 100])
+
+
 def benchmark_list_state(api_client: StatefulProcessorApiClient, params: List[str]) -> None:
     data_size = int(params[0])
     list_length = int(params[1])
@@ -345,6 +399,7 @@ def main(state_server_port: str, benchmark_type: str) -> None:
 
     benchmarks = {
         "value": benchmark_value_state,
+        "value_batch": benchmark_value_state_batch,
         "list": benchmark_list_state,
         "map": benchmark_map_state,
         "timer": benchmark_timer,
@@ -364,6 +419,7 @@ if __name__ == "__main__":
 
     Currently, state type can be one of the following:
     - value
+    - value_batch
     - list
     - map
     - timer
@@ -120,12 +120,10 @@ class ListStateClient:
         state_variable_request = stateMessage.StateVariableRequest(listStateCall=list_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error updating value state: " f"{response_message[1]}")
+        # TODO(SPARK-49233): Classify user facing errors.
+        self._stateful_processor_api_client._send_pipelined_proto_message(
+            message.SerializeToString(), "Error updating value state"
+        )
 
     def append_list(self, state_name: str, values: List[Tuple]) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -154,10 +152,15 @@ class ListStateClient:
         state_variable_request = stateMessage.StateVariableRequest(listStateCall=list_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
+        if not send_data_via_arrow:
+            # TODO(SPARK-49233): Classify user facing errors.
+            self._stateful_processor_api_client._send_pipelined_proto_message(
+                message.SerializeToString(), "Error updating value state"
+            )
+            return
 
-        if send_data_via_arrow:
-            self._stateful_processor_api_client._send_arrow_state(self.schema, values)
+        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
+        self._stateful_processor_api_client._send_arrow_state(self.schema, values)
 
         response_message = self._stateful_processor_api_client._receive_proto_message()
         status = response_message[0]
@@ -189,10 +192,15 @@ class ListStateClient:
         state_variable_request = stateMessage.StateVariableRequest(listStateCall=list_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
+        if not send_data_via_arrow:
+            # TODO(SPARK-49233): Classify user facing errors.
+            self._stateful_processor_api_client._send_pipelined_proto_message(
+                message.SerializeToString(), "Error updating value state"
+            )
+            return
 
-        if send_data_via_arrow:
-            self._stateful_processor_api_client._send_arrow_state(self.schema, values)
+        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
+        self._stateful_processor_api_client._send_arrow_state(self.schema, values)
 
         response_message = self._stateful_processor_api_client._receive_proto_message()
         status = response_message[0]
@@ -208,12 +216,10 @@ class ListStateClient:
         state_variable_request = stateMessage.StateVariableRequest(listStateCall=list_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error clearing value state: " f"{response_message[1]}")
+        # TODO(SPARK-49233): Classify user facing errors.
+        self._stateful_processor_api_client._send_pipelined_proto_message(
+            message.SerializeToString(), "Error clearing value state"
+        )
 
 
 class ListStateIterator:
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import functools
 from typing import Any, Dict, Iterator, Union, Tuple, Optional
 
 from pyspark.sql.streaming.stateful_processor_api_client import StatefulProcessorApiClient
@@ -57,6 +58,7 @@ class MapStateClient:
         state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
+        self._stateful_processor_api_client._flush_state_cache(state_name)
         self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
         response_message = self._stateful_processor_api_client._receive_proto_message()
         status = response_message[0]
@@ -75,6 +77,12 @@ class MapStateClient:
         bytes = self._stateful_processor_api_client._serialize_to_bytes(
             self.user_key_schema, user_key
         )
+        cache = self._stateful_processor_api_client._state_cache
+        if cache is not None:
+            cached, value = cache.get((state_name, bytes))
+            if cached:
+                return value
+
         get_value_call = stateMessage.GetValue(userKey=bytes)
         map_state_call = stateMessage.MapStateCall(stateName=state_name, getValue=get_value_call)
         state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
@@ -85,8 +93,13 @@ class MapStateClient:
         status = response_message[0]
         if status == 0:
             if len(response_message[2]) == 0:
-                return None
-            row = self._stateful_processor_api_client._deserialize_from_bytes(response_message[2])
+                row = None
+            else:
+                row = self._stateful_processor_api_client._deserialize_from_bytes(
+                    response_message[2]
+                )
+            if cache is not None:
+                cache.put((state_name, bytes), row, len(bytes) + len(response_message[2]))
             return row
         else:
             # TODO(SPARK-49233): Classify user facing errors.
@@ -95,6 +108,10 @@ class MapStateClient:
     def contains_key(self, state_name: str, user_key: Tuple) -> bool:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
 
+        if self._stateful_processor_api_client._state_cache is not None:
+            # Fetch the value instead so that following reads are served from the cache.
+            return self.get_value(state_name, user_key) is not None
+
         bytes = self._stateful_processor_api_client._serialize_to_bytes(
             self.user_key_schema, user_key
         )
@@ -130,9 +147,8 @@ class MapStateClient:
         key_bytes = self._stateful_processor_api_client._serialize_to_bytes(
             self.user_key_schema, user_key
         )
-        value_bytes = self._stateful_processor_api_client._serialize_to_bytes(
-            self.value_schema, value
-        )
+        internal_value = self._stateful_processor_api_client._to_internal(self.value_schema, value)
+        value_bytes = self._stateful_processor_api_client.pickleSer.dumps(internal_value)
         update_value_call = stateMessage.UpdateValue(userKey=key_bytes, value=value_bytes)
         map_state_call = stateMessage.MapStateCall(
             stateName=state_name, updateValue=update_value_call
@@ -140,12 +156,22 @@ class MapStateClient:
         state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error updating map state value: {response_message[1]}")
+        api_client = self._stateful_processor_api_client
+        # TODO(SPARK-49233): Classify user facing errors.
+        write = functools.partial(
+            api_client._send_pipelined_proto_message,
+            message.SerializeToString(),
+            "Error updating map state value",
+        )
+        if api_client._state_cache is not None:
+            api_client._state_cache.put(
+                (state_name, key_bytes),
+                internal_value,
+                len(key_bytes) + len(value_bytes),
+                write,
+            )
+        else:
+            write()
 
     def get_key_value_pair(self, state_name: str, iterator_id: str) -> Tuple[Tuple, Tuple, bool]:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -162,6 +188,7 @@ class MapStateClient:
             state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
             message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
+            self._stateful_processor_api_client._flush_state_cache(state_name)
             self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
             response_message = (
                 self._stateful_processor_api_client._receive_proto_message_with_map_pairs()
@@ -219,6 +246,7 @@ class MapStateClient:
             state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
             message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
+            self._stateful_processor_api_client._flush_state_cache(state_name)
             self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
             response_message = (
                 self._stateful_processor_api_client._receive_proto_message_with_map_keys_values()
@@ -263,12 +291,17 @@ class MapStateClient:
         state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error removing key from map state: {response_message[1]}")
+        api_client = self._stateful_processor_api_client
+        # TODO(SPARK-49233): Classify user facing errors.
+        write = functools.partial(
+            api_client._send_pipelined_proto_message,
+            message.SerializeToString(),
+            "Error removing key from map state",
+        )
+        if api_client._state_cache is not None:
+            api_client._state_cache.put((state_name, bytes), None, len(bytes), write)
+        else:
+            write()
 
     def clear(self, state_name: str) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -278,12 +311,14 @@ class MapStateClient:
         state_variable_request = stateMessage.StateVariableRequest(mapStateCall=map_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error clearing map state: " f"{response_message[1]}")
+        if self._stateful_processor_api_client._state_cache is not None:
+            # Clearing the map supersedes the cached writes of its entries.
+            self._stateful_processor_api_client._state_cache.invalidate(state_name)
+
+        # TODO(SPARK-49233): Classify user facing errors.
+        self._stateful_processor_api_client._send_pipelined_proto_message(
+            message.SerializeToString(), "Error clearing map state"
+        )
 
 
 class MapStateIterator:
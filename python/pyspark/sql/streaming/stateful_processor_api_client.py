@@ -14,11 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from collections import OrderedDict
 from enum import Enum
 import json
+import logging
 import os
 import socket
-from typing import Any, Dict, List, Union, Optional, Tuple, Iterator
+from typing import Any, Callable, Dict, List, Union, Optional, Tuple, Iterator
 
 from pyspark.serializers import write_int, read_int, UTF8Deserializer
 from pyspark.sql.pandas.serializers import ArrowStreamSerializer
@@ -29,6 +31,7 @@ from pyspark.sql.types import (
 from pyspark.sql.pandas.types import convert_pandas_using_numpy_type
 from pyspark.serializers import CPickleSerializer
 from pyspark.errors import PySparkRuntimeError
+from pyspark.logger import PySparkLogger
 import uuid
 
 __all__ = ["StatefulProcessorApiClient", "StatefulProcessorHandleState"]
@@ -43,9 +46,139 @@ class StatefulProcessorHandleState(Enum):
     CLOSED = 5
 
 
+class StateCache:
+    """
+    Write-back cache of the state values of the current implicit grouping key.
+
+    Reads are served from the cache once a value was fetched from or written to the state
+    server. Writes are recorded as dirty entries, where a later write to the same entry replaces
+    the earlier one, and are sent when the entry is flushed: before the implicit key changes,
+    when the handle state changes, when an entry is evicted, and before requests that observe
+    the whole state variable such as iterators. The size of an entry is estimated by the size
+    of its serialized key and value, and the least recently used entries are evicted once the
+    total exceeds `max_bytes`. The hit, eviction and write counters are logged by
+    `log_metrics` when the handle is closed.
+    """
+
+    # Rough per-entry overhead of the cache key, the value and the bookkeeping in bytes.
+    ENTRY_OVERHEAD_BYTES = 64
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._size_in_bytes = 0
+        # Maps (state name, user key) to a tuple of the value and its estimated size.
+        self._entries: "OrderedDict[Tuple[str, Any], Tuple[Any, int]]" = OrderedDict()
+        # Maps the dirty entries to the function sending their latest write.
+        self._dirty: Dict[Tuple[str, Any], Callable[[], None]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writes = 0
+        self.flushed_writes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def get(self, key: Tuple[str, Any]) -> Tuple[bool, Any]:
+        """
+        Returns whether the entry is cached, and its value if so.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return True, entry[0]
+
+    def put(
+        self,
+        key: Tuple[str, Any],
+        value: Any,
+        size_in_bytes: int,
+        write: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Caches the value of the entry. `write` sends the value to the state server and marks
+        the entry as dirty; without it, the value is known to match the state server.
+        """
+        old_entry = self._entries.pop(key, None)
+        if old_entry is not None:
+            self._size_in_bytes -= old_entry[1]
+        size_in_bytes += StateCache.ENTRY_OVERHEAD_BYTES
+        self._entries[key] = (value, size_in_bytes)
+        self._size_in_bytes += size_in_bytes
+        if write is not None:
+            self.writes += 1
+            self._dirty[key] = write
+
+        while self._size_in_bytes > self._max_bytes and len(self._entries) > 1:
+            evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size_in_bytes -= evicted_size
+            self.evictions += 1
+            evicted_write = self._dirty.pop(evicted_key, None)
+            if evicted_write is not None:
+                self.flushed_writes += 1
+                evicted_write()
+
+    def flush(self, state_name: Optional[str] = None) -> None:
+        """
+        Sends the writes of the dirty entries, of the given state variable if specified.
+        """
+        if state_name is None:
+            dirty_keys = list(self._dirty.keys())
+        else:
+            dirty_keys = [key for key in self._dirty.keys() if key[0] == state_name]
+        for key in dirty_keys:
+            write = self._dirty.pop(key)
+            self.flushed_writes += 1
+            write()
+
+    def invalidate(self, state_name: str) -> None:
+        """
+        Drops the entries of the given state variable, including the writes not sent yet.
+        """
+        for key in [key for key in self._entries.keys() if key[0] == state_name]:
+            self._size_in_bytes -= self._entries.pop(key)[1]
+            self._dirty.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Sends the writes of the dirty entries and drops all entries.
+        """
+        self.flush()
+        self._entries.clear()
+        self._size_in_bytes = 0
+
+    def log_metrics(self) -> None:
+        """
+        Logs the counters of the cache at the INFO level of the
+        "pyspark.sql.streaming.StateCache" logger.
+        """
+        logger = PySparkLogger.getLogger("pyspark.sql.streaming.StateCache")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "State cache metrics",
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=self.hit_rate,
+                evictions=self.evictions,
+                writes=self.writes,
+                flushed_writes=self.flushed_writes,
+            )
+
+
 class StatefulProcessorApiClient:
     def __init__(
-        self, state_server_port: Union[int, str], key_schema: StructType, is_driver: bool = False
+        self,
+        state_server_port: Union[int, str],
+        key_schema: StructType,
+        is_driver: bool = False,
+        max_pending_requests: int = 0,
+        state_cache_max_bytes: int = 0,
     ) -> None:
         self.key_schema = key_schema
         if isinstance(state_server_port, str):
@@ -86,6 +219,23 @@ class StatefulProcessorApiClient:
         self._batch_timestamp = -1
         self._watermark_timestamp = -1
 
+        # The state server handles requests one at a time in the order they arrive, so requests
+        # whose response only carries a status code (updates, clears, setting the implicit key)
+        # can be pipelined: they are written without waiting for the response, and the
+        # responses are read in order before the next request that needs its own response, or
+        # once `max_pending_requests` requests are outstanding. Zero disables pipelining.
+        self._max_pending_requests = max_pending_requests
+        # The pipelined requests whose responses are not read yet, with their error message
+        # prefixes and the grouping keys they were sent for.
+        self._pending_requests: List[Tuple[bytes, str, Optional[Tuple]]] = []
+        # The grouping key currently set on the state server, if any.
+        self._implicit_key: Optional[Tuple] = None
+        # Cache of the state values of the implicit key, see `StateCache`. Disabled if the
+        # maximum size is zero.
+        self._state_cache: Optional[StateCache] = (
+            StateCache(state_cache_max_bytes) if state_cache_max_bytes > 0 else None
+        )
+
     def set_handle_state(self, state: StatefulProcessorHandleState) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
 
@@ -105,12 +255,15 @@ class StatefulProcessorApiClient:
         handle_call = stateMessage.StatefulProcessorCall(setHandleState=set_handle_state)
         message = stateMessage.StateRequest(statefulProcessorCall=handle_call)
 
+        self._flush_state_cache()
         self._send_proto_message(message.SerializeToString())
 
         response_message = self._receive_proto_message()
         status = response_message[0]
         if status == 0:
             self.handle_state = state
+            if state == StatefulProcessorHandleState.CLOSED and self._state_cache is not None:
+                self._state_cache.log_metrics()
         else:
             # TODO(SPARK-49233): Classify errors thrown by internal methods.
             raise PySparkRuntimeError(f"Error setting handle state: " f"{response_message[1]}")
@@ -123,12 +276,13 @@ class StatefulProcessorApiClient:
         request = stateMessage.ImplicitGroupingKeyRequest(setImplicitKey=set_implicit_key)
         message = stateMessage.StateRequest(implicitGroupingKeyRequest=request)
 
-        self._send_proto_message(message.SerializeToString())
-        response_message = self._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify errors thrown by internal methods.
-            raise PySparkRuntimeError(f"Error setting implicit key: " f"{response_message[1]}")
+        if self._state_cache is not None and key != self._implicit_key:
+            self._state_cache.clear()
+        # TODO(SPARK-49233): Classify errors thrown by internal methods.
+        self._send_pipelined_proto_message(
+            message.SerializeToString(), "Error setting implicit key"
+        )
+        self._implicit_key = key
 
     def remove_implicit_key(self) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -137,12 +291,20 @@ class StatefulProcessorApiClient:
         request = stateMessage.ImplicitGroupingKeyRequest(removeImplicitKey=remove_implicit_key)
         message = stateMessage.StateRequest(implicitGroupingKeyRequest=request)
 
-        self._send_proto_message(message.SerializeToString())
-        response_message = self._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify errors thrown by internal methods.
-            raise PySparkRuntimeError(f"Error removing implicit key: " f"{response_message[1]}")
+        if self._state_cache is not None:
+            self._state_cache.clear()
+        # TODO(SPARK-49233): Classify errors thrown by internal methods.
+        self._send_pipelined_proto_message(
+            message.SerializeToString(), "Error removing implicit key"
+        )
+        self._implicit_key = None
+
+    def _flush_state_cache(self, state_name: Optional[str] = None) -> None:
+        """
+        Sends the cached writes, of the given state variable if specified, to the state server.
+        """
+        if self._state_cache is not None:
+            self._state_cache.flush(state_name)
 
     def get_value_state(
         self, state_name: str, schema: Union[StructType, str], ttl_duration_ms: Optional[int]
@@ -198,12 +360,8 @@ class StatefulProcessorApiClient:
         call = stateMessage.StatefulProcessorCall(timerStateCall=state_call_command)
         message = stateMessage.StateRequest(statefulProcessorCall=call)
 
-        self._send_proto_message(message.SerializeToString())
-        response_message = self._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error register timer: " f"{response_message[1]}")
+        # TODO(SPARK-49233): Classify user facing errors.
+        self._send_pipelined_proto_message(message.SerializeToString(), "Error register timer")
 
     def delete_timer(self, expiry_time_stamp_ms: int) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -213,12 +371,8 @@ class StatefulProcessorApiClient:
         call = stateMessage.StatefulProcessorCall(timerStateCall=state_call_command)
         message = stateMessage.StateRequest(statefulProcessorCall=call)
 
-        self._send_proto_message(message.SerializeToString())
-        response_message = self._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error deleting timer: " f"{response_message[1]}")
+        # TODO(SPARK-49233): Classify user facing errors.
+        self._send_pipelined_proto_message(message.SerializeToString(), "Error deleting timer")
 
     def get_list_timer_row(self, iterator_id: str) -> Tuple[int, bool]:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -356,6 +510,9 @@ class StatefulProcessorApiClient:
         call = stateMessage.StatefulProcessorCall(deleteIfExists=state_call_command)
         message = stateMessage.StateRequest(statefulProcessorCall=call)
 
+        if self._state_cache is not None:
+            self._state_cache.invalidate(state_name)
+
         self._send_proto_message(message.SerializeToString())
         response_message = self._receive_proto_message()
         status = response_message[0]
@@ -406,12 +563,86 @@ class StatefulProcessorApiClient:
             return timestamp
 
     def _send_proto_message(self, message: bytes) -> None:
+        self._write_proto_message(message)
+        self.sockfile.flush()
+        # Consume the responses of the pipelined requests sent before this one, so that the
+        # caller reads the response to its own request next.
+        self._receive_pending_responses()
+
+    def _send_pipelined_proto_message(self, message: bytes, error_message: str) -> None:
+        """
+        Sends a request whose response only carries a status code, and raises with
+        `error_message` if the request fails. When pipelining is enabled, the response is not
+        awaited here, and a failure is raised by a later call that reads the responses.
+        """
+        if self._max_pending_requests <= 0:
+            self._send_proto_message(message)
+            response_message = self._receive_proto_message()
+            if response_message[0] != 0:
+                raise PySparkRuntimeError(f"{error_message}: {response_message[1]}")
+            return
+
+        self._write_proto_message(message)
+        self._pending_requests.append((message, error_message, self._implicit_key))
+        if len(self._pending_requests) >= self._max_pending_requests:
+            self.sockfile.flush()
+            self._receive_pending_responses()
+
+    def _flush_pending_requests(self) -> None:
+        """
+        Sends all pipelined requests and waits for their responses.
+        """
+        if len(self._pending_requests) > 0:
+            self.sockfile.flush()
+            self._receive_pending_responses()
+
+    def _receive_pending_responses(self) -> None:
+        pending_requests = self._pending_requests
+        self._pending_requests = []
+        error = None
+        # Read every response even after a failure so that the stream stays in sync.
+        for message, error_message, key in pending_requests:
+            response_message = self._receive_proto_message()
+            if response_message[0] != 0 and error is None:
+                # The failure is raised by a later call, so name the request that failed.
+                error = (
+                    f"{error_message}: {response_message[1]} (pipelined request "
+                    f"{self._describe_request(message)} for grouping key {key})"
+                )
+        if error is not None:
+            # TODO(SPARK-49233): Classify user facing errors.
+            raise PySparkRuntimeError(error)
+
+    @staticmethod
+    def _describe_request(message: bytes) -> str:
+        """
+        Describes a serialized request by its nested calls and its state variable, e.g.
+        "stateVariableRequest.valueStateCall.valueStateUpdate on state 'count'".
+        """
+        import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
+
+        node: Any = stateMessage.StateRequest.FromString(message)
+        calls = []
+        state_name = None
+        while hasattr(node, "DESCRIPTOR") and "method" in node.DESCRIPTOR.oneofs_by_name:
+            if "stateName" in node.DESCRIPTOR.fields_by_name:
+                state_name = node.stateName
+            call = node.WhichOneof("method")
+            if call is None:
+                break
+            calls.append(call)
+            node = getattr(node, call)
+        description = ".".join(calls)
+        if state_name is not None:
+            description += f" on state '{state_name}'"
+        return description
+
+    def _write_proto_message(self, message: bytes) -> None:
         # Writing zero here to indicate message version. This allows us to evolve the message
         # format or even changing the message protocol in the future.
         write_int(0, self.sockfile)
         write_int(len(message), self.sockfile)
         self.sockfile.write(message)
-        self.sockfile.flush()
 
     def _receive_proto_message(self) -> Tuple[int, str, bytes]:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -492,6 +723,13 @@ class StatefulProcessorApiClient:
         return self.utf8_deserializer.loads(self.sockfile)
 
     def _serialize_to_bytes(self, schema: StructType, data: Tuple) -> bytes:
+        return self.pickleSer.dumps(self._to_internal(schema, data))
+
+    def _to_internal(self, schema: StructType, data: Tuple) -> Tuple:
+        """
+        Converts a row to the internal values that are serialized, which are also the values
+        read back from the state server.
+        """
         from pyspark.testing.utils import have_numpy
 
         converted = []
@@ -514,7 +752,7 @@ class StatefulProcessorApiClient:
             converted = list(data)
 
         row_value = Row(*converted)
-        return self.pickleSer.dumps(schema.toInternal(row_value))
+        return schema.toInternal(row_value)
 
     def _deserialize_from_bytes(self, value: bytes) -> Any:
         return self.pickleSer.loads(value)
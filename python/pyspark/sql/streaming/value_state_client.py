@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import functools
 from typing import Union, Tuple, Optional
 
 from pyspark.sql.streaming.stateful_processor_api_client import StatefulProcessorApiClient
@@ -38,6 +39,10 @@ class ValueStateClient:
     def exists(self, state_name: str) -> bool:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
 
+        if self._stateful_processor_api_client._state_cache is not None:
+            # Fetch the value instead so that following reads are served from the cache.
+            return self.get(state_name) is not None
+
         exists_call = stateMessage.Exists()
         value_state_call = stateMessage.ValueStateCall(stateName=state_name, exists=exists_call)
         state_variable_request = stateMessage.StateVariableRequest(valueStateCall=value_state_call)
@@ -60,6 +65,12 @@ class ValueStateClient:
     def get(self, state_name: str) -> Optional[Tuple]:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
 
+        cache = self._stateful_processor_api_client._state_cache
+        if cache is not None:
+            cached, value = cache.get((state_name, None))
+            if cached:
+                return value
+
         get_call = stateMessage.Get()
         value_state_call = stateMessage.ValueStateCall(stateName=state_name, get=get_call)
         state_variable_request = stateMessage.StateVariableRequest(valueStateCall=value_state_call)
@@ -70,9 +81,15 @@ class ValueStateClient:
         status = response_message[0]
         if status == 0:
             if len(response_message[2]) == 0:
-                return None
-            data = self._stateful_processor_api_client._deserialize_from_bytes(response_message[2])
-            return tuple(data)
+                value = None
+            else:
+                data = self._stateful_processor_api_client._deserialize_from_bytes(
+                    response_message[2]
+                )
+                value = tuple(data)
+            if cache is not None:
+                cache.put((state_name, None), value, len(response_message[2]))
+            return value
         else:
             # TODO(SPARK-49233): Classify user facing errors.
             raise PySparkRuntimeError(f"Error getting value state: " f"{response_message[1]}")
@@ -80,7 +97,9 @@ class ValueStateClient:
     def update(self, state_name: str, value: Tuple) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
 
-        bytes = self._stateful_processor_api_client._serialize_to_bytes(self.schema, value)
+        api_client = self._stateful_processor_api_client
+        internal_value = api_client._to_internal(self.schema, value)
+        bytes = api_client.pickleSer.dumps(internal_value)
         update_call = stateMessage.ValueStateUpdate(value=bytes)
         value_state_call = stateMessage.ValueStateCall(
             stateName=state_name, valueStateUpdate=update_call
@@ -88,12 +107,17 @@ class ValueStateClient:
         state_variable_request = stateMessage.StateVariableRequest(valueStateCall=value_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error updating value state: " f"{response_message[1]}")
+        # TODO(SPARK-49233): Classify user facing errors.
+        write = functools.partial(
+            api_client._send_pipelined_proto_message,
+            message.SerializeToString(),
+            "Error updating value state",
+        )
+        if api_client._state_cache is not None:
+            # Cache the converted value as is, instead of deserializing what was just serialized.
+            api_client._state_cache.put((state_name, None), internal_value, len(bytes), write)
+        else:
+            write()
 
     def clear(self, state_name: str) -> None:
         import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
@@ -103,9 +127,14 @@ class ValueStateClient:
         state_variable_request = stateMessage.StateVariableRequest(valueStateCall=value_state_call)
         message = stateMessage.StateRequest(stateVariableRequest=state_variable_request)
 
-        self._stateful_processor_api_client._send_proto_message(message.SerializeToString())
-        response_message = self._stateful_processor_api_client._receive_proto_message()
-        status = response_message[0]
-        if status != 0:
-            # TODO(SPARK-49233): Classify user facing errors.
-            raise PySparkRuntimeError(f"Error clearing value state: " f"{response_message[1]}")
+        api_client = self._stateful_processor_api_client
+        # TODO(SPARK-49233): Classify user facing errors.
+        write = functools.partial(
+            api_client._send_pipelined_proto_message,
+            message.SerializeToString(),
+            "Error clearing value state",
+        )
+        if api_client._state_cache is not None:
+            api_client._state_cache.put((state_name, None), None, 0, write)
+        else:
+            write()
@@ -362,6 +362,81 @@ class WindowArrowUDFTestsMixin:
 
         self.assertEqual(expected1.collect(), result1.collect())
 
+    def test_bounded_incremental(self):
+        import pyarrow as pa
+
+        class RollingMean:
+            def __init__(self):
+                self.total = 0.0
+                self.count = 0
+
+            def add(self, v):
+                self.total += v
+                self.count += 1
+
+            def remove(self, v):
+                self.total -= v
+                self.count -= 1
+
+            def evaluate(self):
+                return self.total / self.count if self.count > 0 else None
+
+        def avg(v: pa.Array) -> float:
+            return pa.compute.mean(v)
+
+        avg.window_aggregator = RollingMean
+        mean_udf = arrow_udf("double")(avg)
+
+        df = self.data
+        for w in [
+            self.sliding_row_window,
+            self.sliding_range_window,
+            self.growing_row_window,
+            self.shrinking_range_window,
+            self.unbounded_window,
+        ]:
+            with self.subTest(window=w):
+                result = df.withColumn("m", mean_udf(df["v"]).over(w))
+                expected = df.withColumn("m", sf.mean(df["v"]).over(w))
+                self.assertEqual(expected.collect(), result.collect())
+
+    def test_bounded_incremental_with_nulls(self):
+        import pyarrow as pa
+
+        class RollingMean:
+            def __init__(self):
+                self.total = 0.0
+                self.count = 0
+
+            def add(self, v):
+                # Nulls are passed as None.
+                if v is not None:
+                    self.total += v
+                    self.count += 1
+
+            def remove(self, v):
+                if v is not None:
+                    self.total -= v
+                    self.count -= 1
+
+            def evaluate(self):
+                return self.total / self.count if self.count > 0 else None
+
+        def avg(v: pa.Array) -> float:
+            return pa.compute.mean(v)
+
+        avg.window_aggregator = RollingMean
+        mean_udf = arrow_udf("double")(avg)
+
+        df = self.data.withColumn(
+            "n", sf.when(sf.col("v") % 3 != 0, sf.col("v")).otherwise(sf.lit(None))
+        )
+        for w in [self.sliding_row_window, self.sliding_range_window]:
+            with self.subTest(window=w):
+                result = df.withColumn("m", mean_udf(df["n"]).over(w))
+                expected = df.withColumn("m", sf.mean(df["n"]).over(w))
+                self.assertEqual(expected.collect(), result.collect())
+
     def test_bounded_mixed(self):
         df = self.data
         w1 = self.sliding_row_window
@@ -15,9 +15,13 @@
 # limitations under the License.
 #
 
+import os
+import tempfile
+import threading
 import unittest
 import uuid
 from collections.abc import Generator
+from unittest import mock
 from typing import Optional, Any, Union
 
 from pyspark.testing.connectutils import should_test_connect, connect_requirement_message
@@ -29,13 +33,15 @@ if should_test_connect:
     import pandas as pd
     import pyarrow as pa
     from pyspark.sql.connect.client import SparkConnectClient, DefaultChannelBuilder
+    from pyspark.sql.connect.client.artifact import LocalData
     from pyspark.sql.connect.client.retries import (
         Retrying,
         DefaultPolicy,
     )
     from pyspark.sql.connect.client.reattach import ExecutePlanResponseReattachableIterator
     from pyspark.sql.connect.session import SparkSession as RemoteSparkSession
-    from pyspark.errors import PySparkRuntimeError
+    from pyspark.sql.metrics import ExecutionInfo
+    from pyspark.errors import PySparkRuntimeError, PySparkValueError
     import pyspark.sql.connect.proto as proto
 
     class TestPolicy(DefaultPolicy):
@@ -275,6 +281,230 @@ class SparkConnectClientTestCase(unittest.TestCase):
         for resp in client._stub.ExecutePlan(req, metadata=None):
             assert resp.operation_id == "10a4c38e-7e87-40ee-9d6f-60ff0751e63b"
 
+    def test_to_table_as_iterator_streams_batches(self):
+        client = SparkConnectClient("sc://foo/", use_reattachable_execute=False)
+        produced = []
+
+        class StreamingMockService(MockService):
+            def ExecutePlan(self, req: proto.ExecutePlanRequest, metadata):
+                for i in range(3):
+                    resp = super().ExecutePlan(req, metadata)[0]
+                    produced.append(i)
+                    yield resp
+                resp = proto.ExecutePlanResponse(
+                    session_id=self._session_id, operation_id=req.operation_id
+                )
+                resp.metrics.SetInParent()
+                yield resp
+
+        client._stub = StreamingMockService(client._session_id)
+
+        iterator = client.to_table_as_iterator(proto.Plan(), {})
+        table = next(iterator)
+        self.assertEqual(table.column("col1").to_pylist(), [1, 2])
+        # The later batches are only fetched when they are consumed.
+        self.assertEqual(produced, [0])
+
+        results = list(iterator)
+        self.assertEqual(produced, [0, 1, 2])
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[-1], ExecutionInfo)
+
+    def test_parallel_arrow_decoding(self):
+        class ManyBatchesMockService(MockService):
+            def ExecutePlan(self, req: proto.ExecutePlanRequest, metadata):
+                for i in range(10):
+                    table = pa.table({"id": list(range(i * 3, i * 3 + 3))})
+                    sink = pa.BufferOutputStream()
+                    with pa.ipc.new_stream(sink, table.schema) as writer:
+                        writer.write_table(table)
+                    resp = proto.ExecutePlanResponse(
+                        session_id=self._session_id, operation_id=req.operation_id
+                    )
+                    resp.arrow_batch.data = sink.getvalue().to_pybytes()
+                    resp.arrow_batch.row_count = 3
+                    resp.arrow_batch.start_offset = i * 3
+                    yield resp
+
+        for threads in [0, 1, 4]:
+            with self.subTest(threads=threads):
+                client = SparkConnectClient(
+                    "sc://foo/", use_reattachable_execute=False, arrow_decode_threads=threads
+                )
+                client._stub = ManyBatchesMockService(client._session_id)
+                table, _, _ = client.to_table(proto.Plan(), {})
+                self.assertEqual(table.column("id").to_pylist(), list(range(30)))
+
+    def test_arrow_decode_threads_from_connection_string(self):
+        session = RemoteSparkSession(connection="sc://foo/;arrow_decode_threads=4")
+        self.assertEqual(session.client._arrow_decode_threads, 4)
+        self.assertEqual(list(session.client._builder.metadata()), [])
+
+        client = SparkConnectClient("sc://foo/", use_reattachable_execute=False)
+        self.assertEqual(client._arrow_decode_threads, 0)
+
+        with self.assertRaises(PySparkValueError):
+            SparkConnectClient("sc://foo/;arrow_decode_threads=-1")
+
+    def test_plan_cache_size_from_connection_string(self):
+        session = RemoteSparkSession(connection="sc://foo/;plan_cache_size=16")
+        self.assertEqual(session.client._plan_cache._max_size, 16)
+        self.assertEqual(list(session.client._builder.metadata()), [])
+
+        client = SparkConnectClient("sc://foo/", use_reattachable_execute=False)
+        self.assertEqual(client._plan_cache._max_size, 0)
+        client = SparkConnectClient("sc://foo/", use_reattachable_execute=False, plan_cache_size=8)
+        self.assertEqual(client._plan_cache._max_size, 8)
+
+    def test_artifact_upload_parallelism_from_connection_string(self):
+        session = RemoteSparkSession(connection="sc://foo/;artifact_upload_parallelism=2")
+        self.assertEqual(session.client._artifact_manager._upload_parallelism, 2)
+        self.assertEqual(list(session.client._builder.metadata()), [])
+
+        client = SparkConnectClient(
+            "sc://foo/;artifact_upload_parallelism=3",
+            use_reattachable_execute=False,
+            artifact_upload_parallelism=2,
+        )
+        self.assertEqual(client._artifact_manager._upload_parallelism, 3)
+
+        client = SparkConnectClient("sc://foo/", use_reattachable_execute=False)
+        self.assertEqual(client._artifact_manager._upload_parallelism, 1)
+
+        with self.assertRaises(PySparkValueError):
+            SparkConnectClient("sc://foo/;artifact_upload_parallelism=two")
+
+    def test_analyze_cache(self):
+        class AnalyzeMockService(MockService):
+            def __init__(self, session_id: str):
+                super().__init__(session_id)
+                self.analyze_calls = 0
+
+            def AnalyzePlan(self, req: proto.AnalyzePlanRequest, metadata):
+                self.analyze_calls += 1
+                resp = proto.AnalyzePlanResponse(session_id=self._session_id)
+                resp.schema.schema.struct.fields.add(
+                    name="id", data_type=proto.DataType(long=proto.DataType.Long())
+                )
+                return resp
+
+            def Config(self, req: proto.ConfigRequest, metadata):
+                return proto.ConfigResponse(session_id=self._session_id)
+
+        client = SparkConnectClient("sc://foo/", use_reattachable_execute=False)
+        mock = AnalyzeMockService(client._session_id)
+        client._stub = mock
+
+        plan = proto.Plan()
+        plan.root.common.plan_id = 1
+        plan.root.range.end = 10
+        other_plan = proto.Plan()
+        other_plan.CopyFrom(plan)
+        other_plan.root.common.plan_id = 2
+
+        self.assertEqual(client.schema(plan).names, ["id"])
+        self.assertEqual(client.schema(plan).names, ["id"])
+        self.assertEqual(mock.analyze_calls, 1)
+        client.schema(other_plan)
+        self.assertEqual(mock.analyze_calls, 2)
+        self.assertEqual((client._analyze_cache.hits, client._analyze_cache.misses), (1, 2))
+
+        # Setting a config invalidates the cache.
+        op = proto.ConfigRequest.Operation()
+        op.set.pairs.add(key="spark.sql.caseSensitive", value="true")
+        client.config(op)
+        client.schema(plan)
+        self.assertEqual(mock.analyze_calls, 3)
+
+        # Commands invalidate the cache.
+        client.execute_command(proto.Command())
+        client.schema(plan)
+        self.assertEqual(mock.analyze_calls, 4)
+
+        client = SparkConnectClient(
+            "sc://foo/", use_reattachable_execute=False, analyze_cache_size=0
+        )
+        mock = AnalyzeMockService(client._session_id)
+        client._stub = mock
+        client.schema(plan)
+        client.schema(plan)
+        self.assertEqual(mock.analyze_calls, 2)
+
+    def test_artifact_upload(self):
+        class ArtifactMockStub:
+            def __init__(self):
+                self.lock = threading.Lock()
+                self.uploaded = []
+                self.failures = 1
+                self.lost = set()
+                self.status_requests = []
+
+            def ArtifactStatus(self, request, metadata):
+                self.status_requests.append(sorted(request.names))
+                resp = proto.ArtifactStatusesResponse()
+                for name in request.names:
+                    exists = name in self.uploaded and name not in self.lost
+                    resp.statuses[name].exists = exists
+                return resp
+
+            def AddArtifacts(self, requests, metadata):
+                names = []
+                for req in requests:
+                    if req.HasField("begin_chunk"):
+                        names.append(req.begin_chunk.name)
+                    names.extend(a.name for a in req.batch.artifacts)
+                with self.lock:
+                    if self.failures > 0 and "jars/large0.jar" in names:
+                        self.failures -= 1
+                        raise TestException("unavailable", grpc.StatusCode.UNAVAILABLE)
+                    self.uploaded.extend(names)
+                return proto.AddArtifactsResponse()
+
+        with tempfile.TemporaryDirectory(prefix="test_artifact_upload") as d:
+            paths = []
+            for name, size in [("large0", 300000), ("large1", 200000), ("small", 10)]:
+                paths.append(os.path.join(d, f"{name}.jar"))
+                with open(paths[-1], "wb") as f:
+                    f.write(os.urandom(size))
+
+            client = SparkConnectClient(
+                "sc://foo/", use_reattachable_execute=False, artifact_upload_parallelism=2
+            )
+            client._retry_policies = [TestPolicy()]
+            stub = ArtifactMockStub()
+            client._artifact_manager._stub = stub
+
+            # The retry after the failure only uploads the artifacts that did not make it.
+            client.add_artifacts(*paths, pyfile=False, archive=False, file=False)
+            self.assertEqual(
+                sorted(stub.uploaded), ["jars/large0.jar", "jars/large1.jar", "jars/small.jar"]
+            )
+
+            # Artifacts that have already been uploaded are skipped, unless they changed.
+            with open(paths[2], "wb") as f:
+                f.write(b"changed")
+            client.add_artifacts(*paths, pyfile=False, archive=False, file=False)
+            self.assertEqual(len(stub.uploaded), 4)
+            self.assertEqual(stub.uploaded[-1], "jars/small.jar")
+            # The server is asked whether it still has them, on the retry and on this call.
+            self.assertEqual(
+                stub.status_requests,
+                [["jars/large1.jar", "jars/small.jar"], ["jars/large0.jar", "jars/large1.jar"]],
+            )
+
+            # Another client of the same session skips them as well, without hashing the files
+            # again, but uploads the ones that the server does not have anymore.
+            stub.lost.add("jars/large1.jar")
+            other = SparkConnectClient(
+                f"sc://foo/;session_id={client._session_id}", use_reattachable_execute=False
+            )
+            other._artifact_manager._stub = stub
+            with mock.patch.object(LocalData, "_hash") as compute_hash:
+                other.add_artifacts(*paths, pyfile=False, archive=False, file=False)
+                compute_hash.assert_not_called()
+            self.assertEqual(len(stub.uploaded), 5)
+            self.assertEqual(stub.uploaded[-1], "jars/large1.jar")
+
 
 @unittest.skipIf(not should_test_connect, connect_requirement_message)
 class SparkConnectClientReattachTestCase(unittest.TestCase):
@@ -28,12 +28,18 @@ from pyspark.testing.connectutils import (
 from pyspark.errors import PySparkValueError
 
 if should_test_connect:
+    import pyarrow as pa
+
     import pyspark.sql.connect.proto as proto
     from pyspark.sql.connect.column import Column
     from pyspark.sql.connect.dataframe import DataFrame
-    from pyspark.sql.connect.plan import WriteOperation, Read
+    from pyspark.sql.connect.plan import WriteOperation, Read, LocalRelation, PlanCache
     from pyspark.sql.connect.readwriter import DataFrameReader
-    from pyspark.sql.connect.expressions import LiteralExpression
+    from pyspark.sql.connect.expressions import (
+        CommonInlineUserDefinedFunction,
+        LiteralExpression,
+        PythonUDF,
+    )
     from pyspark.sql.connect.functions import col, lit, max, min, sum
     from pyspark.sql.connect.types import pyspark_types_to_proto_types
     from pyspark.sql.types import (
@@ -114,6 +120,56 @@ class SparkConnectPlanTests(PlanOnlyTestFixture):
         self.assertEqual(plan.root.filter.condition.unresolved_function.function_name, ">")
         self.assertEqual(len(plan.root.filter.condition.unresolved_function.arguments), 2)
 
+    def test_plan_cache(self):
+        # Disabled by default.
+        df = self.connect.readTable(table_name=self.tbl_name)
+        filtered = df.filter(df.col_name > 3)
+        self.assertIsNot(filtered._plan.plan(self.connect), filtered._plan.plan(self.connect))
+
+        # Deep chains of plans are built bottom-up instead of recursing once per plan.
+        deep = df
+        for i in range(2000):
+            deep = deep.withColumn(f"c{i}", col("col_name"))
+        plan = deep._plan.to_proto(self.connect)
+        self.assertEqual(plan.root.with_columns.aliases[0].name, ["c1999"])
+
+        self.connect._plan_cache = PlanCache(8)
+        try:
+            plan = filtered._plan.to_proto(self.connect)
+            self.assertEqual(filtered._plan.to_proto(self.connect), plan)
+            self.assertIs(filtered._plan.plan(self.connect), filtered._plan.plan(self.connect))
+
+            # The parent copies the cached relation of its child.
+            hits = self.connect._plan_cache.hits
+            selected = filtered.select("col_name")
+            plan = selected._plan.to_proto(self.connect)
+            self.assertEqual(self.connect._plan_cache.hits, hits + 1)
+            self.assertEqual(plan.root.project.input, filtered._plan.plan(self.connect))
+
+            # Relations with pickled Python functions are not cached, so that the functions
+            # are pickled again by every action.
+            udf = CommonInlineUserDefinedFunction(
+                "f", PythonUDF(IntegerType(), 100, lambda x: x, "3.11"), arguments=[col("id")._expr]
+            )
+            with_udf = selected.select(Column(udf))
+            with_udf._plan.to_proto(self.connect)
+            self.assertIsNot(with_udf._plan.plan(self.connect), with_udf._plan.plan(self.connect))
+            self.assertIsNone(self.connect._plan_cache.get(with_udf._plan._plan_id))
+            self.assertIsNotNone(self.connect._plan_cache.get(selected._plan._plan_id))
+
+            # Large relations, e.g. with local data, are not cached.
+            local = LocalRelation(pa.table({"a": ["x" * 1024] * 2048}))
+            local.to_proto(self.connect)
+            self.assertIsNone(self.connect._plan_cache.get(local._plan_id))
+
+            # The least recently used relations are evicted.
+            for i in range(8):
+                df = df.withColumn(f"c{i}", col("col_name"))
+                df._plan.to_proto(self.connect)
+            self.assertIsNone(self.connect._plan_cache.get(filtered._plan._plan_id))
+        finally:
+            self.connect._plan_cache = None
+
     def test_filter_with_string_expr(self):
         """SPARK-41297: filter supports SQL expression"""
         df = self.connect.readTable(table_name=self.tbl_name)
@@ -54,6 +54,43 @@ class PandasSQLMetrics(ReusedSQLTestCase):
 
         for metric in python_sql_metrics:
             self.assertIn(metric, executionMetrics)
+        # The phase times are only reported when spark.python.worker.phaseTimes.enabled is set.
+        self.assertNotIn("time to run user code in Python workers", executionMetrics)
+
+
+@unittest.skipIf(
+    not have_pandas or not have_pyarrow,
+    cast(str, pandas_requirement_message or pyarrow_requirement_message),
+)
+class PandasSQLMetricsWithPhaseTimes(ReusedSQLTestCase):
+    @classmethod
+    def conf(cls):
+        cfg = super().conf()
+        cfg.set("spark.python.worker.phaseTimes.enabled", "true")
+        return cfg
+
+    def test_pandas_sql_metrics_phase_times(self):
+        python_sql_metrics = [
+            "time to set up files and broadcasts in Python workers",
+            "time to deserialize functions in Python workers",
+            "time to deserialize input in Python workers",
+            "time to run user code in Python workers",
+            "time to serialize output in Python workers",
+            "time to write output in Python workers",
+        ]
+
+        @pandas_udf("long")
+        def test_pandas(col1):
+            return col1 * col1
+
+        self.spark.range(10).select(test_pandas("id")).collect()
+
+        statusStore = self.spark._jsparkSession.sharedState().statusStore()
+        lastExecId = statusStore.executionsList().last().executionId()
+        executionMetrics = statusStore.execution(lastExecId).get().metrics().mkString()
+
+        for metric in python_sql_metrics:
+            self.assertIn(metric, executionMetrics)
 
 
 if __name__ == "__main__":
@@ -19,6 +19,8 @@ from abc import abstractmethod
 
 import json
 import os
+import socket
+import threading
 import time
 import tempfile
 from pyspark.sql.streaming import StatefulProcessor
@@ -27,6 +29,8 @@ import unittest
 from typing import cast
 
 from pyspark import SparkConf
+from pyspark.errors import PySparkRuntimeError
+from pyspark.serializers import read_int, write_int
 from pyspark.sql.functions import array_sort, col, explode, split
 from pyspark.sql.types import (
     StringType,
@@ -398,6 +402,56 @@ class TransformWithStateTestsMixin:
 
         self._test_transform_with_state_basic(MapStateProcessorFactory(), check_results, True)
 
+    def test_transform_with_state_pipelined_state_requests(self):
+        def check_results(batch_df, _):
+            assert set(batch_df.sort("id").collect()) == {
+                Row(id="0", countAsString="2"),
+                Row(id="1", countAsString="2"),
+            }
+
+        with self.sql_conf(
+            {"spark.sql.execution.python.transformWithState.maxPendingStateRequests": "8"}
+        ):
+            for processor_factory in [
+                ListStateProcessorFactory(),
+                MapStateProcessorFactory(),
+            ]:
+                with self.subTest(processor=type(processor_factory).__name__):
+                    self._test_transform_with_state_basic(
+                        processor_factory, check_results, True, "processingTime"
+                    )
+
+    def test_transform_with_state_state_cache(self):
+        def check_results(batch_df, batch_id):
+            if batch_id == 0:
+                assert set(batch_df.sort("id").collect()) == {
+                    Row(id="0", countAsString="2"),
+                    Row(id="1", countAsString="2"),
+                }
+            else:
+                assert set(batch_df.sort("id").collect()) == {
+                    Row(id="0", countAsString="3"),
+                    Row(id="1", countAsString="2"),
+                }
+
+        def check_map_results(batch_df, _):
+            assert set(batch_df.sort("id").collect()) == {
+                Row(id="0", countAsString="2"),
+                Row(id="1", countAsString="2"),
+            }
+
+        for max_bytes in ["1", "1m"]:
+            with self.sql_conf(
+                {"spark.sql.execution.python.transformWithState.stateCacheMaxBytes": max_bytes}
+            ):
+                with self.subTest(max_bytes=max_bytes):
+                    self._test_transform_with_state_basic(
+                        SimpleStatefulProcessorFactory(), check_results
+                    )
+                    self._test_transform_with_state_basic(
+                        MapStateProcessorFactory(), check_map_results, True, "processingTime"
+                    )
+
     # test map state with ttl has the same behavior as map state when state doesn't expire.
     def test_transform_with_state_map_state_large_ttl(self):
         def check_results(batch_df, batch_id):
@@ -1835,6 +1889,142 @@ class TransformWithStateInPandasTestsMixin(TransformWithStateTestsMixin):
         return cfg
 
 
+@unittest.skipIf(not have_pyarrow, cast(str, pyarrow_requirement_message))
+class StatefulProcessorApiClientPipeliningTests(unittest.TestCase):
+    """
+    Tests the pipelined state requests of the Python client against a minimal in-process state
+    server, which keeps one value per grouping key and fails updates to the value "bad".
+    """
+
+    def setUp(self):
+        self.server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket_path = os.path.join(tempfile.mkdtemp(), "state_server.sock")
+        self.server_socket.bind(self.socket_path)
+        self.server_socket.listen(1)
+        self.requests = []
+        self.server_thread = threading.Thread(target=self._serve, daemon=True)
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server_socket.close()
+
+    def _serve(self):
+        import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
+        from pyspark.serializers import CPickleSerializer
+
+        try:
+            conn, _ = self.server_socket.accept()
+        except OSError:
+            # The test finished without connecting.
+            return
+        sockfile = conn.makefile("rwb")
+        bad_value = CPickleSerializer().dumps(("bad",))
+        values = {}
+        key = None
+        while True:
+            try:
+                read_int(sockfile)
+                request = stateMessage.StateRequest.FromString(sockfile.read(read_int(sockfile)))
+            except (EOFError, OSError):
+                return
+            response = stateMessage.StateResponse(statusCode=0)
+            if request.WhichOneof("method") == "implicitGroupingKeyRequest":
+                key_request = request.implicitGroupingKeyRequest
+                if key_request.WhichOneof("method") == "setImplicitKey":
+                    key = key_request.setImplicitKey.key
+                else:
+                    key = None
+                self.requests.append("implicitKey")
+            else:
+                value_state_call = request.stateVariableRequest.valueStateCall
+                call = value_state_call.WhichOneof("method")
+                self.requests.append(call)
+                if call == "get":
+                    response.value = values.get(key, b"")
+                elif value_state_call.valueStateUpdate.value == bad_value:
+                    response.statusCode = 1
+                    response.errorMessage = "update failed"
+                else:
+                    values[key] = value_state_call.valueStateUpdate.value
+            response_bytes = response.SerializeToString()
+            write_int(len(response_bytes), sockfile)
+            sockfile.write(response_bytes)
+            sockfile.flush()
+
+    def _new_client(self, max_pending_requests):
+        from pyspark.sql.streaming.stateful_processor_api_client import StatefulProcessorApiClient
+        from pyspark.sql.streaming.value_state_client import ValueStateClient
+
+        api_client = StatefulProcessorApiClient(
+            self.socket_path,
+            StructType([StructField("id", StringType())]),
+            max_pending_requests=max_pending_requests,
+        )
+        value_state = ValueStateClient(api_client, StructType([StructField("v", StringType())]))
+        return api_client, value_state
+
+    def test_pipelined_requests(self):
+        api_client, value_state = self._new_client(max_pending_requests=4)
+        for i in range(3):
+            api_client.set_implicit_key((str(i),))
+            value_state.update("count", (str(i),))
+        # The responses are read once 4 requests are outstanding.
+        self.assertEqual(len(api_client._pending_requests), 2)
+
+        api_client.set_implicit_key(("1",))
+        # A request returning data reads the pending responses first.
+        self.assertEqual(value_state.get("count"), ("1",))
+        self.assertEqual(len(api_client._pending_requests), 0)
+        self.assertEqual(self.requests.count("valueStateUpdate"), 3)
+
+    def test_pipelined_request_failure(self):
+        api_client, value_state = self._new_client(max_pending_requests=8)
+        api_client.set_implicit_key(("0",))
+        value_state.update("count", ("bad",))
+        api_client.set_implicit_key(("1",))
+        value_state.update("count", ("1",))
+
+        # The failure is raised by the next call reading the responses, and names the request
+        # that failed and its grouping key.
+        with self.assertRaisesRegex(
+            PySparkRuntimeError,
+            r"Error updating value state: update failed \(pipelined request "
+            r"stateVariableRequest\.valueStateCall\.valueStateUpdate on state 'count' "
+            r"for grouping key \('0',\)\)",
+        ):
+            value_state.get("count")
+
+        # All the responses were read, so the following requests are answered in sync.
+        self.assertEqual(len(api_client._pending_requests), 0)
+        self.assertEqual(value_state.get("count"), ("1",))
+
+    def test_describe_request(self):
+        import pyspark.sql.streaming.proto.StateMessage_pb2 as stateMessage
+        from pyspark.sql.streaming.stateful_processor_api_client import StatefulProcessorApiClient
+
+        remove_implicit_key = stateMessage.StateRequest(
+            implicitGroupingKeyRequest=stateMessage.ImplicitGroupingKeyRequest(
+                removeImplicitKey=stateMessage.RemoveImplicitKey()
+            )
+        )
+        self.assertEqual(
+            StatefulProcessorApiClient._describe_request(remove_implicit_key.SerializeToString()),
+            "implicitGroupingKeyRequest.removeImplicitKey",
+        )
+
+        clear = stateMessage.StateRequest(
+            stateVariableRequest=stateMessage.StateVariableRequest(
+                listStateCall=stateMessage.ListStateCall(
+                    stateName="events", clear=stateMessage.Clear()
+                )
+            )
+        )
+        self.assertEqual(
+            StatefulProcessorApiClient._describe_request(clear.SerializeToString()),
+            "stateVariableRequest.listStateCall.clear on state 'events'",
+        )
+
+
 class TransformWithStateInPandasTests(TransformWithStateInPandasTestsMixin, ReusedSQLTestCase):
     pass
 
@@ -29,6 +29,7 @@ from pyspark.sql.functions import (
     max,
     rank,
     udf,
+    when,
     pandas_udf,
     PandasUDFType,
 )
@@ -380,6 +381,79 @@ class WindowPandasUDFTestsMixin:
 
         assert_frame_equal(expected1.toPandas(), result1.toPandas())
 
+    def test_bounded_incremental(self):
+        import pandas as pd
+
+        class RollingMean:
+            def __init__(self):
+                self.total = 0.0
+                self.count = 0
+
+            def add(self, v):
+                self.total += v
+                self.count += 1
+
+            def remove(self, v):
+                self.total -= v
+                self.count -= 1
+
+            def evaluate(self):
+                return self.total / self.count if self.count > 0 else None
+
+        def avg(v: pd.Series) -> float:
+            return v.mean()
+
+        avg.window_aggregator = RollingMean
+        mean_udf = pandas_udf("double")(avg)
+
+        df = self.data
+        for w in [
+            self.sliding_row_window,
+            self.sliding_range_window,
+            self.growing_row_window,
+            self.shrinking_range_window,
+            self.unbounded_window,
+        ]:
+            with self.subTest(window=w):
+                result = df.withColumn("m", mean_udf(df["v"]).over(w))
+                expected = df.withColumn("m", mean(df["v"]).over(w))
+                assertDataFrameEqual(result, expected)
+
+    def test_bounded_incremental_with_nulls(self):
+        import pandas as pd
+
+        class RollingMean:
+            def __init__(self):
+                self.total = 0.0
+                self.count = 0
+
+            def add(self, v):
+                # Null doubles are passed as NaN.
+                if not pd.isna(v):
+                    self.total += v
+                    self.count += 1
+
+            def remove(self, v):
+                if not pd.isna(v):
+                    self.total -= v
+                    self.count -= 1
+
+            def evaluate(self):
+                return self.total / self.count if self.count > 0 else None
+
+        def avg(v: pd.Series) -> float:
+            return v.mean()
+
+        avg.window_aggregator = RollingMean
+        mean_udf = pandas_udf("double")(avg)
+
+        df = self.data.withColumn("n", when(col("v") % 3 != 0, col("v")).otherwise(lit(None)))
+        for w in [self.sliding_row_window, self.sliding_range_window]:
+            with self.subTest(window=w):
+                result = df.withColumn("m", mean_udf(df["n"]).over(w))
+                expected = df.withColumn("m", mean(df["n"]).over(w))
+                assertDataFrameEqual(result, expected)
+
     def test_bounded_mixed(self):
         from pyspark.sql.functions import mean, max
 
@@ -14,17 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import datetime
+import decimal
 import unittest
 
+from pyspark.errors import PySparkValueError
 from pyspark.sql.conversion import ArrowTableToRowsConversion, LocalDataToArrowConversion
 from pyspark.sql.types import (
     ArrayType,
     BinaryType,
+    DecimalType,
+    DoubleType,
     IntegerType,
     MapType,
+    NullType,
     Row,
     StringType,
     StructType,
+    TimestampNTZType,
+    TimestampType,
 )
 from pyspark.testing.objects import ExamplePoint, ExamplePointUDT
 from pyspark.testing.utils import have_pyarrow, pyarrow_requirement_message
@@ -109,6 +117,128 @@ class ConversionTests(unittest.TestCase):
             with self.subTest(expected=e):
                 self.assertEqual(a, e)
 
+    def test_conversion_atomic_columns(self):
+        tz = datetime.timezone(datetime.timedelta(hours=5))
+        schema = (
+            StructType()
+            .add("i", IntegerType(), nullable=False)
+            .add("d", DoubleType())
+            .add("s", StringType())
+            .add("b", BinaryType())
+            .add("ts", TimestampType())
+            .add("ts_ntz", TimestampNTZType())
+            .add("dec", DecimalType(10, 2))
+        )
+        ts_utc = datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
+        ts_ntz = datetime.datetime(2024, 1, 1, 5, 0)
+
+        # Columns converted in bulk.
+        data = [
+            (1, 1.5, "a", b"a", datetime.datetime(2024, 1, 1, 5, 0, tzinfo=tz), ts_ntz, None),
+            (2, None, None, None, None, None, decimal.Decimal("1.25")),
+        ]
+        tbl = LocalDataToArrowConversion.convert(data, schema, use_large_var_types=False)
+        self.assertEqual(tbl.column("ts").to_pylist(), [ts_utc, None])
+        self.assertEqual(
+            tbl.to_pylist(),
+            [
+                dict(i=1, d=1.5, s="a", b=b"a", ts=ts_utc, ts_ntz=ts_ntz, dec=None),
+                dict(
+                    i=2, d=None, s=None, b=None, ts=None, ts_ntz=None, dec=decimal.Decimal("1.25")
+                ),
+            ],
+        )
+
+        # Columns that fall back to the per-value converters.
+        data = [
+            (1, 1.5, True, bytearray(b"a"), None, None, decimal.Decimal("NaN")),
+            (2, None, 10, None, None, None, decimal.Decimal("1.25")),
+        ]
+        tbl = LocalDataToArrowConversion.convert(data, schema, use_large_var_types=False)
+        self.assertEqual(tbl.column("s").to_pylist(), ["true", "10"])
+        self.assertEqual(tbl.column("b").to_pylist(), [b"a", None])
+        self.assertEqual(tbl.column("dec").to_pylist(), [None, decimal.Decimal("1.25")])
+
+        with self.assertRaises(PySparkValueError):
+            LocalDataToArrowConversion.convert(
+                [(None, None, None, None, None, None, None)], schema, use_large_var_types=False
+            )
+
+    def test_conversion_struct_columns(self):
+        import pyarrow as pa
+
+        schema = (
+            StructType()
+            .add("id", IntegerType())
+            .add(
+                "s",
+                StructType()
+                .add("b", BinaryType())
+                .add("n", StructType().add("i", IntegerType()).add("s", StringType())),
+            )
+        )
+        data = [
+            (i, None if i % 3 == 0 else (str(i).encode(), None if i % 2 == 0 else (i, str(i))))
+            for i in range(10)
+        ]
+        tbl = LocalDataToArrowConversion.convert(data, schema, use_large_var_types=False)
+        # Multiple chunks with offsets.
+        tbl = pa.concat_tables([tbl.slice(1, 4), tbl.slice(5)])
+
+        actual = ArrowTableToRowsConversion.convert(tbl, schema)
+        expected = [
+            Row(
+                id=i,
+                s=None
+                if i % 3 == 0
+                else Row(
+                    b=bytearray(str(i).encode()),
+                    n=None if i % 2 == 0 else Row(i=i, s=str(i)),
+                ),
+            )
+            for i in range(1, 10)
+        ]
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            [r.s.n.s for r in actual if r.s is not None and r.s.n is not None], ["1", "5", "7"]
+        )
+
+    def test_conversion_flat_columns(self):
+        import pyarrow as pa
+
+        utc = datetime.timezone.utc
+        columns = [
+            (pa.array([None, None], pa.null()), NullType()),
+            (pa.array([b"a", None, b""], pa.binary()), BinaryType()),
+            (
+                pa.array(
+                    [
+                        datetime.datetime(2024, 11, 3, 8, 30, 0, 123456, tzinfo=utc),
+                        None,
+                        datetime.datetime(1960, 1, 1, tzinfo=utc),
+                    ],
+                    pa.timestamp("us", tz="UTC"),
+                ),
+                TimestampType(),
+            ),
+            # Out of the range of datetime.fromtimestamp.
+            (
+                pa.array([datetime.datetime(1, 1, 2, tzinfo=utc)], pa.timestamp("us", tz="UTC")),
+                TimestampType(),
+            ),
+            (
+                pa.array([datetime.datetime(2024, 1, 1, 5, 0), None], pa.timestamp("us")),
+                TimestampNTZType(),
+            ),
+        ]
+        for column, dataType in columns:
+            with self.subTest(dataType=dataType, column=column):
+                conv = ArrowTableToRowsConversion._create_converter(dataType)
+                expected = [conv(v) for v in column.to_pylist()]
+                actual = ArrowTableToRowsConversion._convert_column(column, dataType)
+                self.assertEqual(actual, expected)
+                self.assertEqual([type(v) for v in actual], [type(v) for v in expected])
+
 
 if __name__ == "__main__":
     from pyspark.sql.tests.test_conversion import *  # noqa: F401
@@ -346,6 +346,49 @@ class UDFProfiler2TestsMixin:
         for id in self.profile_results:
             self.assert_udf_profile_present(udf_id=id, expected_line_count_prefix=5)
 
+    @unittest.skipIf(
+        not have_pandas or not have_pyarrow,
+        cast(str, pandas_requirement_message or pyarrow_requirement_message),
+    )
+    def test_perf_profiler_pandas_udf_window_incremental(self):
+        import pandas as pd
+
+        class RollingSum:
+            def __init__(self):
+                self.total = 0.0
+
+            def add(self, v):
+                self.total += v
+
+            def remove(self, v):
+                self.total -= v
+
+            def evaluate(self):
+                return self.total
+
+        def sum_udf(v: pd.Series) -> float:
+            return v.sum()
+
+        sum_udf.window_aggregator = RollingSum
+        sum_udf = pandas_udf("double")(sum_udf)
+
+        df = self.spark.createDataFrame(
+            [(1, 1.0), (1, 2.0), (2, 3.0), (2, 5.0), (2, 10.0)], ("id", "v")
+        )
+        w = Window.partitionBy("id").orderBy("v").rowsBetween(-1, 0)
+
+        with self.sql_conf({"spark.sql.pyspark.udf.profiler": "perf"}):
+            df.withColumn("sum_v", sum_udf("v").over(w)).show()
+
+        self.assertEqual(1, len(self.profile_results), str(self.profile_results.keys()))
+
+        for id in self.profile_results:
+            self.assert_udf_profile_present(udf_id=id, expected_line_count_prefix=5)
+            with self.trap_stdout() as io:
+                self.spark.profile.show(id, type="perf")
+            # Each row is added once.
+            self.assertRegex(io.getvalue(), r"\b5 .*\(add\)")
+
     @unittest.skipIf(
         not have_pandas or not have_pyarrow,
         cast(str, pandas_requirement_message or pyarrow_requirement_message),
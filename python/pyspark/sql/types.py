@@ -3036,7 +3036,8 @@ def _create_row_inbound_converter(dataType: DataType) -> Callable:
 def _create_row(
     fields: Union["Row", List[str]], values: Union[Tuple[Any, ...], List[Any]]
 ) -> "Row":
-    row = Row(*values)
+    # Same as Row(*values), without unpacking the values into the arguments of Row.__new__.
+    row = tuple.__new__(Row, values)
     row.__fields__ = fields
     return row
 
@@ -58,6 +58,7 @@ class MockRemoteSession:
         self.hooks = {}
         self.session_id = str(uuid.uuid4())
         self.is_mock_session = True
+        self._plan_cache = None
 
     def set_hook(self, name, hook):
         self.hooks[name] = hook
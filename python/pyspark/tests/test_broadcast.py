@@ -27,6 +27,7 @@ from pyspark import SparkConf, SparkContext, Broadcast
 from pyspark.java_gateway import launch_gateway
 from pyspark.serializers import ChunkedStream
 from pyspark.sql import SparkSession, Row
+from pyspark.testing.utils import have_numpy, numpy_requirement_message
 
 
 class BroadcastTest(unittest.TestCase):
@@ -127,6 +128,87 @@ class BroadcastTest(unittest.TestCase):
         with self.assertRaisesRegex(Py4JJavaError, "RuntimeError.*Broadcast.*unpersisted.*driver"):
             self.sc.parallelize([1]).map(lambda x: bs.unpersist()).collect()
 
+    def _test_broadcast_zero_copy(self, *extra_confs):
+        import numpy as np
+
+        conf = SparkConf()
+        for key, value in extra_confs:
+            conf.set(key, value)
+        conf.set("spark.python.broadcast.zeroCopy", "true")
+        conf.setMaster("local-cluster[2,1,1024]")
+        self.sc = SparkContext(conf=conf)
+        array = np.arange(100000, dtype=np.int64)
+        b = self.sc.broadcast({"array": array, "name": "array"})
+        blob = self.sc.broadcast(b"blob")
+        res = (
+            self.sc.parallelize(range(2), 2)
+            .map(lambda x: (int(b.value["array"].sum()), b.value["name"], blob.value))
+            .collect()
+        )
+        self.assertEqual(res, [(int(array.sum()), "array", b"blob")] * 2)
+        self.assertTrue(np.array_equal(b.value["array"], array))
+
+    @unittest.skipIf(not have_numpy, numpy_requirement_message)
+    def test_broadcast_zero_copy(self):
+        self._test_broadcast_zero_copy()
+
+    @unittest.skipIf(not have_numpy, numpy_requirement_message)
+    def test_broadcast_zero_copy_with_encryption(self):
+        self._test_broadcast_zero_copy(("spark.io.encryption.enabled", "true"))
+
+    @unittest.skipIf(not have_numpy, numpy_requirement_message)
+    def test_broadcast_zero_copy_types(self):
+        import numpy as np
+
+        with tempfile.TemporaryDirectory(prefix="test_broadcast_zero_copy_types") as d:
+            path = os.path.join(d, "value")
+            b = Broadcast(path=path)
+            for value in [b"blob", bytearray(b"blob"), {"array": np.arange(10)}]:
+                with open(path, "wb") as f:
+                    b.dump(value, f, zero_copy=True)
+                # Mapped from the file, and read from a stream as with encryption.
+                mapped = b.load_from_path(path)
+                with open(path, "rb") as f:
+                    read = b.load(f)
+                for loaded in [mapped, read]:
+                    self.assertEqual(type(loaded), type(value))
+                    if isinstance(value, dict):
+                        self.assertTrue(np.array_equal(loaded["array"], value["array"]))
+                        self.assertFalse(loaded["array"].flags.writeable)
+                    else:
+                        self.assertEqual(loaded, value)
+
+    def test_broadcast_value_cache(self):
+        from pyspark.core.broadcast import _BroadcastValueCache
+
+        with tempfile.TemporaryDirectory(prefix="test_broadcast_value_cache") as d:
+            bcasts = []
+            for i in range(3):
+                path = os.path.join(d, str(i))
+                with open(path, "wb") as f:
+                    pickle.dump(bytes(100), f)
+                bcasts.append(Broadcast(path=path))
+            size = os.path.getsize(bcasts[0]._path)
+
+            cache = _BroadcastValueCache(2 * size)
+            # Values that have not been loaded are not cached.
+            cache.put(0, bcasts[0])
+            self.assertEqual(len(cache._entries), 0)
+
+            values = [b.value for b in bcasts]
+            for i, b in enumerate(bcasts):
+                cache.put(i, b)
+            # The least recently used value was evicted.
+            self.assertEqual([key[0] for key in cache._entries], [1, 2])
+
+            restored = Broadcast(path=bcasts[1]._path)
+            cache.restore(1, restored)
+            self.assertIs(restored._value, values[1])
+            evicted = Broadcast(path=bcasts[0]._path)
+            cache.restore(0, evicted)
+            self.assertFalse(hasattr(evicted, "_value"))
+            self.assertEqual(evicted.value, values[0])
+
     def test_broadcast_in_udfs_with_encryption(self):
         conf = SparkConf()
         conf.set("spark.io.encryption.enabled", "true")
@@ -36,14 +36,16 @@ class DaemonTests(unittest.TestCase):
         sock.close()
         return True
 
-    def do_termination_test(self, terminator):
+    def do_termination_test(self, terminator, env=None):
         from subprocess import Popen, PIPE
         from errno import ECONNREFUSED
 
         # start daemon
         daemon_path = os.path.join(os.path.dirname(__file__), "..", "daemon.py")
         python_exec = sys.executable or os.environ.get("PYSPARK_PYTHON")
-        daemon = Popen([python_exec, daemon_path], stdin=PIPE, stdout=PIPE)
+        daemon = Popen(
+            [python_exec, daemon_path], stdin=PIPE, stdout=PIPE, env=dict(os.environ, **(env or {}))
+        )
 
         # read the port number
         port = read_int(daemon.stdout)
@@ -66,6 +68,11 @@ class DaemonTests(unittest.TestCase):
         else:
             self.fail("Expected EnvironmentError to be raised")
 
+        # the daemon and all its workers are in the process group of the daemon
+        daemon.wait()
+        with self.assertRaises(ProcessLookupError):
+            os.killpg(daemon.pid, 0)
+
     def test_termination_stdin(self):
         """Ensure that daemon and workers terminate when stdin is closed."""
         self.do_termination_test(lambda daemon: daemon.stdin.close())
@@ -76,6 +83,14 @@ class DaemonTests(unittest.TestCase):
 
         self.do_termination_test(lambda daemon: os.kill(daemon.pid, SIGTERM))
 
+    def test_termination_with_worker_pool(self):
+        """Ensure that the pre-forked workers terminate with the daemon."""
+        from signal import SIGTERM
+
+        env = {"PYSPARK_DAEMON_POOL_SIZE": "2", "PYSPARK_DAEMON_PRELOAD": "json, no_such_module"}
+        self.do_termination_test(lambda daemon: daemon.stdin.close(), env)
+        self.do_termination_test(lambda daemon: os.kill(daemon.pid, SIGTERM), env)
+
 
 if __name__ == "__main__":
     from pyspark.tests.test_daemon import *  # noqa: F401
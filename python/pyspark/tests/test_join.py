@@ -14,6 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import random
+import unittest
+from unittest import mock
+
+from pyspark import join
+from pyspark.join import _hash_join
+from pyspark.shuffle import ExternalList
 from pyspark.testing.utils import ReusedPySparkTestCase
 
 
@@ -56,8 +63,55 @@ class JoinTests(ReusedPySparkTestCase):
         self.assertEqual(3, len(tracker.getJobInfo(jobId).stageIds))
 
 
+class HashJoinTests(unittest.TestCase):
+    def expected(self, vs, ws, keep_v, keep_w):
+        result = []
+        for k in set(k for k, _ in vs) | set(k for k, _ in ws):
+            vbuf = [v for key, v in vs if key == k] or ([None] if keep_w else [])
+            wbuf = [w for key, w in ws if key == k] or ([None] if keep_v else [])
+            result.extend((k, (v, w)) for v in vbuf for w in wbuf)
+        return sorted(result, key=repr)
+
+    def test_hash_join(self):
+        vs = [(random.randint(0, 50), i) for i in range(300)]
+        ws = [(random.randint(25, 75), -i) for i in range(100)]
+        items = [(k, (1, v)) for k, v in vs] + [(k, (2, w)) for k, w in ws]
+        random.shuffle(items)
+        for keep_v in [False, True]:
+            for keep_w in [False, True]:
+                expected = self.expected(vs, ws, keep_v, keep_w)
+                # in memory, and streaming the side 1 or the side 2 from the first batch until
+                # the other side goes above the limit too
+                for data, limit in [
+                    (items, 512),
+                    (sorted(items, key=lambda kv: kv[1][0]), 0),
+                    (sorted(items, key=lambda kv: -kv[1][0]), 0),
+                ]:
+                    result = _hash_join(iter(data), keep_v, keep_w, limit, batch=10)
+                    self.assertEqual(sorted(result, key=repr), expected)
+
+    def test_hash_join_with_both_sides_spilled(self):
+        vs = [(i % 500, i) for i in range(2000)]
+        ws = [(i % 700, -i) for i in range(2000)]
+        items = [(k, (1, v)) for k, v in vs] + [(k, (2, w)) for k, w in ws]
+        random.shuffle(items)
+        for keep_v, keep_w in [(False, False), (True, True)]:
+            expected = self.expected(vs, ws, keep_v, keep_w)
+            # the buckets fit in memory, or are partitioned again
+            for limit, scales in [(0.05, {1}), (0, {1, 59})]:
+                with mock.patch("pyspark.join._grace_join", wraps=join._grace_join) as grace:
+                    result = _hash_join(iter(items), keep_v, keep_w, limit, batch=10)
+                    self.assertEqual(sorted(result, key=repr), expected)
+                self.assertEqual({call.args[-1] for call in grace.call_args_list}, scales)
+
+    def test_hash_join_with_skewed_key(self):
+        n = ExternalList.LIMIT * 2
+        items = [(0, (1, i)) for i in range(n)] + [(0, (2, "a")), (1, (2, "b"))]
+        result = list(_hash_join(iter(items), False, True, 512))
+        self.assertEqual(sorted(result), [(0, (i, "a")) for i in range(n)] + [(1, (None, "b"))])
+
+
 if __name__ == "__main__":
-    import unittest
     from pyspark.tests.test_join import *  # noqa: F401
 
     try:
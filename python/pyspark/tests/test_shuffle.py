@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import operator
 import random
 import unittest
+from unittest import mock
 from tempfile import TemporaryDirectory
 import os
 
@@ -24,12 +26,20 @@ from py4j.protocol import Py4JJavaError
 from pyspark import shuffle, CPickleSerializer, SparkConf, SparkContext
 from pyspark.shuffle import (
     Aggregator,
+    ExternalArrayMerger,
+    ExternalArraySorter,
     ExternalMerger,
     ExternalSorter,
     SimpleAggregator,
     Merger,
     ExternalGroupBy,
 )
+from pyspark.testing.utils import (
+    have_numpy,
+    have_pyarrow,
+    numpy_requirement_message,
+    pyarrow_requirement_message,
+)
 
 
 class MergerTests(unittest.TestCase):
@@ -53,16 +63,28 @@ class MergerTests(unittest.TestCase):
         self.assertEqual(sum(sum(v) for k, v in m.items()), sum(range(self.N)))
 
     def test_medium_dataset(self):
-        m = ExternalMerger(self.agg, 20)
+        m = ExternalMerger(self.agg, 0.3)
         m.mergeValues(self.data)
         self.assertTrue(m.spills >= 1)
         self.assertEqual(sum(sum(v) for k, v in m.items()), sum(range(self.N)))
 
-        m = ExternalMerger(self.agg, 10)
+        m = ExternalMerger(self.agg, 0.3)
         m.mergeCombiners(map(lambda x_y2: (x_y2[0], [x_y2[1]]), self.data * 3))
         self.assertTrue(m.spills >= 1)
         self.assertEqual(sum(sum(v) for k, v in m.items()), sum(range(self.N)) * 3)
 
+    def test_spill_by_estimated_size(self):
+        spills, last = [], shuffle.MemoryBytesSpilled
+        for _ in range(3):
+            m = ExternalMerger(self.agg, 0.3)
+            m.mergeValues(self.data)
+            spills.append(m.spills)
+            self.assertEqual(sum(sum(v) for k, v in m.items()), sum(range(self.N)))
+        # the spills only depend on the estimated size of the merged items
+        self.assertGreaterEqual(spills[0], 1)
+        self.assertEqual(spills, spills[:1] * 3)
+        self.assertGreater(shuffle.MemoryBytesSpilled, last + 0.3 * (1 << 20))
+
     def test_shuffle_data_with_multiple_locations(self):
         # SPARK-39179: Test shuffle of data with multiple location also check
         # shuffle locations get randomized
@@ -73,7 +95,7 @@ class MergerTests(unittest.TestCase):
             try:
                 index_of_tempdir1 = [False, False]
                 for idx in range(10):
-                    m = ExternalMerger(self.agg, 20)
+                    m = ExternalMerger(self.agg, 0.3)
                     if m.localdirs[0].startswith(d1):
                         index_of_tempdir1[0] = True
                     elif m.localdirs[1].startswith(d1):
@@ -93,11 +115,70 @@ class MergerTests(unittest.TestCase):
     def test_simple_aggregator_with_medium_dataset(self):
         # SPARK-39179: Test Simple aggregator
         agg = SimpleAggregator(lambda x, y: x + y)
-        m = ExternalMerger(agg, 20)
+        m = ExternalMerger(agg, 0.1)
         m.mergeValues(self.data)
         self.assertTrue(m.spills >= 1)
         self.assertEqual(sum(v for k, v in m.items()), sum(range(self.N)))
 
+    @unittest.skipIf(not have_numpy, numpy_requirement_message)
+    def test_array_merger(self):
+        data = [(random.randint(-100, 100), random.randint(-100, 100)) for _ in range(self.N)]
+        for func in [operator.add, min, max]:
+            for values in [data, [(k, float(v)) for k, v in data]]:
+                expected = {}
+                for k, v in values:
+                    expected[k] = func(expected[k], v) if k in expected else v
+
+                m = ExternalArrayMerger(SimpleAggregator(func), 20)
+                m.mergeValues(values)
+                self.assertEqual(m.spills, 0)
+                self.assertEqual(dict(m.items()), expected)
+
+                m = ExternalArrayMerger(SimpleAggregator(func), 20)
+                m.BATCH_SIZE = 100
+                m.memory_limit = 0.001
+                m.mergeCombiners(values)
+                self.assertTrue(m.spills >= 1)
+                self.assertEqual(dict(m.items()), expected)
+
+    @unittest.skipIf(not have_numpy, numpy_requirement_message)
+    def test_array_merger_recursive_merge(self):
+        class CustomizedMerger(ExternalArrayMerger):
+            recursions = 0
+
+            def _recursive_merged_items(self, index):
+                CustomizedMerger.recursions += 1
+                return ExternalArrayMerger._recursive_merged_items(self, index)
+
+        # The spilled runs of a partition do not fit in memory once merged together.
+        m = CustomizedMerger(SimpleAggregator(operator.add), 0.01, partitions=4)
+        m.BATCH_SIZE = 1000
+        m.mergeValues(self.data * 2)
+        self.assertTrue(m.spills >= 3)
+        self.assertEqual(dict(m.items()), {k: 2 * v for k, v in self.data})
+        self.assertGreater(CustomizedMerger.recursions, 0)
+
+    @unittest.skipIf(not have_numpy, numpy_requirement_message)
+    def test_array_merger_fallback(self):
+        agg = SimpleAggregator(operator.add)
+        self.assertEqual(agg.reduction, "add")
+        self.assertIsNone(SimpleAggregator(lambda x, y: x + y).reduction)
+
+        # Values that are not all ints or all floats, or could overflow.
+        for extra in [[(1, 0.5)], [("a", 1)], [(1, 1 << 62), (1, 1 << 62)], [(1, 1 << 70)]]:
+            m = ExternalArrayMerger(agg, 20)
+            m.BATCH_SIZE = 100
+            m.memory_limit = 0.01
+            m.mergeValues(self.data)
+            self.assertTrue(m.spills >= 1)
+            m.mergeValues(extra + self.data)
+            self.assertTrue(m._fallback)
+
+            expected = {}
+            for k, v in self.data + extra + self.data:
+                expected[k] = expected[k] + v if k in expected else v
+            self.assertEqual(dict(m.items()), expected)
+
     def test_merger_not_implemented_error(self):
         # SPARK-39179: Test Merger for error scenarios
         agg = SimpleAggregator(lambda x, y: x + y)
@@ -115,7 +196,7 @@ class MergerTests(unittest.TestCase):
             dummy_merger.items()
 
     def test_huge_dataset(self):
-        m = ExternalMerger(self.agg, 5, partitions=3)
+        m = ExternalMerger(self.agg, 1, partitions=3)
         m.mergeCombiners(map(lambda k_v: (k_v[0], [str(k_v[1])]), self.data * 10))
         self.assertTrue(m.spills >= 1)
         self.assertEqual(sum(len(v) for k, v in m.items()), self.N * 10)
@@ -245,6 +326,58 @@ class SorterTests(unittest.TestCase):
         )
         self.assertGreater(shuffle.DiskBytesSpilled, last)
 
+    @unittest.skipIf(not have_pyarrow, pyarrow_requirement_message)
+    def test_array_sorter(self):
+        class CustomizedSorter(ExternalArraySorter):
+            BATCH_SIZE = 100
+
+            def _next_limit(self):
+                return self.memory_limit
+
+        # the equal keys keep the order of the elements
+        lst = [(random.randint(0, 100), i) for i in range(1024)]
+        keys = [
+            operator.itemgetter(0),
+            lambda kv: float(kv[0]),
+            lambda kv: str(kv[0]),
+            lambda kv: -kv[0],
+        ]
+        for sorter in [ExternalArraySorter(1024), CustomizedSorter(1)]:
+            for key in keys:
+                last = shuffle.DiskBytesSpilled
+                for reverse in [False, True]:
+                    self.assertEqual(
+                        sorted(lst, key=key, reverse=reverse),
+                        list(sorter.sorted(lst, key=key, reverse=reverse)),
+                    )
+                if isinstance(sorter, CustomizedSorter):
+                    self.assertGreater(shuffle.DiskBytesSpilled, last)
+            self.assertEqual(sorted(lst), list(sorter.sorted(lst)))
+
+        # the elements are spilled by the serializer, which compresses them
+        sorter = CustomizedSorter(1)
+        dump_stream = sorter.serializer.dump_stream
+        with mock.patch.object(sorter.serializer, "dump_stream", wraps=dump_stream) as dump:
+            self.assertEqual(sorted(lst), list(sorter.sorted(lst)))
+        self.assertGreater(dump.call_count, 0)
+
+    @unittest.skipIf(not have_pyarrow, pyarrow_requirement_message)
+    def test_array_sorter_fallback(self):
+        class CustomizedSorter(ExternalArraySorter):
+            BATCH_SIZE = 100
+
+            def _next_limit(self):
+                return self.memory_limit
+
+        lst = [(random.randint(0, 100), i) for i in range(1024)]
+        for i, k in [(0, 1.5), (500, 1.5), (700, 1 << 64), (1000, -0.5), (300, True)]:
+            data = lst[:i] + [(k, -1)] + lst[i:]
+            for reverse in [False, True]:
+                self.assertEqual(
+                    sorted(data, key=operator.itemgetter(0), reverse=reverse),
+                    list(CustomizedSorter(1).sorted(data, operator.itemgetter(0), reverse)),
+                )
+
     def test_external_sort_in_rdd(self):
         conf = SparkConf().set("spark.python.worker.memory", "1m")
         sc = SparkContext(conf=conf)
@@ -15,6 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import io
 import os
 import signal
 import sys
@@ -224,6 +225,133 @@ class WorkerMemoryTest(unittest.TestCase):
         self.sc.stop()
 
 
+class PhaseTimesTest(unittest.TestCase):
+    def test_timed(self):
+        from pyspark.worker import PhaseTimes
+
+        times = PhaseTimes()
+        self.assertEqual(list(times), list(PhaseTimes.PHASES))
+
+        def slow():
+            for i in range(3):
+                time.sleep(0.01)
+                yield i
+
+        self.assertEqual(list(times.timed(slow(), "user_code")), [0, 1, 2])
+        self.assertGreaterEqual(times["user_code"], 30 * 1000 * 1000)
+        self.assertEqual(times["input_deserialization"], 0)
+
+    def test_row_eval_types(self):
+        from pyspark.util import PythonEvalType
+        from pyspark.worker import ROW_EVAL_TYPES
+
+        # row at a time functions are never timed
+        self.assertIn(PythonEvalType.NON_UDF, ROW_EVAL_TYPES)
+        self.assertIn(PythonEvalType.SQL_BATCHED_UDF, ROW_EVAL_TYPES)
+        self.assertNotIn(PythonEvalType.SQL_SCALAR_PANDAS_UDF, ROW_EVAL_TYPES)
+        self.assertNotIn(PythonEvalType.SQL_ARROW_BATCHED_UDF, ROW_EVAL_TYPES)
+
+    def test_timed_writer(self):
+        from pyspark.worker import PhaseTimes, TimedWriter
+        from pyspark.serializers import write_int
+
+        times = PhaseTimes()
+        stream = io.BytesIO()
+        writer = TimedWriter(stream, times)
+        write_int(1, writer)
+        writer.flush()
+        self.assertEqual(writer.getvalue(), b"\x00\x00\x00\x01")
+        self.assertGreater(times["output_write"], 0)
+
+
+class CommandCacheTest(unittest.TestCase):
+    def setUp(self):
+        from pyspark import worker_util
+
+        self._cache = worker_util._commandCache
+
+    def tearDown(self):
+        from pyspark import worker_util
+
+        worker_util._commandCache = self._cache
+
+    def _read(self, data):
+        from pyspark.serializers import CloudPickleSerializer, write_with_length
+        from pyspark.worker_util import read_command
+
+        stream = io.BytesIO()
+        write_with_length(data, stream)
+        stream.seek(0)
+        return read_command(CloudPickleSerializer(), stream)
+
+    def test_command_cache(self):
+        from pyspark import worker_util
+        from pyspark.serializers import CloudPickleSerializer
+
+        ser = CloudPickleSerializer()
+        commands = [ser.dumps((lambda x: x + i, i)) for i in range(3)]
+        worker_util._commandCache = worker_util._CommandCache(2 * len(commands[0]))
+
+        first = self._read(commands[0])
+        self.assertIs(self._read(commands[0]), first)
+        self.assertEqual(first[0](1), 1)
+        second = self._read(commands[1])
+        # The least recently used command is evicted.
+        self._read(commands[0])
+        self._read(commands[2])
+        self.assertIs(self._read(commands[0]), first)
+        self.assertIsNot(self._read(commands[1]), second)
+
+    def test_command_cache_with_accumulator(self):
+        from pyspark import worker_util
+        from pyspark.accumulators import Accumulator, INT_ACCUMULATOR_PARAM, _accumulatorRegistry
+        from pyspark.serializers import CloudPickleSerializer
+
+        acc = Accumulator(0, 0, INT_ACCUMULATOR_PARAM)
+        command = CloudPickleSerializer().dumps((lambda x: acc.add(x), None))
+        worker_util._commandCache = worker_util._CommandCache(1 << 20)
+        try:
+            self.assertIsNot(self._read(command), self._read(command))
+        finally:
+            _accumulatorRegistry.clear()
+
+    def test_command_cache_with_registered_accumulator(self):
+        from pyspark import worker_util
+        from pyspark.accumulators import Accumulator, INT_ACCUMULATOR_PARAM, _accumulatorRegistry
+        from pyspark.serializers import CloudPickleSerializer
+
+        # An accumulator registered by an earlier command of the task is reused when the
+        # command is unpickled, without registering it again.
+        acc = Accumulator(0, 0, INT_ACCUMULATOR_PARAM)
+        ser = CloudPickleSerializer()
+        worker_util._commandCache = worker_util._CommandCache(1 << 20)
+        try:
+            self._read(ser.dumps((lambda x: acc.add(x), None)))
+            command = ser.dumps((lambda x: acc.add(-x), None))
+            self.assertIsNot(self._read(command), self._read(command))
+        finally:
+            _accumulatorRegistry.clear()
+
+    def test_command_cache_null(self):
+        from pyspark import worker_util
+        from pyspark.serializers import CloudPickleSerializer, SpecialLengths, write_int
+        from pyspark.worker_util import read_command
+
+        worker_util._commandCache = worker_util._CommandCache(1 << 20)
+        stream = io.BytesIO()
+        write_int(SpecialLengths.NULL, stream)
+        stream.seek(0)
+        self.assertIsNone(read_command(CloudPickleSerializer(), stream))
+
+    def test_command_cache_disabled(self):
+        from pyspark import worker_util
+        from pyspark.serializers import CloudPickleSerializer
+
+        command = CloudPickleSerializer().dumps((len, None))
+        worker_util._commandCache = worker_util._CommandCache(0)
+        self.assertIsNot(self._read(command), self._read(command))
+
+
 class WorkerSegfaultTest(ReusedPySparkTestCase):
     @classmethod
     def conf(cls):
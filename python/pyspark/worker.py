@@ -100,11 +100,81 @@ except Exception:
     has_memory_profiler = False
 
 
-def report_times(outfile, boot, init, finish):
+def report_times(outfile, boot, init, finish, phases):
     write_int(SpecialLengths.TIMING_DATA, outfile)
     write_long(int(1000 * boot), outfile)
     write_long(int(1000 * init), outfile)
     write_long(int(1000 * finish), outfile)
+    for phase in phases.values():
+        write_long(phase, outfile)
+
+
+class PhaseTimes(dict):
+    """
+    Nanoseconds a worker spent in each phase of a task, sent to the JVM after the
+    boot, init and finish times in this order. The phases of the input and the output
+    are only timed when spark.python.worker.phaseTimes.enabled is set, and are 0 otherwise.
+    """
+
+    PHASES = (
+        "setup",
+        "function_deserialization",
+        "input_deserialization",
+        "user_code",
+        "output_serialization",
+        "output_write",
+    )
+
+    def __init__(self):
+        super().__init__((phase, 0) for phase in self.PHASES)
+
+    def timed(self, iterator, phase):
+        """
+        Yield the items of `iterator`, adding the time spent to produce them to `phase`.
+        """
+        it = iter(iterator)
+        clock = time.perf_counter_ns
+        while True:
+            start = clock()
+            try:
+                item = next(it)
+            except StopIteration:
+                self[phase] += clock() - start
+                return
+            self[phase] += clock() - start
+            yield item
+
+
+# The eval types whose functions run row by row, where timing every row would cost more than
+# the phases it measures.
+ROW_EVAL_TYPES = frozenset(
+    (
+        PythonEvalType.NON_UDF,
+        PythonEvalType.SQL_BATCHED_UDF,
+        PythonEvalType.SQL_TABLE_UDF,
+    )
+)
+
+
+class TimedWriter:
+    """
+    Wraps the output stream of a worker to add the time spent in `write` to
+    `output_write` of the given :class:`PhaseTimes`.
+    """
+
+    def __init__(self, stream, times):
+        self._stream = stream
+        self._times = times
+
+    def write(self, b):
+        start = time.perf_counter_ns()
+        try:
+            return self._stream.write(b)
+        finally:
+            self._times["output_write"] += time.perf_counter_ns() - start
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
 
 
 def chain(f, g):
@@ -892,13 +962,20 @@ def wrap_grouped_agg_arrow_udf(f, args_offsets, kwargs_offsets, return_type, run
 
 
 def wrap_window_agg_pandas_udf(
-    f, args_offsets, kwargs_offsets, return_type, runner_conf, udf_index
+    f,
+    args_offsets,
+    kwargs_offsets,
+    return_type,
+    runner_conf,
+    udf_index,
+    aggregator=None,
+    profile=None,
 ):
     window_bound_types_str = runner_conf.get("window_bound_types")
     window_bound_type = [t.strip().lower() for t in window_bound_types_str.split(",")][udf_index]
     if window_bound_type == "bounded":
         return wrap_bounded_window_agg_pandas_udf(
-            f, args_offsets, kwargs_offsets, return_type, runner_conf
+            f, args_offsets, kwargs_offsets, return_type, runner_conf, aggregator, profile
         )
     elif window_bound_type == "unbounded":
         return wrap_unbounded_window_agg_pandas_udf(
@@ -913,12 +990,21 @@ def wrap_window_agg_pandas_udf(
         )
 
 
-def wrap_window_agg_arrow_udf(f, args_offsets, kwargs_offsets, return_type, runner_conf, udf_index):
+def wrap_window_agg_arrow_udf(
+    f,
+    args_offsets,
+    kwargs_offsets,
+    return_type,
+    runner_conf,
+    udf_index,
+    aggregator=None,
+    profile=None,
+):
     window_bound_types_str = runner_conf.get("window_bound_types")
     window_bound_type = [t.strip().lower() for t in window_bound_types_str.split(",")][udf_index]
     if window_bound_type == "bounded":
         return wrap_bounded_window_agg_arrow_udf(
-            f, args_offsets, kwargs_offsets, return_type, runner_conf
+            f, args_offsets, kwargs_offsets, return_type, runner_conf, aggregator, profile
         )
     elif window_bound_type == "unbounded":
         return wrap_unbounded_window_agg_arrow_udf(
@@ -977,7 +1063,64 @@ def wrap_unbounded_window_agg_arrow_udf(f, args_offsets, kwargs_offsets, return_
     )
 
 
-def wrap_bounded_window_agg_pandas_udf(f, args_offsets, kwargs_offsets, return_type, runner_conf):
+def _incremental_window_agg(aggregator, args_offsets, kwargs_offsets, profile=None):
+    """
+    Returns a function that evaluates a bounded window aggregate by sliding an instance of
+    `aggregator` over the frames instead of calling the UDF on a slice per output row.
+
+    `aggregator` is the class attached to the UDF as its `window_aggregator` attribute. It is
+    instantiated with no arguments and has to provide `add(*values)` and `remove(*values)`,
+    which receive the column values of a single row entering or leaving the frame in the
+    same order as the UDF arguments, and `evaluate()`, which returns the aggregate of the
+    current frame. As long as the frame boundaries do not move backwards, which holds for
+    row and range frames over sorted input, every row is added and removed at most once,
+    so a window partition is evaluated in amortized linear time.
+
+    `profile` wraps the evaluation of each batch with the UDF profiler, which reports the
+    `add`, `remove` and `evaluate` methods of `aggregator`.
+    """
+
+    def new_aggregator():
+        agg = aggregator()
+        add, _ = wrap_kwargs_support(agg.add, args_offsets, kwargs_offsets)
+        remove, _ = wrap_kwargs_support(agg.remove, args_offsets, kwargs_offsets)
+        return agg, add, remove
+
+    def evaluate(begin_array, end_array, columns):
+        rows = list(zip(*columns))
+        result = []
+        agg, add, remove = new_aggregator()
+        begin, end = 0, 0
+        for i in range(len(begin_array)):
+            new_begin, new_end = begin_array[i], end_array[i]
+            if new_begin < begin or new_end < end or new_begin >= end:
+                # The frame moved backwards or does not overlap with the previous one,
+                # start over from an empty frame.
+                agg, add, remove = new_aggregator()
+                begin, end = new_begin, new_begin
+            for j in range(begin, new_begin):
+                remove(*rows[j])
+            for j in range(end, new_end):
+                add(*rows[j])
+            begin, end = new_begin, new_end
+            result.append(agg.evaluate())
+        return result
+
+    if profile is None:
+        return evaluate
+    return profile(
+        evaluate,
+        [
+            method
+            for method in (aggregator.add, aggregator.remove, aggregator.evaluate)
+            if hasattr(method, "__code__")
+        ],
+    )
+
+
+def wrap_bounded_window_agg_pandas_udf(
+    f, args_offsets, kwargs_offsets, return_type, runner_conf, aggregator=None, profile=None
+):
     # args_offsets should have at least 2 for begin_index, end_index.
     assert len(args_offsets) >= 2, len(args_offsets)
     func, args_kwargs_offsets = wrap_kwargs_support(f, args_offsets[2:], kwargs_offsets)
@@ -986,6 +1129,12 @@ def wrap_bounded_window_agg_pandas_udf(f, args_offsets, kwargs_offsets, return_t
         return_type, prefers_large_types=use_large_var_types(runner_conf)
     )
 
+    incremental = (
+        _incremental_window_agg(aggregator, args_offsets[2:], kwargs_offsets, profile)
+        if aggregator is not None
+        else None
+    )
+
     def wrapped(begin_index, end_index, *series):
         import pandas as pd
 
@@ -997,6 +1146,13 @@ def wrap_bounded_window_agg_pandas_udf(f, args_offsets, kwargs_offsets, return_t
         begin_array = begin_index.values
         end_array = end_index.values
 
+        if incremental is not None and all(isinstance(s, pd.Series) for s in series):
+            return pd.Series(
+                incremental(
+                    begin_array.tolist(), end_array.tolist(), [s.to_numpy() for s in series]
+                )
+            )
+
         for i in range(len(begin_array)):
             # Note: Create a slice from a series for each window is
             #       actually pretty expensive. However, there
@@ -1021,7 +1177,9 @@ def wrap_bounded_window_agg_pandas_udf(f, args_offsets, kwargs_offsets, return_t
     )
 
 
-def wrap_bounded_window_agg_arrow_udf(f, args_offsets, kwargs_offsets, return_type, runner_conf):
+def wrap_bounded_window_agg_arrow_udf(
+    f, args_offsets, kwargs_offsets, return_type, runner_conf, aggregator=None, profile=None
+):
     # args_offsets should have at least 2 for begin_index, end_index.
     assert len(args_offsets) >= 2, len(args_offsets)
     func, args_kwargs_offsets = wrap_kwargs_support(f, args_offsets[2:], kwargs_offsets)
@@ -1030,12 +1188,25 @@ def wrap_bounded_window_agg_arrow_udf(f, args_offsets, kwargs_offsets, return_ty
         return_type, prefers_large_types=use_large_var_types(runner_conf)
     )
 
+    incremental = (
+        _incremental_window_agg(aggregator, args_offsets[2:], kwargs_offsets, profile)
+        if aggregator is not None
+        else None
+    )
+
     def wrapped(begin_index, end_index, *series):
         import pyarrow as pa
 
         assert isinstance(begin_index, pa.Int32Array), type(begin_index)
         assert isinstance(end_index, pa.Int32Array), type(end_index)
 
+        if incremental is not None:
+            return pa.array(
+                incremental(
+                    begin_index.to_pylist(), end_index.to_pylist(), [s.to_pylist() for s in series]
+                )
+            )
+
         result = []
         for i in range(len(begin_index)):
             offset = begin_index[i].as_py()
@@ -1104,7 +1275,7 @@ def wrap_perf_profiler(f, result_id):
     return profiling_func
 
 
-def wrap_memory_profiler(f, result_id):
+def wrap_memory_profiler(f, result_id, traced_functions=None):
     from pyspark.sql.profiler import ProfileResultsParam
     from pyspark.profiler import UDFLineProfilerV2
 
@@ -1115,7 +1286,13 @@ def wrap_memory_profiler(f, result_id):
     def profiling_func(*args, **kwargs):
         profiler = UDFLineProfilerV2()
 
-        wrapped = profiler(f)
+        if traced_functions is None:
+            wrapped = profiler(f)
+        else:
+            # Report the lines of the given functions that `f` calls instead of `f` itself.
+            for func in traced_functions:
+                profiler.add_function(func)
+            wrapped = profiler.wrap_function(f)
         ret = wrapped(*args, **kwargs)
         codemap_dict = {
             filename: list(line_iterator) for filename, line_iterator in profiler.code_map.items()
@@ -1163,22 +1340,19 @@ def read_single_udf(pickleSer, infile, eval_type, runner_conf, udf_index, profil
         else:
             chained_func = chain(chained_func, f)
 
-    if profiler == "perf":
+    if profiler in ("perf", "memory"):
         result_id = read_long(infile)
 
-        if _supports_profiler(eval_type):
-            profiling_func = wrap_perf_profiler(chained_func, result_id)
+    def profile(f, traced_functions=None):
+        # The memory profiler reports the lines of `traced_functions`, `f` if not given.
+        if profiler == "perf" and _supports_profiler(eval_type):
+            return wrap_perf_profiler(f, result_id)
+        elif profiler == "memory" and _supports_profiler(eval_type) and has_memory_profiler:
+            return wrap_memory_profiler(f, result_id, traced_functions)
         else:
-            profiling_func = chained_func
+            return f
 
-    elif profiler == "memory":
-        result_id = read_long(infile)
-        if _supports_profiler(eval_type) and has_memory_profiler:
-            profiling_func = wrap_memory_profiler(chained_func, result_id)
-        else:
-            profiling_func = chained_func
-    else:
-        profiling_func = chained_func
+    profiling_func = profile(chained_func)
 
     if eval_type in (
         PythonEvalType.SQL_SCALAR_PANDAS_ITER_UDF,
@@ -1243,11 +1417,25 @@ def read_single_udf(pickleSer, infile, eval_type, runner_conf, udf_index, profil
         )
     elif eval_type == PythonEvalType.SQL_WINDOW_AGG_PANDAS_UDF:
         return wrap_window_agg_pandas_udf(
-            func, args_offsets, kwargs_offsets, return_type, runner_conf, udf_index
+            func,
+            args_offsets,
+            kwargs_offsets,
+            return_type,
+            runner_conf,
+            udf_index,
+            getattr(chained_func, "window_aggregator", None),
+            profile,
         )
     elif eval_type == PythonEvalType.SQL_WINDOW_AGG_ARROW_UDF:
         return wrap_window_agg_arrow_udf(
-            func, args_offsets, kwargs_offsets, return_type, runner_conf, udf_index
+            func,
+            args_offsets,
+            kwargs_offsets,
+            return_type,
+            runner_conf,
+            udf_index,
+            getattr(chained_func, "window_aggregator", None),
+            profile,
         )
     elif eval_type == PythonEvalType.SQL_BATCHED_UDF:
         return wrap_udf(func, args_offsets, kwargs_offsets, return_type)
@@ -1273,6 +1461,20 @@ def use_large_var_types(runner_conf):
     return runner_conf.get("spark.sql.execution.arrow.useLargeVarTypes", "false").lower() == "true"
 
 
+def max_pending_state_requests(runner_conf):
+    return int(
+        runner_conf.get(
+            "spark.sql.execution.python.transformWithState.maxPendingStateRequests", "0"
+        )
+    )
+
+
+def state_cache_max_bytes(runner_conf):
+    return int(
+        runner_conf.get("spark.sql.execution.python.transformWithState.stateCacheMaxBytes", "0")
+    )
+
+
 def use_legacy_pandas_udf_conversion(runner_conf):
     return (
         runner_conf.get(
@@ -2334,7 +2536,12 @@ def read_udfs(pickleSer, infile, eval_type):
         )
         parsed_offsets = extract_key_value_indexes(arg_offsets)
         ser.key_offsets = parsed_offsets[0][0]
-        stateful_processor_api_client = StatefulProcessorApiClient(state_server_port, key_schema)
+        stateful_processor_api_client = StatefulProcessorApiClient(
+            state_server_port,
+            key_schema,
+            max_pending_requests=max_pending_state_requests(runner_conf),
+            state_cache_max_bytes=state_cache_max_bytes(runner_conf),
+        )
 
         def mapper(a):
             mode = a[0]
@@ -2371,7 +2578,12 @@ def read_udfs(pickleSer, infile, eval_type):
         parsed_offsets = extract_key_value_indexes(arg_offsets)
         ser.key_offsets = parsed_offsets[0][0]
         ser.init_key_offsets = parsed_offsets[1][0]
-        stateful_processor_api_client = StatefulProcessorApiClient(state_server_port, key_schema)
+        stateful_processor_api_client = StatefulProcessorApiClient(
+            state_server_port,
+            key_schema,
+            max_pending_requests=max_pending_state_requests(runner_conf),
+            state_cache_max_bytes=state_cache_max_bytes(runner_conf),
+        )
 
         def mapper(a):
             mode = a[0]
@@ -2403,7 +2615,12 @@ def read_udfs(pickleSer, infile, eval_type):
         )
         parsed_offsets = extract_key_value_indexes(arg_offsets)
         ser.key_offsets = parsed_offsets[0][0]
-        stateful_processor_api_client = StatefulProcessorApiClient(state_server_port, key_schema)
+        stateful_processor_api_client = StatefulProcessorApiClient(
+            state_server_port,
+            key_schema,
+            max_pending_requests=max_pending_state_requests(runner_conf),
+            state_cache_max_bytes=state_cache_max_bytes(runner_conf),
+        )
 
         def mapper(a):
             mode = a[0]
@@ -2436,7 +2653,12 @@ def read_udfs(pickleSer, infile, eval_type):
         parsed_offsets = extract_key_value_indexes(arg_offsets)
         ser.key_offsets = parsed_offsets[0][0]
         ser.init_key_offsets = parsed_offsets[1][0]
-        stateful_processor_api_client = StatefulProcessorApiClient(state_server_port, key_schema)
+        stateful_processor_api_client = StatefulProcessorApiClient(
+            state_server_port,
+            key_schema,
+            max_pending_requests=max_pending_state_requests(runner_conf),
+            state_cache_max_bytes=state_cache_max_bytes(runner_conf),
+        )
 
         def mapper(a):
             mode = a[0]
@@ -2591,6 +2813,7 @@ def read_udfs(pickleSer, infile, eval_type):
 def main(infile, outfile):
     faulthandler_log_path = os.environ.get("PYTHON_FAULTHANDLER_DIR", None)
     tracebackDumpIntervalSeconds = os.environ.get("PYTHON_TRACEBACK_DUMP_INTERVAL_SECONDS", None)
+    phase_times_enabled = os.environ.get("PYSPARK_WORKER_PHASE_TIMES_ENABLED", "false") == "true"
     try:
         if faulthandler_log_path:
             faulthandler_log_path = os.path.join(faulthandler_log_path, str(os.getpid()))
@@ -2654,34 +2877,60 @@ def main(infile, outfile):
         shuffle.MemoryBytesSpilled = 0
         shuffle.DiskBytesSpilled = 0
         _accumulatorRegistry.clear()
+        phase_times = PhaseTimes()
 
+        start = time.perf_counter_ns()
         setup_spark_files(infile)
         setup_broadcasts(infile)
+        phase_times["setup"] = time.perf_counter_ns() - start
 
         _accumulatorRegistry.clear()
         eval_type = read_int(infile)
+        start = time.perf_counter_ns()
         if eval_type == PythonEvalType.NON_UDF:
             func, profiler, deserializer, serializer = read_command(pickleSer, infile)
         elif eval_type in (PythonEvalType.SQL_TABLE_UDF, PythonEvalType.SQL_ARROW_TABLE_UDF):
             func, profiler, deserializer, serializer = read_udtf(pickleSer, infile, eval_type)
         else:
             func, profiler, deserializer, serializer = read_udfs(pickleSer, infile, eval_type)
+        phase_times["function_deserialization"] = time.perf_counter_ns() - start
 
         init_time = time.time()
 
+        # Only the functions running on batches are timed, see ROW_EVAL_TYPES.
+        timed = phase_times_enabled and eval_type not in ROW_EVAL_TYPES
+
         def process():
             iterator = deserializer.load_stream(infile)
+            if timed:
+                iterator = phase_times.timed(iterator, "input_deserialization")
             out_iter = func(split_index, iterator)
             try:
-                serializer.dump_stream(out_iter, outfile)
+                if timed:
+                    serializer.dump_stream(
+                        phase_times.timed(out_iter, "user_code"), TimedWriter(outfile, phase_times)
+                    )
+                else:
+                    serializer.dump_stream(out_iter, outfile)
             finally:
                 if hasattr(out_iter, "close"):
                     out_iter.close()
 
+        start = time.perf_counter_ns()
         if profiler:
             profiler.profile(process)
         else:
             process()
+        if timed:
+            # The output iterator also pulls the input, and the serializer writes the output.
+            phase_times["user_code"] -= phase_times["input_deserialization"]
+            phase_times["output_serialization"] = (
+                time.perf_counter_ns()
+                - start
+                - phase_times["input_deserialization"]
+                - phase_times["user_code"]
+                - phase_times["output_write"]
+            )
 
         # Reset task context to None. This is a guard code to avoid residual context when worker
         # reuse.
@@ -2696,7 +2945,7 @@ def main(infile, outfile):
             faulthandler_log_file.close()
             os.remove(faulthandler_log_path)
     finish_time = time.time()
-    report_times(outfile, boot_time, init_time, finish_time)
+    report_times(outfile, boot_time, init_time, finish_time, phase_times)
     write_long(shuffle.MemoryBytesSpilled, outfile)
     write_long(shuffle.DiskBytesSpilled, outfile)
 
@@ -18,11 +18,13 @@
 """
 Util functions for workers.
 """
+from collections import OrderedDict
+import hashlib
 import importlib
 from inspect import currentframe, getframeinfo
 import os
 import sys
-from typing import Any, IO
+from typing import Any, IO, Tuple
 import warnings
 
 # 'resource' is a Unix specific module.
@@ -57,16 +59,82 @@ def add_path(path: str) -> None:
         sys.path.insert(1, path)
 
 
-def read_command(serializer: FramedSerializer, file: IO) -> Any:
+class _CommandCache:
+    """
+    Size-bounded LRU cache of the commands unpickled by a reused worker, so that later tasks
+    sending the same function do not unpickle it again. Commands are keyed by the SHA-256 of
+    their pickled bytes, and sized by the size of these bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: "OrderedDict[bytes, Tuple[Any, int]]" = OrderedDict()
+
+    def get(self, key: bytes) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: bytes, command: Any, size: int) -> None:
+        if size > self._max_bytes:
+            return
+        self._entries[key] = (command, size)
+        self._size += size
+        while self._size > self._max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._size -= evicted_size
+
+
+_commandCache = _CommandCache(int(os.environ.get("PYSPARK_COMMAND_CACHE_MAX_BYTES", "0")))
+
+
+class _CommandSerializer(FramedSerializer):
+    """
+    Reads a command framed as by `FramedSerializer`, and unpickles it with the given serializer
+    through the command cache.
+    """
+
+    def __init__(self, serializer: FramedSerializer):
+        self._serializer = serializer
+
+    def loads(self, obj: bytes) -> Any:
+        return _load_command(self._serializer, obj)
+
+
+def _load_command(serializer: FramedSerializer, data: bytes) -> Any:
     if not is_remote_only():
         from pyspark.core.broadcast import Broadcast
 
-    command = serializer._read_with_length(file)
-    if not is_remote_only() and isinstance(command, Broadcast):
-        command = serializer.loads(command.value)
+    if _commandCache._max_bytes <= 0:
+        command = serializer.loads(data)
+        if not is_remote_only() and isinstance(command, Broadcast):
+            command = serializer.loads(command.value)
+        return command
+
+    key = hashlib.sha256(data).digest()
+    command = _commandCache.get(key)
+    if command is None:
+        size = len(data)
+        command = serializer.loads(data)
+        if not is_remote_only() and isinstance(command, Broadcast):
+            value = command.value
+            size = len(value)
+            command = serializer.loads(value)
+        # Accumulators are registered again for every task when they are unpickled, and an
+        # accumulator that is already registered in the task is reused without registering it
+        # again, so the commands are only cached when no accumulator is registered.
+        if len(_accumulatorRegistry) == 0:
+            _commandCache.put(key, command, size)
     return command
 
 
+def read_command(serializer: FramedSerializer, file: IO) -> Any:
+    return _CommandSerializer(serializer)._read_with_length(file)
+
+
 def check_python_version(infile: IO) -> None:
     """
     Check the Python version between the running process and the one used to serialize the command.
@@ -149,7 +217,7 @@ def setup_broadcasts(infile: IO) -> None:
     Set up broadcasted variables.
     """
     if not is_remote_only():
-        from pyspark.core.broadcast import Broadcast, _broadcastRegistry
+        from pyspark.core.broadcast import Broadcast, _broadcastRegistry, _broadcastValueCache
 
     # fetch names and values of broadcast variables
     needs_broadcast_decryption_server = read_bool(infile)
@@ -173,11 +241,15 @@ def setup_broadcasts(infile: IO) -> None:
                 _broadcastRegistry[bid] = Broadcast(sock_file=broadcast_sock_file)
             else:
                 path = utf8_deserializer.loads(infile)
-                _broadcastRegistry[bid] = Broadcast(path=path)
+                # The value is only loaded from the path on first access, unless it was
+                # cached when the broadcast was removed for an earlier task.
+                bcast = Broadcast(path=path)
+                _broadcastValueCache.restore(bid, bcast)
+                _broadcastRegistry[bid] = bcast
 
         else:
             bid = -bid - 1
-            _broadcastRegistry.pop(bid)
+            _broadcastValueCache.put(bid, _broadcastRegistry.pop(bid))
 
     if needs_broadcast_decryption_server:
         broadcast_sock_file.write(b"1")
@@ -3816,6 +3816,31 @@ object SQLConf {
       .intConf
       .createWithDefault(10000)
 
+  val PYTHON_TRANSFORM_WITH_STATE_MAX_PENDING_STATE_REQUESTS =
+    buildConf("spark.sql.execution.python.transformWithState.maxPendingStateRequests")
+      .internal()
+      .doc("When using TransformWithState in PySpark, the maximum number of state requests " +
+        "that only return a status, such as updates, clears and setting the grouping key, " +
+        "that the Python worker sends to the state server without waiting for their " +
+        "responses. The responses are read in a batch before the next request that returns " +
+        "data. 0 disables pipelining and waits for every response.")
+      .version("4.1.0")
+      .intConf
+      .checkValue(_ >= 0, "The value must not be negative.")
+      .createWithDefault(0)
+
+  val PYTHON_TRANSFORM_WITH_STATE_STATE_CACHE_MAX_BYTES =
+    buildConf("spark.sql.execution.python.transformWithState.stateCacheMaxBytes")
+      .internal()
+      .doc("When using TransformWithState in PySpark, the maximum estimated size of the " +
+        "write-back cache of the state values of the current grouping key in the Python " +
+        "worker. Reads of cached values do not reach the state server, and writes are sent " +
+        "when the grouping key changes or the entry is evicted. 0 disables the cache.")
+      .version("4.1.0")
+      .bytesConf(ByteUnit.BYTE)
+      .checkValue(_ >= 0, "The value must not be negative.")
+      .createWithDefault(0)
+
   val ARROW_EXECUTION_USE_LARGE_VAR_TYPES =
     buildConf("spark.sql.execution.arrow.useLargeVarTypes")
       .doc("When using Apache Arrow, use large variable width vectors for string and binary " +
@@ -6988,6 +7013,12 @@ class SQLConf extends Serializable with Logging with SqlApiConf {
   def arrowTransformWithStateInPySparkMaxStateRecordsPerBatch: Int =
     getConf(ARROW_TRANSFORM_WITH_STATE_IN_PYSPARK_MAX_STATE_RECORDS_PER_BATCH)
 
+  def pythonTransformWithStateMaxPendingStateRequests: Int =
+    getConf(PYTHON_TRANSFORM_WITH_STATE_MAX_PENDING_STATE_REQUESTS)
+
+  def pythonTransformWithStateStateCacheMaxBytes: Long =
+    getConf(PYTHON_TRANSFORM_WITH_STATE_STATE_CACHE_MAX_BYTES)
+
   def arrowUseLargeVarTypes: Boolean = getConf(ARROW_EXECUTION_USE_LARGE_VAR_TYPES)
 
   def pandasUDFBufferSize: Int = getConf(PANDAS_UDF_BUFFER_SIZE)
@@ -16,6 +16,8 @@
  */
 package org.apache.spark.sql.connect.service
 
+import java.nio.file.Paths
+
 import scala.jdk.CollectionConverters._
 
 import io.grpc.stub.StreamObserver
@@ -40,6 +42,17 @@ class SparkConnectArtifactStatusesHandler(
     blockManager.getStatus(CacheId(session.sessionUUID, hash)).isDefined
   }
 
+  protected def artifactExists(
+      userId: String,
+      sessionId: String,
+      previouslySeenSessionId: Option[String],
+      name: String): Boolean = {
+    SparkConnectService
+      .getOrCreateIsolatedSession(userId, sessionId, previouslySeenSessionId)
+      .artifactManager
+      .artifactExists(Paths.get(name))
+  }
+
   def handle(request: proto.ArtifactStatusesRequest): Unit = {
     val previousSessionId = request.hasClientObservedServerSideSessionId match {
       case true => Some(request.getClientObservedServerSideSessionId)
@@ -62,7 +75,13 @@ class SparkConnectArtifactStatusesHandler(
           sessionId = request.getSessionId,
           previouslySeenSessionId = previousSessionId,
           hash = name.stripPrefix("cache/"))
-      } else false
+      } else {
+        artifactExists(
+          userId = request.getUserContext.getUserId,
+          sessionId = request.getSessionId,
+          previouslySeenSessionId = previousSessionId,
+          name = name)
+      }
       builder.putStatuses(name, status.setExists(exists).build())
     }
     responseObserver.onNext(builder.build())
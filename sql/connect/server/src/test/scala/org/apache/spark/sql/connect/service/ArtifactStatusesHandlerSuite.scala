@@ -42,7 +42,10 @@ class ArtifactStatusesHandlerSuite extends SharedSparkSession with ResourceHelpe
 
   val sessionId = UUID.randomUUID().toString
 
-  def getStatuses(names: Seq[String], exist: Set[String]): ArtifactStatusesResponse = {
+  def getStatuses(
+      names: Seq[String],
+      exist: Set[String],
+      existingArtifacts: Set[String] = Set.empty): ArtifactStatusesResponse = {
     val promise = Promise[ArtifactStatusesResponse]()
     val handler = new SparkConnectArtifactStatusesHandler(new DummyStreamObserver(promise)) {
       override protected def cacheExists(
@@ -52,6 +55,14 @@ class ArtifactStatusesHandlerSuite extends SharedSparkSession with ResourceHelpe
           hash: String): Boolean = {
         exist.contains(hash)
       }
+
+      override protected def artifactExists(
+          userId: String,
+          sessionId: String,
+          previoslySeenSessionId: Option[String],
+          name: String): Boolean = {
+        existingArtifacts.contains(name)
+      }
     }
     val context = proto.UserContext
       .newBuilder()
@@ -90,4 +101,15 @@ class ArtifactStatusesHandlerSuite extends SharedSparkSession with ResourceHelpe
     assert(response.getStatusesMap.get(id("name2")).getExists)
     assert(response.getStatusesMap.get(id("name3")).getExists)
   }
+
+  test("cached and added artifacts") {
+    val response = getStatuses(
+      names = Seq(id("name1"), "jars/a.jar", "pyfiles/b.py"),
+      exist = Set(sha256Hex("name1")),
+      existingArtifacts = Set("jars/a.jar"))
+    assert(response.getStatusesCount === 3)
+    assert(response.getStatusesMap.get(id("name1")).getExists)
+    assert(response.getStatusesMap.get("jars/a.jar").getExists)
+    assert(!response.getStatusesMap.get("pyfiles/b.py").getExists)
+  }
 }
@@ -27,6 +27,7 @@ import java.util.concurrent.atomic.AtomicBoolean
 
 import scala.jdk.CollectionConverters._
 import scala.reflect.ClassTag
+import scala.util.Try
 
 import org.apache.commons.io.{FilenameUtils, FileUtils}
 import org.apache.hadoop.fs.{LocalFileSystem, Path => FSPath}
@@ -159,6 +160,23 @@ class ArtifactManager(session: SparkSession) extends AutoCloseable with Logging
     // Convert the normalized string back to a Path object
     Paths.get(normalizedPathString).normalize()
   }
+  /**
+   * Returns whether an artifact has been added at `remoteRelativePath`, see [[addArtifact]].
+   * Class files and cached blocks are not tracked by path, so this is false for them.
+   */
+  private[sql] def artifactExists(remoteRelativePath: Path): Boolean = {
+    val normalizedRemoteRelativePath = normalizePath(remoteRelativePath)
+    if (remoteRelativePath.isAbsolute ||
+      normalizedRemoteRelativePath.startsWith(s"cache${File.separator}") ||
+      normalizedRemoteRelativePath.startsWith(s"classes${File.separator}")) {
+      false
+    } else {
+      Try(ArtifactUtils.concatenatePaths(artifactPath, normalizedRemoteRelativePath))
+        .toOption
+        .exists(Files.exists(_))
+    }
+  }
+
   /**
    * Add and prepare a staged artifact (i.e an artifact that has been rebuilt locally from bytes
    * over the wire) for use.
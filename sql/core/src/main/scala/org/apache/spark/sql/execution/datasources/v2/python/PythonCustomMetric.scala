@@ -48,6 +48,8 @@ object PythonCustomMetric {
       .map(_ -> new SQLMetric("size", -1)).toMap ++
       PythonSQLMetrics.pythonTimingMetricsDesc.keys
         .map(_ -> new SQLMetric("timing", -1)).toMap ++
+      PythonSQLMetrics.pythonPhaseTimingMetricsDesc.keys
+        .map(_ -> new SQLMetric("nsTiming", -1)).toMap ++
       PythonSQLMetrics.pythonOtherMetricsDesc.keys
         .map(_ -> new SQLMetric("sum", -1)).toMap
   }
@@ -17,6 +17,7 @@
 
 package org.apache.spark.sql.execution.python
 
+import org.apache.spark.internal.config.Python.PYTHON_WORKER_PHASE_TIMES_ENABLED
 import org.apache.spark.sql.execution.SparkPlan
 import org.apache.spark.sql.execution.metric.{SQLMetric, SQLMetrics}
 
@@ -26,11 +27,23 @@ trait PythonSQLMetrics { self: SparkPlan =>
       k -> SQLMetrics.createSizeMetric(sparkContext, v)
     } ++ PythonSQLMetrics.pythonTimingMetricsDesc.map { case (k, v) =>
       k -> SQLMetrics.createTimingMetric(sparkContext, v)
-    } ++ PythonSQLMetrics.pythonOtherMetricsDesc.map { case (k, v) =>
+    } ++ pythonPhaseTimingMetrics ++ PythonSQLMetrics.pythonOtherMetricsDesc.map { case (k, v) =>
       k -> SQLMetrics.createMetric(sparkContext, v)
     }
   }
 
+  // The phase times are reported by the Python workers only when they are enabled, see
+  // `PythonRunner.pythonPhaseTimeMetrics`.
+  private def pythonPhaseTimingMetrics: Map[String, SQLMetric] = {
+    if (sparkContext.conf.get(PYTHON_WORKER_PHASE_TIMES_ENABLED)) {
+      PythonSQLMetrics.pythonPhaseTimingMetricsDesc.map { case (k, v) =>
+        k -> SQLMetrics.createNanoTimingMetric(sparkContext, v)
+      }
+    } else {
+      Map.empty
+    }
+  }
+
   override lazy val metrics: Map[String, SQLMetric] = pythonMetrics
 }
 
@@ -50,6 +63,17 @@ object PythonSQLMetrics {
     )
   }
 
+  val pythonPhaseTimingMetricsDesc: Map[String, String] = {
+    Map(
+      "pythonSetupTime" -> "time to set up files and broadcasts in Python workers",
+      "pythonFunctionDeserializationTime" -> "time to deserialize functions in Python workers",
+      "pythonInputDeserializationTime" -> "time to deserialize input in Python workers",
+      "pythonUserCodeTime" -> "time to run user code in Python workers",
+      "pythonOutputSerializationTime" -> "time to serialize output in Python workers",
+      "pythonOutputWriteTime" -> "time to write output in Python workers"
+    )
+  }
+
   val pythonOtherMetricsDesc: Map[String, String] = {
     Map("pythonNumRowsReceived" -> "number of output rows")
   }
@@ -106,7 +106,11 @@ case class TransformWithStateInPySparkExec(
     Seq((ChainedPythonFunctions(Seq(pythonFunction)), pythonUDF.resultId.id))
 
   private val sessionLocalTimeZone = conf.sessionLocalTimeZone
-  private val pythonRunnerConf = ArrowPythonRunner.getPythonRunnerConfMap(conf)
+  private val pythonRunnerConf = ArrowPythonRunner.getPythonRunnerConfMap(conf) +
+    (SQLConf.PYTHON_TRANSFORM_WITH_STATE_MAX_PENDING_STATE_REQUESTS.key ->
+      conf.pythonTransformWithStateMaxPendingStateRequests.toString) +
+    (SQLConf.PYTHON_TRANSFORM_WITH_STATE_STATE_CACHE_MAX_BYTES.key ->
+      conf.pythonTransformWithStateStateCacheMaxBytes.toString)
   private[this] val jobArtifactUUID = JobArtifactSet.getCurrentJobArtifactState.map(_.uuid)
   private val (dedupAttributes, argOffsets) = resolveArgOffsets(child.output, groupingAttributes)
 
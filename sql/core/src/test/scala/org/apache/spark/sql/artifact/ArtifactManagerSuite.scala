@@ -175,6 +175,19 @@ class ArtifactManagerSuite extends SharedSparkSession {
     }
   }
 
+  test("Check whether an artifact has been added") {
+    val remotePath = Paths.get("files/abc.txt")
+    assert(!artifactManager.artifactExists(remotePath))
+
+    withTempPath { path =>
+      Files.write(path.toPath, "test".getBytes(StandardCharsets.UTF_8))
+      artifactManager.addArtifact(remotePath, path.toPath, None)
+    }
+    assert(artifactManager.artifactExists(remotePath))
+    assert(!artifactManager.artifactExists(Paths.get("files/../../abc.txt")))
+    assert(!artifactManager.artifactExists(Paths.get("cache/abc")))
+  }
+
   test("SPARK-43790: Forward artifact file to cloud storage path") {
     assume(artifactPath.resolve("smallClassFile.class").toFile.exists)
 
@@ -108,6 +108,18 @@ class PythonUDFSuite extends QueryTest with SharedSparkSession {
     }
   }
 
+  test("Python worker phase times are only registered as metrics when enabled") {
+    assume(shouldTestPythonUDFs)
+    val df = base.select(pythonTestUDF(base("a")))
+    val metrics = df.queryExecution.executedPlan.collectFirst {
+      case p: BatchEvalPythonExec => p.metrics
+    }.get
+    assert(metrics.contains("pythonDataSent"))
+    PythonSQLMetrics.pythonPhaseTimingMetricsDesc.keys.foreach { name =>
+      assert(!metrics.contains(name))
+    }
+  }
+
   test("PythonUDAF pretty name") {
     assume(shouldTestPandasUDFs)
     val udfName = "pandas_udf"